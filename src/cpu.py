@@ -1,8 +1,88 @@
 import logging
+from functools import lru_cache
 from utils import *
 
 logger = logging.getLogger('cpu')
 
+# Signed interpretation of a displacement byte (0x00-0x7f -> 0..127, 0x80-0xff -> -128..-1)
+SIGNED_BYTE = tuple(range(0x80)) + tuple(range(-0x80, 0))
+
+# Masks for bit instructions. RES instructions use inverted masks, so that handlers do not need to invert them
+BIT_MASKS = tuple(1 << bit for bit in range(8))
+RESET_BIT_MASKS = tuple(~(1 << bit) & 0xff for bit in range(8))
+
+# Parity flag value for each byte value (True for an even number of set bits)
+PARITY = tuple(bin(value).count('1') % 2 == 0 for value in range(0x100))
+
+# Zero, Sign, Half Carry, and Overflow flags of 8-bit INC and DEC instructions, indexed by the result value
+INC_FLAGS = tuple((value == 0, (value & 0x80) != 0, (value & 0x0f) == 0x00, value == 0x80) for value in range(0x100))
+DEC_FLAGS = tuple((value == 0, (value & 0x80) != 0, value == 0x0f, value == 0x7f) for value in range(0x100))
+
+# Number of times an instruction address is executed before a block is compiled starting this address,
+# and the maximum number of instructions in a compiled block
+BLOCK_THRESHOLD = 50
+MAX_BLOCK_LENGTH = 32
+
+# Offsets of the instruction prefix sections in the flat dispatch table (see CPU._init_dispatch_table())
+PREFIX_OFFSETS = {
+    0xcb:   0x100,
+    0xdd:   0x200,
+    0xed:   0x300,
+    0xfd:   0x400,
+}
+
+# Operand and operation symbols for instruction logging, indexed by the corresponding opcode bit field
+REGISTER_SYMBOLS = ("B", "C", "D", "E", "H", "L", "(HL)", "A")
+REGISTER_PAIR_SYMBOLS = ("BC", "DE", "HL", "SP")
+CONDITION_SYMBOLS = ("NZ", "Z", "NC", "C", "PO", "PE", "P", "M")
+ALU_OP_SYMBOLS = ("ADD", "ADC", "SUB", "SBC", "AND", "XOR", "OR ", "CP ")
+INDEXED_ALU_OP_SYMBOLS = ("ADD A,", "ADC A,", "SUB", "SBC A,", "AND", "XOR", "OR", "CP")
+
+# IX (0xDD) and IY (0xFD) instructions share the same handlers. The index register is selected by the
+# instruction prefix, which is either a single 0xDD/0xFD byte, or 0xDDCB/0xFDCB for indexed bit instructions
+IX_PREFIXES = (0xdd, 0xddcb)
+
+def bind_operands(handler, *operands):
+    """
+    Bind instruction operands (register indexes, bit masks, etc) decoded from the opcode to a handler, so that
+    the handler does not need to decode them at runtime. Handlers take 1 or 2 operands after the CPU argument.
+
+    The original handler and operands are exposed as attributes of the bound handler, so that compiled blocks
+    can call the handler with the operands directly (see CPU._compile_block())
+    """
+    if len(operands) == 1:
+        operand, = operands
+        def bound_handler(cpu):
+            handler(cpu, operand)
+    else:
+        operand1, operand2 = operands
+        def bound_handler(cpu):
+            handler(cpu, operand1, operand2)
+
+    bound_handler.handler = handler
+    bound_handler.operands = operands
+    return bound_handler
+
+
+def make_register_move_handler(dst, src):
+    """
+    Generate a handler for LD r, r' instruction that moves a byte between 2 registers (not (HL)). The register
+    fields are hardcoded in the generated code, so the handler does not select registers at runtime.
+    """
+    dst_symb = REGISTER_SYMBOLS[dst]
+    src_symb = REGISTER_SYMBOLS[src]
+    lines = [
+        f"def _load_{dst_symb.lower()}_{src_symb.lower()}(cpu):",
+        f"    cpu._{dst_symb.lower()} = cpu._{src_symb.lower()}",
+        f"    cpu._cycles += 4",
+        f"    if cpu._debug_logging:",
+        f"        cpu._log_1b_instruction('LD {dst_symb}, {src_symb}')",
+    ]
+    namespace = {}
+    exec(compile("\n".join(lines), f"<LD {dst_symb}, {src_symb}>", "exec"), namespace)
+    return namespace[f"_load_{dst_symb.lower()}_{src_symb.lower()}"]
+
+
 class CPU:
     """
         Zilog Z80 CPU emulator
@@ -17,10 +97,49 @@ class CPU:
         the Machine object, requesting the memory or I/O data transfer. Devices and memories installed
         in a particular Machine will respond to the request.
     """
+
+    # CPU state is accessed on every instruction, so it is stored in slots rather than the instance dictionary.
+    # Instruction tables are class attributes, shared between all instances (see _init_instruction_tables())
+    __slots__ = (
+        '_machine', '_read_memory_byte', '_read_memory_word', '_write_memory_byte', '_write_memory_word',
+        '_read_io', '_write_io', '_fetch_buffer', '_fetch_start', '_fetch_end',
+
+        # Registers
+        '_pc', '_sp', '_a', '_b', '_c', '_d', '_e', '_h', '_l',
+        '_ax', '_fx', '_bx', '_cx', '_dx', '_ex', '_hx', '_lx',
+        '_ix', '_iy', '_i', '_r',
+
+        # Interrupts
+        '_iff1', '_iff2', '_interrupt_mode', '_interrupt_instructions',
+
+        # ALU Flags
+        '_sign', '_zero', '_half_carry', '_parity_overflow', '_add_subtract', '_carry', '_parity_value',
+
+        # Instructions and execution
+        '_cycles', '_instruction_prefix', '_current_inst', '_displacement',
+        '_decode_cache', '_decoded_bytes',
+        '_blocks', '_block_counts', '_block_breakpoints', '_block_deadline', '_code_generation',
+        '_registers_logging', '_debug_logging',
+    )
+
     def __init__(self, machine):
         self._machine = machine
         machine.set_cpu(self)
 
+        # Machine access methods are bound once, so that handlers do not look them up on every access
+        self._read_memory_byte = machine.read_memory_byte
+        self._read_memory_word = machine.read_memory_word
+        self._write_memory_byte = machine.write_memory_byte
+        self._write_memory_word = machine.write_memory_word
+        self._read_io = machine.read_io
+        self._write_io = machine.write_io
+
+        # Buffer of the memory the instructions are currently fetched from, and its address range (see
+        # _fetch_memory_byte()). Instruction stream bytes are read directly from the buffer
+        self._fetch_buffer = b''
+        self._fetch_start = 0
+        self._fetch_end = -1
+
         self.reset()
 
         # Instructions and execution
@@ -29,15 +148,20 @@ class CPU:
         self._current_inst = 0              # current instruction
         self._displacement = 0              # Parsed displacement for IX- and IY-based operations
 
-        self._init_instruction_table()       # Main instruction set
-        self._init_ed_instruction_table()    # Additional instruction set
-        self._init_cb_instruction_table()    # Bit instructions
-        self._init_dd_instruction_table()    # IX instructions
-        self._init_ddcb_instruction_table()  # IX bit instructions
-        self._init_fd_instruction_table()    # IY instructions
-        self._init_fdcb_instruction_table()  # IY bit instructions
-    
+        # Decoded instructions cache indexed by PC (see _decode_instruction()), and a map of memory bytes covered by
+        # cached instructions. Cached instructions are dropped when memory they were decoded from is modified.
+        self._decode_cache = [None] * 0x10000
+        self._decoded_bytes = bytearray(0x10000)
+
+        # Compiled instruction blocks (see run() and _compile_block())
+        self._blocks = {}
+        self._block_counts = {}
+        self._block_breakpoints = frozenset()
+        self._block_deadline = 0            # Cycles deadline for compiled blocks and repeated block transfers
+        self._code_generation = 0           # Incremented every time a decoded instruction is modified
+
         self._registers_logging = False
+        self._debug_logging = False         # Debug logging enabled flag, updated by run()
 
 
     def reset(self):
@@ -87,6 +211,7 @@ class CPU:
         self._parity_overflow = False           # Bit 2
         self._add_subtract = False              # Bit 1
         self._carry = False                     # Bit 0
+        self._parity_value = 0                  # Value to calculate parity for conditional instructions
 
         # Other
         self._cycles = 0
@@ -126,7 +251,7 @@ class CPU:
                 self._interrupt_instructions = [0xff]  # RST 38
             case 2:
                 vector_addr = self._i << 8 | (instructions[0] & 0xfe)
-                handler_addr = self._machine.read_memory_word(vector_addr)
+                handler_addr = self._read_memory_word(vector_addr)
                 logger.debug(f"Interrupt vector addr {vector_addr:04x}. Simulating CALL {handler_addr:04x} instruction")
                 self._interrupt_instructions = [0xcd, handler_addr & 0xff, handler_addr >> 8]
             case _:
@@ -163,23 +288,21 @@ class CPU:
         self._a = value
 
     def get_f(self):
-        flags = 0
-        if self._sign: flags = set_bit(flags, 7)
-        if self._zero: flags = set_bit(flags, 6)
-        if self._half_carry: flags = set_bit(flags, 4)
-        if self._parity_overflow: flags = set_bit(flags, 2)
-        if self._add_subtract: flags = set_bit(flags, 1)
-        if self._carry: flags = set_bit(flags, 0)
-        return flags
+        return ((0x80 if self._sign else 0) |
+                (0x40 if self._zero else 0) |
+                (0x10 if self._half_carry else 0) |
+                (0x04 if self._parity_overflow else 0) |
+                (0x02 if self._add_subtract else 0) |
+                (0x01 if self._carry else 0))
 
     def set_f(self, value):
         self._validate_byte_value(value)
-        self._sign = is_bit_set(value, 7)
-        self._zero = is_bit_set(value, 6)
-        self._half_carry = is_bit_set(value, 4)
-        self._parity_overflow = is_bit_set(value, 2)
-        self._add_subtract = is_bit_set(value, 1)
-        self._carry = is_bit_set(value, 0)
+        self._sign = (value & 0x80) != 0
+        self._zero = (value & 0x40) != 0
+        self._half_carry = (value & 0x10) != 0
+        self._parity_overflow = (value & 0x04) != 0
+        self._add_subtract = (value & 0x02) != 0
+        self._carry = (value & 0x01) != 0
 
     def get_b(self):
         return self._b
@@ -425,7 +548,7 @@ class CPU:
         if reg_idx == 5:
             return self._l
         if reg_idx == 6:
-            return self._machine.read_memory_byte(self.hl)
+            return self._read_memory_byte((self._h << 8) | self._l)
         if reg_idx == 7:
             return self._a
 
@@ -433,62 +556,62 @@ class CPU:
         assert value >= 0x00 and value <= 0xff
         if reg_idx == 0:
             self._b = value
-        if reg_idx == 1:
+        elif reg_idx == 1:
             self._c = value
-        if reg_idx == 2:
+        elif reg_idx == 2:
             self._d = value
-        if reg_idx == 3:
+        elif reg_idx == 3:
             self._e = value
-        if reg_idx == 4:
+        elif reg_idx == 4:
             self._h = value
-        if reg_idx == 5:
+        elif reg_idx == 5:
             self._l = value
-        if reg_idx == 6:
-            self._machine.write_memory_byte(self.hl, value)
-        if reg_idx == 7:
+        elif reg_idx == 6:
+            self._write_memory_byte((self._h << 8) | self._l, value)
+        else:
             self._a = value
 
     def _reg_symb(self, reg_idx):
-        return ["B", "C", "D", "E", "H", "L", "(HL)", "A"][reg_idx]
+        return REGISTER_SYMBOLS[reg_idx]
 
     def _set_register_pair(self, reg_pair, value):
         if reg_pair == 0:
-            self.bc = value
-        if reg_pair == 1:
-            self.de = value
-        if reg_pair == 2:
-            self.hl = value
-        if reg_pair == 3:
-            self.sp = value
+            self._b = value >> 8
+            self._c = value & 0xff
+        elif reg_pair == 1:
+            self._d = value >> 8
+            self._e = value & 0xff
+        elif reg_pair == 2:
+            self._h = value >> 8
+            self._l = value & 0xff
+        else:
+            self._sp = value
 
     def _get_register_pair(self, reg_pair):
         if reg_pair == 0:
-            return self.bc
+            return (self._b << 8) | self._c
         if reg_pair == 1:
-            return self.de
+            return (self._d << 8) | self._e
         if reg_pair == 2:
-            return self.hl
+            return (self._h << 8) | self._l
         if reg_pair == 3:
-            return self.sp
+            return self._sp
 
     def _reg_pair_symb(self, reg_pair):
-        return ["BC", "DE", "HL", "SP"][reg_pair]
+        return REGISTER_PAIR_SYMBOLS[reg_pair]
 
 
     def _get_index_reg(self):
-        prefix = self._instruction_prefix if self._instruction_prefix < 0x100 else self._instruction_prefix >> 8
-        return self._ix if prefix == 0xdd else self._iy
+        return self._ix if self._instruction_prefix in IX_PREFIXES else self._iy
 
     def _set_index_reg(self, value):
-        prefix = self._instruction_prefix if self._instruction_prefix < 0x100 else self._instruction_prefix >> 8
-        if prefix == 0xdd:
+        if self._instruction_prefix in IX_PREFIXES:
             self._ix = value
         else:
             self._iy = value
 
     def _get_index_reg_symb(self):
-        prefix = self._instruction_prefix if self._instruction_prefix < 0x100 else self._instruction_prefix >> 8
-        return "IX" if prefix == 0xdd else "IY"
+        return "IX" if self._instruction_prefix in IX_PREFIXES else "IY"
 
 
     # ALU flags
@@ -529,12 +652,21 @@ class CPU:
     def set_carry(self, value):
         self._carry = value
 
+    def _get_parity_flag(self):
+        # Instructions store the value to calculate parity of, and the parity is looked up only when a
+        # conditional instruction needs it
+        return PARITY[self._parity_value]
+
+    def _set_parity_flag(self, value):
+        self._parity_value = 0 if value else 1  # A value with the requested parity
+
     sign = property(get_sign, set_sign)
     zero = property(get_zero, set_zero)
     half_carry = property(get_half_carry, set_half_carry)
     parity = property(get_parity, set_parity)
     overflow = property(get_parity, set_parity)     # Overflow flag shares the same bit as parity
     add_subtract = property(get_add_subtract, set_add_subtract)
+    _parity = property(_get_parity_flag, _set_parity_flag)
     carry = property(get_carry, set_carry)
 
     # Interrupt Flags
@@ -557,13 +689,31 @@ class CPU:
 
     # CPU Memory functions
 
+    def _fetch_memory_byte(self, addr):
+        """
+        Read a byte of the instruction stream outside of the current fetch buffer. Select the buffer of
+        the memory at the address for subsequent fetches, or read through the machine if the memory does
+        not allow direct access.
+        """
+        memory = self._machine.get_memory_buffer(addr)
+        if not memory:
+            return self._read_memory_byte(addr)
+
+        self._fetch_buffer, self._fetch_start, self._fetch_end = memory
+        return self._fetch_buffer[addr - self._fetch_start]
+
+
     def _fetch_next_byte(self):
         if self._iff1 and self._interrupt_instructions:
             data = self._interrupt_instructions[0]
             del self._interrupt_instructions[0]
         else:
-            data = self._machine.read_memory_byte(self._pc)
-            self._pc += 1
+            pc = self._pc
+            if self._fetch_start <= pc <= self._fetch_end:
+                data = self._fetch_buffer[pc - self._fetch_start]
+            else:
+                data = self._fetch_memory_byte(pc)
+            self._pc = (pc + 1) & 0xffff
         return data
 
 
@@ -575,83 +725,268 @@ class CPU:
             del self._interrupt_instructions[0]
             del self._interrupt_instructions[0]
         else:
-            data = self._machine.read_memory_word(self._pc)
-            self._pc += 2
+            pc = self._pc
+            if self._fetch_start <= pc < self._fetch_end:
+                offset = pc - self._fetch_start
+                data = self._fetch_buffer[offset] | (self._fetch_buffer[offset + 1] << 8)
+            else:
+                data = self._read_memory_word(pc)
+            self._pc = (pc + 2) & 0xffff
         return data
 
 
     def _fetch_displacement(self):
-        data = self._machine.read_memory_byte(self._pc)
-        self._pc += 1
-        if data >= 0x80:
-            return data - 0x100
-        return data
+        pc = self._pc
+        if self._fetch_start <= pc <= self._fetch_end:
+            data = self._fetch_buffer[pc - self._fetch_start]
+        else:
+            data = self._fetch_memory_byte(pc)
+        self._pc = (pc + 1) & 0xffff
+        return SIGNED_BYTE[data]
 
 
     def _push_to_stack(self, value):
         self._sp -= 2
-        self._machine.write_memory_word(self._sp, value)
+        self._write_memory_word(self._sp, value)
 
 
     def _pop_from_stack(self):
-        value = self._machine.read_memory_word(self._sp)
+        value = self._read_memory_word(self._sp)
         self._sp += 2
         return value
 
 
     # Emulation
-    def step(self):
+    def step(self, breakpoints=None):
         """
-        Executes an instruction and updates processor state
+        Executes an instruction and updates processor state. Breakpoints are passed to run(), so that
+        single stepping with the same breakpoints set does not drop compiled blocks.
+        """
+        self.run(0, breakpoints)
+
+
+    def run(self, num_cycles, breakpoints=None):
+        """
+        Executes instructions until the given number of CPU cycles elapsed. At least one instruction is
+        executed, so run(0) is equivalent to a single step.
+
+        Instruction tables are loaded to local variables once per batch, so that the dispatch does not
+        pay for attribute lookups on each instruction.
+
+        Optional breakpoints dictionary maps an address to a list of functions, that are called before
+        the instruction at this address is executed.
+
+        Frequently executed instruction sequences are compiled into blocks (see _compile_block()). Each
+        instruction address is counted when executed one by one. Once the counter reaches BLOCK_THRESHOLD,
+        instructions executed starting this address are recorded, and the recorded trace is compiled.
+        """
+        decode_cache = self._decode_cache
+        decode_instruction = self._decode_instruction
+        blocks = self._blocks
+        block_counts = self._block_counts
+        stop_at = self._cycles + num_cycles
+        trace = None
+        trace_generation = 0
+
+        # Handlers check this flag rather than the logger, so that mnemonics are formatted only when
+        # debug messages are actually emitted. Breakpoint functions may enable or disable logging.
+        self._debug_logging = logger.isEnabledFor(logging.DEBUG)
+        self._block_deadline = stop_at
+
+        # Blocks do not check breakpoints inside, so they are recompiled if breakpoints set is changed
+        breakpoint_addrs = frozenset(breakpoints) if breakpoints else frozenset()
+        if breakpoint_addrs != self._block_breakpoints:
+            blocks.clear()
+            self._block_breakpoints = breakpoint_addrs
+
+        while True:
+            pc = self._pc
+            if breakpoints and pc in breakpoints:
+                if trace:
+                    self._compile_block(trace)
+                    trace = None
+                for br in breakpoints[pc]:
+                    br()
+                self._debug_logging = logger.isEnabledFor(logging.DEBUG)
+
+            # Fetch and decode the next instruction. Instructions supplied by the interrupting device
+            # bypass the decoded instructions cache, and compiled blocks.
+            if self._interrupt_instructions and self._iff1:
+                trace = None
+                entry = decode_instruction()
+            else:
+                block = blocks.get(pc)
+                if block is not None:
+                    if trace:
+                        self._compile_block(trace)
+                        trace = None
+                    self._block_deadline = stop_at
+                    block(self)
+                    if self._cycles > stop_at:
+                        break
+                    continue
+
+                entry = decode_cache[pc]
+                if entry is None:
+                    entry = decode_instruction()
+                    self._cache_decoded_instruction(pc, entry)
+                    self._block_deadline = stop_at      # Could be reset by the code modification
+
+                if trace is None:
+                    count = block_counts.get(pc, 0) + 1
+                    block_counts[pc] = count
+                    if count == BLOCK_THRESHOLD:
+                        trace = []
+                        trace_generation = self._code_generation
+
+            instruction, self._instruction_prefix, self._current_inst, self._displacement, self._pc = entry
+
+            # Execute the instruction
+            instruction(self)
+
+            # Record the trace until it is long enough, or loops back to its start. The trace is dropped if
+            # the code is modified while recording, as recorded instructions may no longer match the memory
+            if trace is not None:
+                if self._code_generation != trace_generation:
+                    trace = None
+                else:
+                    trace.append((pc, entry, self._pc))
+                    if len(trace) == MAX_BLOCK_LENGTH or self._pc == trace[0][0]:
+                        self._compile_block(trace)
+                        trace = None
+
+            if self._cycles > stop_at:
+                break
+
+
+    def _decode_instruction(self):
+        """
+        Fetch the instruction opcode (including prefixes) and decode it. Returns a tuple of
+        (handler, prefix, opcode, displacement, address of the instruction operands)
+
+        Instructions are looked up in the flat dispatch table, at the opcode offset within the prefix section.
+        For 0xDD 0xCB and 0xFD 0xCB prefixed instructions 3rd byte is a displacement, and 4th byte is the opcode.
         """
-        # Fetch the next instruction, and parse prefix bytes if needed
-        pc = self._pc
         b = self._fetch_next_byte()
-        if b in [0xed, 0xcb, 0xdd, 0xfd]:
-            self._instruction_prefix = b
-            self._current_inst = self._fetch_next_byte()
-
-            # Handle double prefixes such as 0xDDCB and 0xFDCB
-            # In these instructions3rd byte is a displacement, and 4th byte is the opcode
-            if self._current_inst == 0xcb:
-                self._instruction_prefix <<= 8
-                self._instruction_prefix |= self._current_inst
-                self._displacement = self._fetch_displacement()
-                self._current_inst = self._fetch_next_byte()
-        else:
-            self._instruction_prefix = None
-            self._current_inst = b
-
-        # Depending on instruction prefix, select the correct instruction table
-        match self._instruction_prefix:
-            case 0xed:
-                instruction = self._instructions_0xed[self._current_inst]
-            case 0xcb:
-                instruction = self._instructions_0xcb[self._current_inst]
-            case 0xdd:
-                instruction = self._instructions_0xdd[self._current_inst]
-            case 0xddcb:
-                instruction = self._instructions_0xddcb[self._current_inst]
-            case 0xfd:
-                instruction = self._instructions_0xfd[self._current_inst]
-            case 0xfdcb:
-                instruction = self._instructions_0xfdcb[self._current_inst]
-            case _:
-                instruction = self._instructions[self._current_inst]
+        if b not in PREFIX_OFFSETS:
+            return (self._dispatch[b], None, b, 0, self._pc)
 
-        # Execute the instruction
-        if instruction is not None:
-            instruction()
+        prefix = b
+        op = self._fetch_next_byte()
+        displacement = 0
+        if op == 0xcb and prefix in (0xdd, 0xfd):
+            prefix = (prefix << 8) | 0xcb
+            displacement = self._fetch_displacement()
+            op = self._fetch_next_byte()
+            return (self._decode_indexed_bit_instruction(op), prefix, op, displacement, self._pc)
+
+        return (self._dispatch[PREFIX_OFFSETS[prefix] + op], prefix, op, displacement, self._pc)
+
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _decode_indexed_bit_instruction(op):
+        """
+        Select handler for 0xDD 0xCB and 0xFD 0xCB prefixed instructions. These are encoded as [op:2][bit:3][reg:3],
+        so the handler is selected by the opcode bit pattern, rather than a table lookup. Only (IX+d) operand
+        variants (reg == 6) of BIT, RES, and SET instructions are implemented. Bit mask is bound to the handler.
+
+        The handler does not depend on the prefix or displacement, so it is memoized per opcode, and the same
+        handler object is shared by all decoded instances of the instruction.
+        """
+        kind = op >> 6
+        if kind == 0 or (op & 0x07) != 6:
+            return CPU._invalid_instruction
+
+        bit = (op >> 3) & 0x07
+        if kind == 1:
+            return bind_operands(CPU._get_bit_indexed, BIT_MASKS[bit])           # BIT b, (IX+d)
+        if kind == 2:
+            return bind_operands(CPU._reset_bit_indexed, RESET_BIT_MASKS[bit])   # RES b, (IX+d)
+        return bind_operands(CPU._set_bit_indexed, BIT_MASKS[bit])               # SET b, (IX+d)
+
+
+    def _cache_decoded_instruction(self, pc, entry):
+        self._decode_cache[pc] = entry
+        for offset in range((entry[4] - pc) & 0xffff):
+            self._decoded_bytes[(pc + offset) & 0xffff] = 1
+
+
+    def _compile_block(self, trace):
+        """
+        Compile recorded instructions trace into a single Python function. The trace is a list of
+        (instruction address, decoded instruction, address after instruction execution) tuples.
+
+        The block function executes the same handlers as the main loop, but does not need to look up
+        decoded instructions. The block returns as soon as the execution leaves the recorded path (e.g. a
+        conditional jump went the other way), the cycles deadline is reached, or the code is modified.
+        """
+        lines = ["def block(cpu):"]
+        handlers = {}
+        prefix = -1     # Instruction prefix is set only if it differs from the previous instruction
+        for i, (pc, entry, next_pc) in enumerate(trace):
+            instruction, inst_prefix, inst, displacement, operands_pc = entry
+
+            # Make sure modifying any of the block instructions drops the block
+            for offset in range((operands_pc - pc) & 0xffff):
+                self._decoded_bytes[(pc + offset) & 0xffff] = 1
+
+            # Handlers with bound operands are called with the operands directly (see bind_operands())
+            handlers[f"handler_{i}"] = getattr(instruction, "handler", instruction)
+            operands = "".join(f", {operand}" for operand in getattr(instruction, "operands", ()))
+
+            if inst_prefix != prefix:
+                lines.append(f"    cpu._instruction_prefix = {inst_prefix}")
+                prefix = inst_prefix
+            if inst_prefix is not None and inst_prefix > 0xff:
+                lines.append(f"    cpu._displacement = {displacement}")
+            lines.append(f"    cpu._current_inst = {inst}")
+            lines.append(f"    cpu._pc = {operands_pc}")
+            lines.append(f"    handler_{i}(cpu{operands})")
+            if i < len(trace) - 1:
+                lines.append(f"    if cpu._pc != {next_pc} or cpu._cycles > cpu._block_deadline: return")
+
+        start = trace[0][0]
+        exec(compile("\n".join(lines), f"<block {start:04x}>", "exec"), handlers)
+        self._blocks[start] = handlers["block"]
+
+
+    def invalidate_decoded_instructions(self, addr):
+        """
+        Drop cached instructions that overlap the modified memory address. Machine calls this
+        function on every memory write.
+
+        Compiled blocks are all dropped, and the currently running block (if any) is stopped after
+        the current instruction.
+        """
+        if self._decoded_bytes[addr]:
+            self._decoded_bytes[addr] = 0
+            for start in range(addr - 3, addr + 1):     # Decoded part of an instruction is up to 4 bytes long
+                self._decode_cache[start & 0xffff] = None
+
+            self._blocks.clear()
+            self._block_deadline = -1
+            self._code_generation += 1
+
+
+    def _invalid_instruction(self):
+        """
+        Handler for opcodes that are not implemented. Empty slots of the instruction tables are filled
+        with this handler in the dispatch table, so that the execution loop does not need to check for them.
+        """
+        if self._instruction_prefix == None:
+            prefix = ""
+            length = 1
+        elif self._instruction_prefix >= 0x100:
+            h = self._instruction_prefix >> 8
+            l = self._instruction_prefix & 0xff
+            prefix = f"{h:02x} {l:02x} {self._displacement:02x} "
+            length = 4
         else:
-            if self._instruction_prefix == None:
-                prefix = ""
-            elif self._instruction_prefix >= 0x100:
-                h = self._instruction_prefix >> 8
-                l = self._instruction_prefix & 0xff
-                prefix = f"{h:02x} {l:02x} {self._displacement:02x} "
-            else:
-                prefix = f"{self._instruction_prefix:02x} "
-            raise InvalidInstruction(f"Incorrect OPCODE {prefix}{self._current_inst:02x} (at addr 0x{pc:04x})")
+            prefix = f"{self._instruction_prefix:02x} "
+            length = 2
+        pc = (self._pc - length) & 0xffff
+        raise InvalidInstruction(f"Incorrect OPCODE {prefix}{self._current_inst:02x} (at addr 0x{pc:04x})")
 
 
     # Logging
@@ -685,9 +1020,6 @@ class CPU:
 
 
     def _log_1b_instruction(self, mnemonic):
-        if logger.level > logging.DEBUG:
-            return
-
         addr = self._pc - 1
         if self._instruction_prefix:
             addr -= 1
@@ -700,13 +1032,10 @@ class CPU:
 
 
     def _log_2b_instruction(self, mnemonic):
-        if logger.level > logging.DEBUG:
-            return
-
         addr = self._pc - 2
         if self._instruction_prefix:
             addr -= 1
-        param = self._machine.read_memory_byte(self._pc - 1)
+        param = self._read_memory_byte(self._pc - 1)
         log_str = f' {addr:04x}  {self._prepare_log_prefix()} {self._current_inst:02x} {param:02x}      {mnemonic}'
 
         if self._registers_logging:
@@ -716,14 +1045,11 @@ class CPU:
 
 
     def _log_3b_instruction(self, mnemonic):
-        if logger.level > logging.DEBUG:
-            return
-
         addr = self._pc - 3
         if self._instruction_prefix:
             addr -= 1
-        param1 = self._machine.read_memory_byte(self._pc - 2)
-        param2 = self._machine.read_memory_byte(self._pc - 1)
+        param1 = self._read_memory_byte(self._pc - 2)
+        param2 = self._read_memory_byte(self._pc - 1)
         log_str = f' {addr:04x}  {self._prepare_log_prefix()} {self._current_inst:02x} {param1:02x} {param2:02x}   {mnemonic}'
 
         if self._registers_logging:
@@ -733,9 +1059,6 @@ class CPU:
 
 
     def _log_3b_bit_instruction(self, mnemonic):
-        if logger.level > logging.DEBUG:
-            return
-
         addr = self._pc - 4
         log_str = f' {addr:04x}  {self._instruction_prefix >> 8:02x} {(self._instruction_prefix & 0xff):02x} {self._displacement:02x} {self._current_inst:02x}   {mnemonic}'
 
@@ -752,7 +1075,7 @@ class CPU:
         """ Do nothing """
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("NOP")
 
 
@@ -765,7 +1088,7 @@ class CPU:
         self._iff2 = True
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("EI")
 
 
@@ -775,7 +1098,7 @@ class CPU:
         self._iff2 = False
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("DI")
 
 
@@ -786,7 +1109,7 @@ class CPU:
 
         self._cycles += 8
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"IM {self._interrupt_mode}")
 
 
@@ -795,17 +1118,17 @@ class CPU:
         addr = self._fetch_next_byte()
 
         # The IN A, (n) instruction also exposes accumulator value on the a8-a15 lines
-        self._a = self._machine.read_io(addr, self._a)
+        self._a = self._read_io(addr, self._a)
         self._cycles += 11
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"IN A, {addr:02x}")
 
 
     def _in_reg(self):
         """ I/O Input to a register. I/O address in C register """
         reg = (self._current_inst & 0x38) >> 3
-        value = self._machine.read_io(self._c, self._b) # C - IO address, B - extra address data
+        value = self._read_io(self._c, self._b) # C - IO address, B - extra address data
         if reg != 6:    # IN (C) instruction does not modify the register, only set flags
             self._set_register(reg, value)
         self._cycles += 12
@@ -813,9 +1136,9 @@ class CPU:
         self._zero = value == 0
         self._half_carry = False
         self._add_subtract = False
-        self._parity_overflow = self._count_bits(value) % 2 == 0
+        self._parity_overflow = PARITY[value]
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"IN {self._reg_symb(reg)}, (C)")
 
 
@@ -823,11 +1146,11 @@ class CPU:
         """ IO Output """
         addr = self._fetch_next_byte()
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"OUT {addr:02x}, A")
 
         # The OUT (n), A instruction also exposes accumulator value on the a8-a15 lines
-        self._machine.write_io(addr, self._a, self._a)
+        self._write_io(addr, self._a, self._a)
         self._cycles += 11
 
 
@@ -835,21 +1158,19 @@ class CPU:
         """ I/O Output from a register. I/O address in C register """
         reg = (self._current_inst & 0x38) >> 3
         value = self._get_register(reg)
-        self._machine.write_io(self._c, self._b, value) # C - IO address, B - extra address data
+        self._write_io(self._c, self._b, value) # C - IO address, B - extra address data
 
         self._cycles += 12
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"OUT (C), {self._reg_symb(reg)}")
 
 
 
     # 8-bit data transfer instructions
 
-    def _load_reg8_to_reg8(self):
-        """ Move a byte between 2 registers """
-        dst = (self._current_inst & 0x38) >> 3
-        src = self._current_inst & 0x07
+    def _load_reg8_to_reg8(self, dst, src):
+        """ Move a byte between 2 registers (register indexes are bound in the instruction table) """
         value = self._get_register(src)
         self._set_register(dst, value)
 
@@ -857,18 +1178,17 @@ class CPU:
         if src == 6 or dst == 6:
             self._cycles += 3
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"LD {self._reg_symb(dst)}, {self._reg_symb(src)}")
 
 
-    def _load_reg8_immediate(self):
-        """ Load 8-bit register from immediate argument """
-        reg = (self._current_inst & 0x38) >> 3
+    def _load_reg8_immediate(self, reg):
+        """ Load 8-bit register from immediate argument (register index is bound in the instruction table) """
         value = self._fetch_next_byte()
         self._set_register(reg, value)
         self._cycles += (7 if reg != 6 else 10)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"LD {self._reg_symb(reg)}, {value:02x}")
 
 
@@ -878,7 +1198,7 @@ class CPU:
 
         self._cycles += 9
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             reg_symb = "R" if (self._current_inst & 0x08) else "I"
             self._log_1b_instruction(f"LD A, {reg_symb}")
 
@@ -892,7 +1212,7 @@ class CPU:
 
         self._cycles += 9
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             reg_symb = "R" if (self._current_inst & 0x08) else "I"
             self._log_1b_instruction(f"LD {reg_symb}, A")
 
@@ -900,20 +1220,20 @@ class CPU:
     def _store_a_to_mem(self):
         """ Store accumulator to memory pointed by immediate argument """
         addr = self._fetch_next_word()
-        self._machine.write_memory_byte(addr, self._a)
+        self._write_memory_byte(addr, self._a)
         self._cycles += 13
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD ({addr:04x}), A")
 
 
     def _load_a_from_mem(self):
         """ Load accumulator from memory pointed by immediate argument """
         addr = self._fetch_next_word()
-        self._a = self._machine.read_memory_byte(addr)
+        self._a = self._read_memory_byte(addr)
         self._cycles += 13
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD A, ({addr:04x})")
 
 
@@ -921,13 +1241,13 @@ class CPU:
         """ Store a 8-bit register to a memory indexed by IX/IY registers """
         displacement = self._fetch_displacement()
         src = self._current_inst & 0x07
-        addr = self._get_index_reg() + displacement
+        addr = (self._get_index_reg() + displacement) & 0xffff
         value = self._get_register(src)
-        self._machine.write_memory_byte(addr, value)
+        self._write_memory_byte(addr, value)
 
         self._cycles += 19
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"LD ({self._get_index_reg_symb()}{displacement:+03x}), {self._reg_symb(src)}")
 
 
@@ -935,13 +1255,13 @@ class CPU:
         """ Load a 8-bit register from a memory indexed by IX/IY registers """
         displacement = self._fetch_displacement()
         dst = (self._current_inst & 0x38) >> 3
-        addr = self._get_index_reg() + displacement
-        value = self._machine.read_memory_byte(addr)
+        addr = (self._get_index_reg() + displacement) & 0xffff
+        value = self._read_memory_byte(addr)
         self._set_register(dst, value)
 
         self._cycles += 19
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"LD {self._reg_symb(dst)}, ({self._get_index_reg_symb()}{displacement:+03x})")
 
 
@@ -950,12 +1270,12 @@ class CPU:
         displacement = self._fetch_displacement()
         value = self._fetch_next_byte()
 
-        addr = self._get_index_reg() + displacement
-        self._machine.write_memory_byte(addr, value)
+        addr = (self._get_index_reg() + displacement) & 0xffff
+        self._write_memory_byte(addr, value)
 
         self._cycles += 19
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD ({self._get_index_reg_symb()}{displacement:+03x}), {value:02x}")
 
 
@@ -966,10 +1286,10 @@ class CPU:
         """ Load accumulator from memory pointed by a regpair """
         reg_pair = (self._current_inst & 0x10) >> 4
         addr = self._get_register_pair(reg_pair)
-        self._a = self._machine.read_memory_byte(addr)
+        self._a = self._read_memory_byte(addr)
         self._cycles += 7
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"LD A, ({self._reg_pair_symb(reg_pair)})")
 
 
@@ -977,24 +1297,20 @@ class CPU:
         """ Store accumulator to memory pointed by a regpair """
         reg_pair = (self._current_inst & 0x10) >> 4
         addr = self._get_register_pair(reg_pair)
-        self._machine.write_memory_byte(addr, self._a)
+        self._write_memory_byte(addr, self._a)
         self._cycles += 7
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"LD ({self._reg_pair_symb(reg_pair)}), A")
 
 
-    def _load_immediate_16b(self):
-        """ Load register pair with immediate value"""
-        reg_pair = (self._current_inst & 0x30) >> 4
+    def _load_immediate_16b(self, reg_pair):
+        """ Load register pair with immediate value (register pair index is bound in the instruction table) """
         value = self._fetch_next_word()
-        if reg_pair == 3:
-            self._sp = value
-        else: 
-            self._set_register_pair(reg_pair, value)
+        self._set_register_pair(reg_pair, value)
         self._cycles += 10
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD {self._reg_pair_symb(reg_pair)}, {value:04x}")
 
 
@@ -1004,17 +1320,17 @@ class CPU:
         self._set_index_reg(value)
         self._cycles += 14
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD {self._get_index_reg_symb()}, {value:04x}")
 
 
     def _store_hl_to_memory(self):
         """ Store H and L to memory at immediate address """
         addr = self._fetch_next_word()
-        self._machine.write_memory_word(addr, self.hl)
+        self._write_memory_word(addr, (self._h << 8) | self._l)
         self._cycles += 16
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD ({addr:04x}), HL")
 
 
@@ -1022,20 +1338,22 @@ class CPU:
         """ Store register pair to memory at immediate address """
         reg_pair = (self._current_inst & 0x30) >> 4
         addr = self._fetch_next_word()
-        self._machine.write_memory_word(addr, self._get_register_pair(reg_pair))
+        self._write_memory_word(addr, self._get_register_pair(reg_pair))
         self._cycles += 20
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD ({addr:04x}), {self._reg_pair_symb(reg_pair)}")
 
 
     def _load_hl_from_memory(self):
         """ Load H and L from memory at immediate address """
         addr = self._fetch_next_word()
-        self.hl = self._machine.read_memory_word(addr)
+        value = self._read_memory_word(addr)
+        self._h = value >> 8
+        self._l = value & 0xff
         self._cycles += 16
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD HL, ({addr:04x})")
 
 
@@ -1043,20 +1361,20 @@ class CPU:
         """ Load register pair from memory at immediate address """
         reg_pair = (self._current_inst & 0x30) >> 4
         addr = self._fetch_next_word()
-        value = self._machine.read_memory_word(addr)
+        value = self._read_memory_word(addr)
         self._set_register_pair(reg_pair, value)
         self._cycles += 20
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"LD {self._reg_pair_symb(reg_pair)}, ({addr:04x})")
 
 
     def _ld_sp_hl(self):
         """ Load HL value to SP register """
-        self._sp = self.hl
+        self._sp = (self._h << 8) | self._l
         self._cycles += 6
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"LD SP, HL")
 
 
@@ -1069,12 +1387,12 @@ class CPU:
             value = self._get_register_pair(reg_pair)
         else:
             reg_pair_name = "AF"
-            value = self.af
+            value = (self._a << 8) | self.get_f()
 
         self._push_to_stack(value)
         self._cycles += 11
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"PUSH {reg_pair_name}")
 
 
@@ -1089,11 +1407,12 @@ class CPU:
             self._set_register_pair(reg_pair, value)
         else:
             reg_pair_name = "AF"
-            self.af = value
+            self._a = value >> 8
+            self.set_f(value & 0xff)
 
         self._cycles += 10
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"POP {reg_pair_name}")
 
 
@@ -1103,7 +1422,7 @@ class CPU:
         self._push_to_stack(value)
         self._cycles += 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"PUSH {self._get_index_reg_symb()}")
 
 
@@ -1114,7 +1433,7 @@ class CPU:
 
         self._cycles += 14
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"POP {self._get_index_reg_symb()}")
 
 
@@ -1122,138 +1441,167 @@ class CPU:
 
     def _exchange_de_hl(self):
         """ Exchange DE and HL register pairs """
-        tmp = self.de
-        self.de = self.hl
-        self.hl = tmp
+        self._d, self._h = self._h, self._d
+        self._e, self._l = self._l, self._e
 
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"EX DE, HL")
 
 
     def _exchange_hl_stack(self):
         """ Exchange HL and 2 bytes on the stack """
-        value = self.hl
-        self.hl = self._machine.read_memory_word(self._sp)
-        self._machine.write_memory_word(self._sp, value)
+        value = self._read_memory_word(self._sp)
+        self._write_memory_word(self._sp, (self._h << 8) | self._l)
+        self._h = value >> 8
+        self._l = value & 0xff
         self._cycles += 19
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"EX (SP), HL")
 
 
     def _exchange_af_afx(self):
         """ Exchange AF register pair with alternate registers set """
-        tmp = self.afx
-        self.afx = self.af
-        self.af = tmp
+        flags = self.get_f()
+        self.set_f(self._fx)
+        self._fx = flags
+        self._a, self._ax = self._ax, self._a
 
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"EX AF, AF'")
 
 
     def _exchange_register_set(self):
         """ Exchange register set with alternate register set """
-        tmp = self.bcx
-        self.bcx = self.bc
-        self.bc = tmp
-
-        tmp = self.dex
-        self.dex = self.de
-        self.de = tmp
-
-        tmp = self.hlx
-        self.hlx = self.hl
-        self.hl = tmp
+        self._b, self._bx = self._bx, self._b
+        self._c, self._cx = self._cx, self._c
+        self._d, self._dx = self._dx, self._d
+        self._e, self._ex = self._ex, self._e
+        self._h, self._hx = self._hx, self._h
+        self._l, self._lx = self._lx, self._l
 
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"EXX")
 
     # Block transfer instructions
 
     def _ldd(self):
         """ Copy byte from (HL) to (DE) and decrement HL and DE, decrement BC """
-        value = self._machine.read_memory_byte(self.hl)
-        self._machine.write_memory_byte(self.de, value)
-        self.hl = (self.hl - 1) & 0xffff
-        self.de = (self.de - 1) & 0xffff
-        self.bc = (self.bc - 1) & 0xffff
+        hl = (self._h << 8) | self._l
+        de = (self._d << 8) | self._e
+        bc = ((self._b << 8) | self._c) - 1 & 0xffff
+        self._write_memory_byte(de, self._read_memory_byte(hl))
+        hl = (hl - 1) & 0xffff
+        de = (de - 1) & 0xffff
+        self._h = hl >> 8
+        self._l = hl & 0xff
+        self._d = de >> 8
+        self._e = de & 0xff
+        self._b = bc >> 8
+        self._c = bc & 0xff
 
         self._half_carry = False
-        self._parity_overflow = self.bc != 0x0000
+        self._parity_overflow = bc != 0x0000
         self._add_subtract = False
 
         self._cycles += 16
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("LDD")
 
 
     def _lddr(self):
         """ Copy byte from (HL) to (DE) and decrement HL and DE. Repeat until BC is zero"""
-        value = self._machine.read_memory_byte(self.hl)
-        self._machine.write_memory_byte(self.de, value)
-        self.hl = (self.hl - 1) & 0xffff
-        self.de = (self.de - 1) & 0xffff
-        self.bc = (self.bc - 1) & 0xffff
-
-        self._half_carry = False
-        self._parity_overflow = self.bc != 0x0000
-        self._add_subtract = False
+        self._repeat_block_transfer(-1)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("LDDR")
 
-        if self.bc != 0:
-            self._pc -= 2
-            self._cycles += 21
-        else:
-            self._cycles += 16
-
 
     def _ldi(self):
         """ Copy byte from (HL) to (DE) and increment HL and DE, decrement BC """
-        value = self._machine.read_memory_byte(self.hl)
-        self._machine.write_memory_byte(self.de, value)
-        self.hl = (self.hl + 1) & 0xffff
-        self.de = (self.de + 1) & 0xffff
-        self.bc = (self.bc - 1) & 0xffff
+        hl = (self._h << 8) | self._l
+        de = (self._d << 8) | self._e
+        bc = ((self._b << 8) | self._c) - 1 & 0xffff
+        self._write_memory_byte(de, self._read_memory_byte(hl))
+        hl = (hl + 1) & 0xffff
+        de = (de + 1) & 0xffff
+        self._h = hl >> 8
+        self._l = hl & 0xff
+        self._d = de >> 8
+        self._e = de & 0xff
+        self._b = bc >> 8
+        self._c = bc & 0xff
 
         self._half_carry = False
-        self._parity_overflow = self.bc != 0x0000
+        self._parity_overflow = bc != 0x0000
         self._add_subtract = False
 
         self._cycles += 16
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("LDI")
 
 
     def _ldir(self):
         """ Copy byte from (HL) to (DE) and increment HL and DE. Repeat until BC is zero"""
-        value = self._machine.read_memory_byte(self.hl)
-        self._machine.write_memory_byte(self.de, value)
-        self.hl = (self.hl + 1) & 0xffff
-        self.de = (self.de + 1) & 0xffff
-        self.bc = (self.bc - 1) & 0xffff
-
-        self._half_carry = False
-        self._parity_overflow = self.bc != 0x0000
-        self._add_subtract = False
+        self._repeat_block_transfer(1)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction("LDIR")
 
-        if self.bc != 0:
-            self._pc -= 2
-            self._cycles += 21
-        else:
-            self._cycles += 16
+
+    def _repeat_block_transfer(self, step):
+        """
+        Implementation of LDIR/LDDR instructions. A real CPU executes the instruction once per byte, and
+        re-executes it until BC is zero. Here bytes are copied in a loop, until BC is zero or the run()
+        cycles deadline is reached. In the latter case the instruction is repeated on the next step, as
+        usual. Bytes are copied one by one via machine, so that overlapping ranges (e.g. the memory fill
+        idiom with DE = HL + 1), code modification, and memory mapped devices behave exactly as if the
+        instruction was executed byte by byte.
+
+        Each repetition is logged separately when debug logging is enabled, so a single byte is copied.
+        """
+        hl = (self._h << 8) | self._l
+        de = (self._d << 8) | self._e
+        bc = (self._b << 8) | self._c
+        read_memory_byte = self._read_memory_byte
+        write_memory_byte = self._write_memory_byte
+        cycles = self._cycles
+        repeat = not self._debug_logging
+
+        while True:
+            write_memory_byte(de, read_memory_byte(hl))
+            hl = (hl + step) & 0xffff
+            de = (de + step) & 0xffff
+            bc = (bc - 1) & 0xffff
+
+            if bc == 0:
+                cycles += 16
+                break
+
+            cycles += 21
+            if not repeat or cycles > self._block_deadline:
+                self._pc = (self._pc - 2) & 0xffff
+                break
+
+        self._h = hl >> 8
+        self._l = hl & 0xff
+        self._d = de >> 8
+        self._e = de & 0xff
+        self._b = bc >> 8
+        self._c = bc & 0xff
+        self._cycles = cycles
+
+        self._half_carry = False
+        self._parity_overflow = bc != 0x0000
+        self._add_subtract = False
 
 
 
@@ -1263,7 +1611,7 @@ class CPU:
         """ Unconditional jump to an absolute address """
         addr = self._fetch_next_word()
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"JP {addr:04x}")
 
         self._pc = addr
@@ -1272,16 +1620,16 @@ class CPU:
 
     def _jp_hl(self):
         """ Jump to address in HL """
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"JP (HL)")
 
-        self._pc = self.hl
+        self._pc = (self._h << 8) | self._l
         self._cycles += 4
 
 
     def _jp_idx_reg(self):
         """ Jump to address in IX or IY register """
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"JP ({self._get_index_reg_symb()})")
 
         self._pc = self._get_index_reg()
@@ -1292,36 +1640,31 @@ class CPU:
         """ Unconditional relative jump """
         displacement = self._fetch_displacement()
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"JR {displacement + 2:+03x} ({self._pc + displacement:04x})")
 
-        self._pc += displacement
+        self._pc = (self._pc + displacement) & 0xffff
         self._cycles += 12
 
 
-    def _jr_cond(self):
-        """ Conditional relative jump """
+    def _jr_cond(self, condition_code):
+        """ Conditional relative jump (condition code is bound in the instruction table) """
         displacement = self._fetch_displacement()
 
-        condition_code = (self._current_inst & 0x18)
-        if condition_code == 0x00:
+        if condition_code == 0:
             condition = not self._zero
-            condition_code = "NZ"
-        elif condition_code == 0x08:
+        elif condition_code == 1:
             condition = self._zero
-            condition_code = "Z"
-        elif condition_code == 0x10:
+        elif condition_code == 2:
             condition = not self._carry
-            condition_code = "NC"
-        elif condition_code == 0x18:
+        else:
             condition = self._carry
-            condition_code = "C"
 
-        if logger.level <= logging.DEBUG:
-            self._log_2b_instruction(f"JR {condition_code}, {displacement + 2:+03x} ({(self._pc + displacement):04x})")
+        if self._debug_logging:
+            self._log_2b_instruction(f"JR {CONDITION_SYMBOLS[condition_code]}, {displacement + 2:+03x} ({(self._pc + displacement):04x})")
 
         if condition:
-            self._pc += displacement
+            self._pc = (self._pc + displacement) & 0xffff
             self._cycles += 12
         else:
             self._cycles += 7
@@ -1333,11 +1676,11 @@ class CPU:
 
         displacement = self._fetch_displacement()
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"DJNZ {displacement + 2:+03x} ({self._pc + displacement:04x})")
 
         if self._b != 0:
-            self._pc += displacement
+            self._pc = (self._pc + displacement) & 0xffff
             self._cycles += 13
         else:
             self._cycles += 8
@@ -1347,7 +1690,7 @@ class CPU:
         """ Call a subroutine """
         addr = self._fetch_next_word()
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_3b_instruction(f"CALL {addr:04x}")
 
         self._push_to_stack(self._pc)
@@ -1358,7 +1701,7 @@ class CPU:
     def _ret(self):
         """ Return from a subroutine """
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RET")
 
         self._pc = self._pop_from_stack()
@@ -1390,9 +1733,8 @@ class CPU:
         addr = self._fetch_next_word()
         op = (self._current_inst & 0x38) >> 3
 
-        if logger.level <= logging.DEBUG:
-            op_symb = ["JP NZ", "JP Z", "JP NC", "JP C", "JP PO", "JP PE", "JP P", "JP M"][op]
-            self._log_3b_instruction(f"{op_symb}, {addr:04x}")
+        if self._debug_logging:
+            self._log_3b_instruction(f"JP {CONDITION_SYMBOLS[op]}, {addr:04x}")
 
         if self._check_condition(op):
             self._pc = addr
@@ -1405,9 +1747,8 @@ class CPU:
         addr = self._fetch_next_word()
         op = (self._current_inst & 0x38) >> 3
 
-        if logger.level <= logging.DEBUG:
-            op_symb = ["CALL NZ", "CALL Z", "CALL NC", "CALL C", "CALL PO", "CALL PE", "CALL P", "CALL M"][op]
-            self._log_3b_instruction(f"{op_symb}, {addr:04x}")
+        if self._debug_logging:
+            self._log_3b_instruction(f"CALL {CONDITION_SYMBOLS[op]}, {addr:04x}")
 
         if self._check_condition(op):
             self._push_to_stack(self._pc)
@@ -1421,9 +1762,8 @@ class CPU:
         """ Conditional return """
         op = (self._current_inst & 0x38) >> 3
 
-        if logger.level <= logging.DEBUG:
-            op_symb = ["RET NZ", "RET Z", "RET NC", "RET C", "RET PO", "RET PE", "RET P", "RET M"][op]
-            self._log_1b_instruction(f"{op_symb}")
+        if self._debug_logging:
+            self._log_1b_instruction(f"RET {CONDITION_SYMBOLS[op]}")
 
         if self._check_condition(op):
             self._pc = self._pop_from_stack()
@@ -1436,7 +1776,7 @@ class CPU:
         """ Restart (special subroutine call) """
         rst_addr = self._current_inst & 0x38
         
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RST {rst_addr:02x}")
 
         self._push_to_stack(self._pc)
@@ -1446,73 +1786,111 @@ class CPU:
 
     # ALU instructions
 
-    def _count_bits(self, n):
-        """ Return number of set bits """
-        if (n == 0):
-            return 0
-        else:
-            return 1 + self._count_bits(n & (n - 1))
-
-
-    def _alu_op(self, op, value):
-        """ Internal implementation of an ALU operation between the accumulator and value.
-        The function updates flags as a result of the operation """
-
-        # Perform the operation
-        if op == 0: # ADD
-            res = self._a + value
-            self._carry = res > 0xff
-            self._half_carry = ((self._a & 0x0f) + (value & 0x0f)) > 0x0f
-            self._add_subtract = False
-            self._parity_overflow = ((self._a ^ value) < 0x80) and ((self._a ^ res) > 0x7f) and (self._a != 0) and (value != 0)
-        if op == 1: # ADC
-            carry = 1 if self._carry else 0
-            res = self._a + value + carry
-            self._carry = res > 0xff
-            self._half_carry = ((self._a & 0x0f) + (value & 0x0f) + carry) > 0x0f
-            self._add_subtract = False
-            self._parity_overflow = ((self._a ^ (value + carry)) < 0x80) and ((self._a ^ res) > 0x7f) and (self._a != 0) and (value + carry != 0)
-        if op == 2 or op == 7: # SUB and CMP
-            res = self._a - value
-            self._carry = res < 0
-            neg_value = ~value + 1
-            self._half_carry = ((self._a & 0x0f) + (neg_value & 0x0f)) > 0x0f
-            self._add_subtract = True
-            self._parity_overflow = ((self._a ^ neg_value) < 0x80) and ((self._a ^ res) > 0x7f) and (self._a != 0) and (neg_value != 0)
-        if op == 3: # SBB
-            carry = 1 if self._carry else 0
-            res = self._a - value - carry
-            self._carry = res < 0 
-            neg_value = ~value + 1
-            self._half_carry = ((self._a & 0x0f) + ((neg_value - carry) & 0x0f)) > 0x0f
-            self._add_subtract = True
-            self._parity_overflow = ((self._a ^ (neg_value - carry)) < 0x80) and ((self._a ^ res) > 0x7f) and (self._a != 0) and ((neg_value - carry) != 0)
-        if op == 4: # AND
-            res = self._a & value
-        if op == 5: # XOR
-            res = self._a ^ value
-        if op == 6: # OR
-            res = self._a | value
+    # ALU operations between the accumulator and value. Each operation updates flags as a result of the
+    # operation. Operations are selected by the 3-bit op field of the opcode (see _alu_ops below)
 
+    def _alu_add(self, value):
+        a = self._a
+        res = a + value
+        self._carry = res > 0xff
+        self._half_carry = ((a & 0x0f) + (value & 0x0f)) > 0x0f
+        self._add_subtract = False
+        self._parity_overflow = ((a ^ value) < 0x80) and ((a ^ res) > 0x7f) and (a != 0) and (value != 0)
         res &= 0xff
+        self._a = res
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
 
-        # Store result for all operations, except for CMP
-        if op != 7:
-            self._a = res
-
-        # Update common flags
-        if op >= 4 and op < 7: 
-            self._carry = False
-            self._half_carry = False
-            self._parity_overflow = self._count_bits(res) % 2 == 0
-            self._add_subtract = False
-        self._zero = res == 0        
+    def _alu_adc(self, value):
+        a = self._a
+        carry = 1 if self._carry else 0
+        res = a + value + carry
+        self._carry = res > 0xff
+        self._half_carry = ((a & 0x0f) + (value & 0x0f) + carry) > 0x0f
+        self._add_subtract = False
+        self._parity_overflow = ((a ^ (value + carry)) < 0x80) and ((a ^ res) > 0x7f) and (a != 0) and (value + carry != 0)
+        res &= 0xff
+        self._a = res
+        self._zero = res == 0
         self._sign = (res & 0x80) != 0
 
+    def _alu_sub(self, value):
+        a = self._a
+        res = a - value
+        self._carry = res < 0
+        neg_value = ~value + 1
+        self._half_carry = ((a & 0x0f) + (neg_value & 0x0f)) > 0x0f
+        self._add_subtract = True
+        self._parity_overflow = ((a ^ neg_value) < 0x80) and ((a ^ res) > 0x7f) and (a != 0) and (neg_value != 0)
+        res &= 0xff
+        self._a = res
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
+
+    def _alu_sbc(self, value):
+        a = self._a
+        carry = 1 if self._carry else 0
+        res = a - value - carry
+        self._carry = res < 0
+        neg_value = ~value + 1
+        self._half_carry = ((a & 0x0f) + ((neg_value - carry) & 0x0f)) > 0x0f
+        self._add_subtract = True
+        self._parity_overflow = ((a ^ (neg_value - carry)) < 0x80) and ((a ^ res) > 0x7f) and (a != 0) and ((neg_value - carry) != 0)
+        res &= 0xff
+        self._a = res
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
+
+    def _alu_and(self, value):
+        res = self._a & value
+        self._a = res
+        self._carry = False
+        self._half_carry = False
+        self._parity_overflow = PARITY[res]
+        self._add_subtract = False
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
 
-    def _alu(self):
+    def _alu_xor(self, value):
+        res = self._a ^ value
+        self._a = res
+        self._carry = False
+        self._half_carry = False
+        self._parity_overflow = PARITY[res]
+        self._add_subtract = False
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
+
+    def _alu_or(self, value):
+        res = self._a | value
+        self._a = res
+        self._carry = False
+        self._half_carry = False
+        self._parity_overflow = PARITY[res]
+        self._add_subtract = False
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
+
+    def _alu_cp(self, value):
+        """ Same as SUB, but the result is not stored to the accumulator """
+        a = self._a
+        res = a - value
+        self._carry = res < 0
+        neg_value = ~value + 1
+        self._half_carry = ((a & 0x0f) + (neg_value & 0x0f)) > 0x0f
+        self._add_subtract = True
+        self._parity_overflow = ((a ^ neg_value) < 0x80) and ((a ^ res) > 0x7f) and (a != 0) and (neg_value != 0)
+        res &= 0xff
+        self._zero = res == 0
+        self._sign = (res & 0x80) != 0
+
+    _alu_ops = (_alu_add, _alu_adc, _alu_sub, _alu_sbc, _alu_and, _alu_xor, _alu_or, _alu_cp)
+
+
+    def _alu(self, op, reg):
         """ 
-        Implementation of the following instructions:
+        Implementation of the following instructions (operation and register index are bound in the
+        instruction table):
             - ADD - add a register to the accumulator
             - ADC - add a register to the accumulator with carry
             - SUB - subtract a register from the accumulator
@@ -1522,15 +1900,13 @@ class CPU:
             - OR  - logical OR a register with the accumulator
             - CP  - compare a register with the accumulator (set flags, but not change accumulator)
         """
-        op = (self._current_inst & 0x38) >> 3
-        reg = self._current_inst & 0x07
         value = self._get_register(reg)
 
-        self._alu_op(op, value)
+        self._alu_ops[op](self, value)
         self._cycles += 4 if reg != 6 else 7
 
-        if logger.level <= logging.DEBUG:
-            op_name = ["ADD", "ADC", "SUB", "SBC", "AND", "XOR", "OR ", "CP "][op]
+        if self._debug_logging:
+            op_name = ALU_OP_SYMBOLS[op]
             self._log_1b_instruction(f"{op_name} {self._reg_symb(reg)}")
 
 
@@ -1550,11 +1926,11 @@ class CPU:
         op = (self._current_inst & 0x38) >> 3
         value = self._fetch_next_byte()
 
-        self._alu_op(op, value)
+        self._alu_ops[op](self, value)
         self._cycles += 7
 
-        if logger.level <= logging.DEBUG:
-            op_name = ["ADD", "ADC", "SUB", "SBC", "AND", "XOR", "OR ", "CP "][op]
+        if self._debug_logging:
+            op_name = ALU_OP_SYMBOLS[op]
             self._log_2b_instruction(f"{op_name} {value:02x}")
 
 
@@ -1570,27 +1946,25 @@ class CPU:
             - CP  - compare a memory value with the accumulator (set flags, but not change accumulator)
         """
         op = (self._current_inst & 0x38) >> 3
-        addr = self._get_index_reg() + self._fetch_displacement()
-        value = self._machine.read_memory_byte(addr)
+        displacement = self._fetch_displacement()
+        addr = (self._get_index_reg() + displacement) & 0xffff
+        value = self._read_memory_byte(addr)
 
-        self._alu_op(op, value)
+        self._alu_ops[op](self, value)
         self._cycles += 19
 
-        if logger.level <= logging.DEBUG:
-            op_name = ["ADD A,", "ADC A,", "SUB", "SBC A,", "AND", "XOR", "OR", "CP"][op]
-            self._log_2b_instruction(f"{op_name} ({self._get_index_reg_symb()}{self._displacement:+03x})")
+        if self._debug_logging:
+            op_name = INDEXED_ALU_OP_SYMBOLS[op]
+            self._log_2b_instruction(f"{op_name} ({self._get_index_reg_symb()}{displacement:+03x})")
         
 
     def _inc_8bit_value(self, value):
         """ Increment a 8-bit value and update flags """
         value = (value + 1) & 0xff
 
-        self._zero = (value & 0xff) == 0
-        self._parity = self._count_bits(value) % 2 == 0
-        self._sign = (value & 0x80) != 0
-        self._half_carry = (value & 0xf) == 0x0
+        self._zero, self._sign, self._half_carry, self._parity_overflow = INC_FLAGS[value]
+        self._parity_value = value              # Parity is calculated lazily, see _get_parity_flag()
         self._add_subtract = False
-        self._parity_overflow = value == 0x80
 
         return value
 
@@ -1599,35 +1973,30 @@ class CPU:
         """ Decrement a 8-bit value and update flags """
         value = (value - 1) & 0xff
 
-        self._zero = (value & 0xff) == 0
-        self._parity = self._count_bits(value) % 2 == 0
-        self._sign = (value & 0x80) != 0
-        self._half_carry = value == 0x0f
+        self._zero, self._sign, self._half_carry, self._parity_overflow = DEC_FLAGS[value]
+        self._parity_value = value              # Parity is calculated lazily, see _get_parity_flag()
         self._add_subtract = True
-        self._parity_overflow = value == 0x7f
 
         return value
 
 
-    def _inc_reg8(self):
+    def _inc_reg8(self, reg):
         """ Increment a 8-bit register """
-        reg = (self._current_inst & 0x38) >> 3
         value = self._inc_8bit_value(self._get_register(reg))
         self._set_register(reg, value)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"INC {self._reg_symb(reg)}")
 
         self._cycles += 11 if reg == 6 else 4
 
     
-    def _dec_reg8(self):
+    def _dec_reg8(self, reg):
         """ Decrement a 8-bit register """
-        reg = (self._current_inst & 0x38) >> 3
         value = self._dec_8bit_value(self._get_register(reg))
         self._set_register(reg, value)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"DEC {self._reg_symb(reg)}")
 
         self._cycles += 11 if reg == 6 else 4
@@ -1636,12 +2005,12 @@ class CPU:
     def _inc_mem_indexed(self):
         """ Increment 8-bit value pointed by IX/IY-based index """
         displacement = self._fetch_displacement()
-        addr = self._get_index_reg() + displacement
-        value = self._machine.read_memory_byte(addr)
+        addr = (self._get_index_reg() + displacement) & 0xffff
+        value = self._read_memory_byte(addr)
         value = self._inc_8bit_value(value)
-        self._machine.write_memory_byte(addr, value)
+        self._write_memory_byte(addr, value)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"INC ({self._get_index_reg_symb()}{displacement:+03x})")
 
         self._cycles += 23
@@ -1650,59 +2019,125 @@ class CPU:
     def _dec_mem_indexed(self):
         """ Deccrement 8-bit value pointed by IX/IY-based index """
         displacement = self._fetch_displacement()
-        addr = self._get_index_reg() + displacement
-        value = self._machine.read_memory_byte(addr)
+        addr = (self._get_index_reg() + displacement) & 0xffff
+        value = self._read_memory_byte(addr)
         value = self._dec_8bit_value(value)
-        self._machine.write_memory_byte(addr, value)
+        self._write_memory_byte(addr, value)
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_2b_instruction(f"DEC ({self._get_index_reg_symb()}{displacement:+03x})")
 
         self._cycles += 23
 
 
-    def _dec16(self):
-        """ Decrement a register pair """
-        reg_pair = (self._current_inst & 0x30) >> 4
-        value = self._get_register_pair(reg_pair)
-        self._set_register_pair(reg_pair, (value - 1) & 0xffff)
+    # 16-bit increment and decrement instructions have a dedicated handler per register pair, so that
+    # the register pair is neither decoded from the opcode, nor selected at runtime
+
+    def _inc_bc(self):
+        """ Increment BC register pair """
+        value = (((self._b << 8) | self._c) + 1) & 0xffff
+        self._b = value >> 8
+        self._c = value & 0xff
         self._cycles += 6
 
-        if logger.level <= logging.DEBUG:
-            self._log_1b_instruction(f"DEC {self._reg_pair_symb(reg_pair)}")
+        if self._debug_logging:
+            self._log_1b_instruction("INC BC")
 
 
-    def _inc16(self):
-        """ Increment a register pair """
-        reg_pair = (self._current_inst & 0x30) >> 4
-        value = self._get_register_pair(reg_pair)
-        self._set_register_pair(reg_pair, (value + 1) & 0xffff)
+    def _inc_de(self):
+        """ Increment DE register pair """
+        value = (((self._d << 8) | self._e) + 1) & 0xffff
+        self._d = value >> 8
+        self._e = value & 0xff
         self._cycles += 6
 
-        if logger.level <= logging.DEBUG:
-            self._log_1b_instruction(f"INC {self._reg_pair_symb(reg_pair)}")
+        if self._debug_logging:
+            self._log_1b_instruction("INC DE")
 
 
-    def _add_hl(self):
-        """ Add register pairs """
-        reg_pair = (self._current_inst & 0x30) >> 4
+    def _inc_hl(self):
+        """ Increment HL register pair """
+        value = (((self._h << 8) | self._l) + 1) & 0xffff
+        self._h = value >> 8
+        self._l = value & 0xff
+        self._cycles += 6
+
+        if self._debug_logging:
+            self._log_1b_instruction("INC HL")
+
+
+    def _inc_sp(self):
+        """ Increment SP register """
+        self._sp = (self._sp + 1) & 0xffff
+        self._cycles += 6
+
+        if self._debug_logging:
+            self._log_1b_instruction("INC SP")
+
+
+    def _dec_bc(self):
+        """ Decrement BC register pair """
+        value = (((self._b << 8) | self._c) - 1) & 0xffff
+        self._b = value >> 8
+        self._c = value & 0xff
+        self._cycles += 6
+
+        if self._debug_logging:
+            self._log_1b_instruction("DEC BC")
+
+
+    def _dec_de(self):
+        """ Decrement DE register pair """
+        value = (((self._d << 8) | self._e) - 1) & 0xffff
+        self._d = value >> 8
+        self._e = value & 0xff
+        self._cycles += 6
+
+        if self._debug_logging:
+            self._log_1b_instruction("DEC DE")
+
+
+    def _dec_hl(self):
+        """ Decrement HL register pair """
+        value = (((self._h << 8) | self._l) - 1) & 0xffff
+        self._h = value >> 8
+        self._l = value & 0xff
+        self._cycles += 6
+
+        if self._debug_logging:
+            self._log_1b_instruction("DEC HL")
+
+
+    def _dec_sp(self):
+        """ Decrement SP register """
+        self._sp = (self._sp - 1) & 0xffff
+        self._cycles += 6
+
+        if self._debug_logging:
+            self._log_1b_instruction("DEC SP")
+
+
+    def _add_hl(self, reg_pair):
+        """ Add register pairs (register pair index is bound in the instruction table) """
+        hl = (self._h << 8) | self._l
         value = self._get_register_pair(reg_pair)
-        res = self.hl + value
+        res = hl + value
         self._carry = (res >= 0x10000)
-        self._half_carry = ((self.hl & 0x0fff) + (value & 0x0fff)) >= 0x1000
+        self._half_carry = ((hl & 0x0fff) + (value & 0x0fff)) >= 0x1000
         self._add_subtract = False
-        self.hl = res & 0xffff
+        self._h = (res >> 8) & 0xff
+        self._l = res & 0xff
 
         self._cycles += 11
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"ADD HL, {self._reg_pair_symb(reg_pair)}")
 
 
     def _adc_hl(self):
         """ Add register pairs with carry """
         reg_pair = (self._current_inst & 0x30) >> 4
-        hl = self.hl
+        hl = (self._h << 8) | self._l
         value = self._get_register_pair(reg_pair)
         carry = 1 if self._carry else 0
         res = hl + value + carry
@@ -1710,20 +2145,21 @@ class CPU:
         self._zero = (res & 0xffff) == 0
         self._parity_overflow = ((hl ^ value) < 0x8000) and ((hl ^ res) > 0x7fff) and (hl != 0) and (value != 0)
         self._carry = (res >= 0x10000)
-        self._half_carry = ((self.hl & 0x0fff) + (value & 0x0fff) + carry) >= 0x1000
+        self._half_carry = ((hl & 0x0fff) + (value & 0x0fff) + carry) >= 0x1000
         self._add_subtract = False
-        self.hl = res & 0xffff
+        self._h = (res >> 8) & 0xff
+        self._l = res & 0xff
 
         self._cycles += 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"ADC HL, {self._reg_pair_symb(reg_pair)}")
 
 
     def _sbc_hl(self):
         """ Subtract register pairs with carry """
         reg_pair = (self._current_inst & 0x30) >> 4
-        hl = self.hl
+        hl = (self._h << 8) | self._l
         value = self._get_register_pair(reg_pair)
         carry = 1 if self._carry else 0
         res = hl - value - carry
@@ -1732,13 +2168,14 @@ class CPU:
         self._zero = (res & 0xffff) == 0
         self._parity_overflow = ((hl ^ neg_value) < 0x8000) and ((hl ^ res) > 0x7fff) and (hl != 0) and (neg_value != 0)
         self._carry = res < 0
-        self._half_carry = ((self.hl & 0x0fff) + (neg_value & 0x0fff) + carry) >= 0x1000
+        self._half_carry = ((hl & 0x0fff) + (neg_value & 0x0fff) + carry) >= 0x1000
         self._add_subtract = True
-        self.hl = res & 0xffff
+        self._h = (res >> 8) & 0xff
+        self._l = res & 0xff
 
         self._cycles += 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"SBC HL, {self._reg_pair_symb(reg_pair)}")
 
 
@@ -1756,7 +2193,7 @@ class CPU:
 
         self._cycles += 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             reg_symb = self._reg_pair_symb(reg_pair) if reg_pair != 2 else self._get_index_reg_symb()
             self._log_1b_instruction(f"ADD {self._get_index_reg_symb()}, {reg_symb}")
 
@@ -1772,12 +2209,11 @@ class CPU:
 
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RLCA")
 
-    def _rlc_reg(self):
+    def _rlc_reg(self, reg):
         """ Rotate register left """
-        reg = self._current_inst & 0x07
         value = self._get_register(reg)
         self._carry = is_bit_set(value, 7)
         value = ((value << 1) & 0xff) | (value >> 7)
@@ -1785,13 +2221,13 @@ class CPU:
 
         self._sign = (value & 0x80) != 0        # RLC r instruction sets more flags than RLCA
         self._zero = value == 0
-        self._parity = self._count_bits(value) % 2 == 0
+        self._parity_value = value              # Parity is calculated lazily, see _get_parity_flag()
         self._half_carry = False
         self._add_subtract = False
 
         self._cycles += 8 if reg != 6 else 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RLC {self._reg_symb(reg)}")
 
 
@@ -1804,13 +2240,12 @@ class CPU:
 
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RRCA")
 
 
-    def _rrc_reg(self):
+    def _rrc_reg(self, reg):
         """ Rotate register right """
-        reg = self._current_inst & 0x07
         value = self._get_register(reg)
         self._carry = is_bit_set(value, 0)
         value = ((value >> 1) & 0xff) | ((value << 7) & 0xff)
@@ -1818,13 +2253,13 @@ class CPU:
 
         self._sign = (value & 0x80) != 0        # RLC r instruction sets more flags than RLCA
         self._zero = value == 0
-        self._parity = self._count_bits(value) % 2 == 0
+        self._parity_value = value              # Parity is calculated lazily, see _get_parity_flag()
         self._half_carry = False
         self._add_subtract = False
 
         self._cycles += 8 if reg != 6 else 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RRC {self._reg_symb(reg)}")
 
 
@@ -1836,13 +2271,12 @@ class CPU:
         self._carry = is_bit_set(temp, 7)
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RLA")
 
 
-    def _rl_reg(self):
+    def _rl_reg(self, reg):
         """ Rotate register left through carry """
-        reg = self._current_inst & 0x07
         value = self._get_register(reg)
 
         temp = value
@@ -1852,11 +2286,11 @@ class CPU:
         self._carry = is_bit_set(temp, 7)
         self._sign = (value & 0x80) != 0
         self._zero = value == 0
-        self._parity = self._count_bits(value) % 2 == 0
+        self._parity_value = value              # Parity is calculated lazily, see _get_parity_flag()
 
         self._cycles += 8 if reg != 6 else 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RL {self._reg_symb(reg)}")
 
 
@@ -1868,13 +2302,12 @@ class CPU:
         self._carry = is_bit_set(temp, 0)
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RRA")
 
 
-    def _rr_reg(self):
+    def _rr_reg(self, reg):
         """ Rotate register right through carry """
-        reg = self._current_inst & 0x07
         value = self._get_register(reg)
 
         temp = value
@@ -1884,17 +2317,16 @@ class CPU:
         self._carry = is_bit_set(temp, 0)
         self._sign = (value & 0x80) != 0
         self._zero = value == 0
-        self._parity = self._count_bits(value) % 2 == 0
+        self._parity_value = value              # Parity is calculated lazily, see _get_parity_flag()
 
         self._cycles += 8 if reg != 6 else 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"RR {self._reg_symb(reg)}")
 
 
-    def _srl(self):
+    def _srl(self, reg):
         """ Shift Right Logical """
-        reg = self._current_inst & 0x07
         value = self._get_register(reg)
         self._carry = is_bit_set(value, 0)
         value >>= 1
@@ -1902,13 +2334,13 @@ class CPU:
 
         self._sign = False
         self._zero = value == 0
-        self._parity_overflow = self._count_bits(value) % 2 == 0
+        self._parity_overflow = PARITY[value]
         self._half_carry = False
         self._add_subtract = False
 
         self._cycles += 8 if reg != 6 else 15
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"SRL {self._reg_symb(reg)}")
 
 
@@ -1921,7 +2353,7 @@ class CPU:
         self._half_carry = True
         self._add_subtract = True
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"CPL")
 
 
@@ -1937,7 +2369,7 @@ class CPU:
         self._add_subtract = True
         self._a = res & 0xff
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"NEG")
 
 
@@ -1946,7 +2378,7 @@ class CPU:
         self._carry = True
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"SCF")
         
 
@@ -1956,2043 +2388,510 @@ class CPU:
         self._carry = not self._carry
         self._cycles += 4
 
-        if logger.level <= logging.DEBUG:
+        if self._debug_logging:
             self._log_1b_instruction(f"CCF")
 
 
-    def _get_bit(self):
-        """ Get bit from a register """
-        bit = (self._current_inst & 0x38) >> 3
-        mask = 1 << bit
-        reg = self._current_inst & 0x07
+    def _get_bit(self, reg, mask):
+        """ Get bit from a register (register index and bit mask are bound in the instruction table) """
         value = self._get_register(reg)
 
         self._zero = (value & mask == 0)
 
-        self._cycles += 12 if reg == 6 else 8
+        self._cycles += 8
+        
+        if self._debug_logging:
+            self._log_1b_instruction(f"BIT {mask.bit_length() - 1}, {self._reg_symb(reg)}")
+
+
+    def _get_bit_hl(self, mask):
+        """ Get bit from a memory byte addressed by HL """
+        value = self._read_memory_byte((self._h << 8) | self._l)
+
+        self._zero = (value & mask == 0)
+
+        self._cycles += 12
         
-        if logger.level <= logging.DEBUG:
-            self._log_1b_instruction(f"BIT {bit}, {self._reg_symb(reg)}")
+        if self._debug_logging:
+            self._log_1b_instruction(f"BIT {mask.bit_length() - 1}, (HL)")
 
 
-    def _get_bit_indexed(self):
-        """ Get bit from a memory byte addressed via IX/IY index registers """
-        bit = (self._current_inst & 0x38) >> 3
-        mask = 1 << bit
-        addr = self._get_index_reg() + self._displacement
+    def _get_bit_indexed(self, mask):
+        """ Get bit from a memory byte addressed via IX/IY index registers (bit mask is bound in the instruction table) """
+        addr = (self._get_index_reg() + self._displacement) & 0xffff
 
-        value = self._machine.read_memory_byte(addr)
+        value = self._read_memory_byte(addr)
         self._zero = (value & mask == 0)
 
         self._cycles += 20
         
-        if logger.level <= logging.DEBUG:
-            self._log_3b_bit_instruction(f"BIT {bit}, ({self._get_index_reg_symb()}{self._displacement:+03x})")
+        if self._debug_logging:
+            self._log_3b_bit_instruction(f"BIT {mask.bit_length() - 1}, ({self._get_index_reg_symb()}{self._displacement:+03x})")
 
 
-    def _set_bit(self):
-        """ Set bit in a register """
-        bit = (self._current_inst & 0x38) >> 3
-        mask = 1 << bit
-        reg = self._current_inst & 0x07
+    def _set_bit(self, reg, mask):
+        """ Set bit in a register (register index and bit mask are bound in the instruction table) """
         value = self._get_register(reg)
         self._set_register(reg, value | mask)
 
-        self._cycles += 15 if reg == 6 else 8
+        self._cycles += 8
+        
+        if self._debug_logging:
+            self._log_1b_instruction(f"SET {mask.bit_length() - 1}, {self._reg_symb(reg)}")
+
+
+    def _set_bit_hl(self, mask):
+        """ Set bit on a memory byte addressed by HL. The address is calculated once for read and write """
+        addr = (self._h << 8) | self._l
+        self._write_memory_byte(addr, self._read_memory_byte(addr) | mask)
+
+        self._cycles += 15
         
-        if logger.level <= logging.DEBUG:
-            self._log_3b_bit_instruction(f"SET {bit}, {self._reg_symb(reg)}")
+        if self._debug_logging:
+            self._log_1b_instruction(f"SET {mask.bit_length() - 1}, (HL)")
 
 
-    def _set_bit_indexed(self):
-        """ Set bit on a memory byte addressed via IX/IY index registers """
-        bit = (self._current_inst & 0x38) >> 3
-        mask = 1 << bit
-        addr = self._get_index_reg() + self._displacement
+    def _set_bit_indexed(self, mask):
+        """ Set bit on a memory byte addressed via IX/IY index registers (bit mask is bound in the instruction table) """
+        addr = (self._get_index_reg() + self._displacement) & 0xffff
 
-        value = self._machine.read_memory_byte(addr)
-        self._machine.write_memory_byte(addr, value | mask)
+        value = self._read_memory_byte(addr)
+        self._write_memory_byte(addr, value | mask)
 
         self._cycles += 23
         
-        if logger.level <= logging.DEBUG:
-            self._log_3b_bit_instruction(f"SET {bit}, ({self._get_index_reg_symb()}{self._displacement:+03x})")
+        if self._debug_logging:
+            self._log_3b_bit_instruction(f"SET {mask.bit_length() - 1}, ({self._get_index_reg_symb()}{self._displacement:+03x})")
 
 
-    def _reset_bit(self):
-        """ Reset bit in a register """
-        bit = (self._current_inst & 0x38) >> 3
-        mask = 1 << bit
-        reg = self._current_inst & 0x07
+    def _reset_bit(self, reg, mask):
+        """ Reset bit in a register (register index and inverted bit mask are bound in the instruction table) """
         value = self._get_register(reg)
-        self._set_register(reg, value & ~mask)
+        self._set_register(reg, value & mask)
 
-        self._cycles += 15 if reg == 6 else 8
+        self._cycles += 8
         
-        if logger.level <= logging.DEBUG:
-            self._log_3b_bit_instruction(f"RES {bit}, {self._reg_symb(reg)}")
+        if self._debug_logging:
+            self._log_1b_instruction(f"RES {(mask ^ 0xff).bit_length() - 1}, {self._reg_symb(reg)}")
+
+
+    def _reset_bit_hl(self, mask):
+        """ Reset bit on a memory byte addressed by HL (mask is inverted). The address is calculated once for read and write """
+        addr = (self._h << 8) | self._l
+        self._write_memory_byte(addr, self._read_memory_byte(addr) & mask)
 
+        self._cycles += 15
+        
+        if self._debug_logging:
+            self._log_1b_instruction(f"RES {(mask ^ 0xff).bit_length() - 1}, (HL)")
 
-    def _reset_bit_indexed(self):
-        """ Reset bit on a memory byte addressed via IX/IY index registers """
 
-        bit = (self._current_inst & 0x38) >> 3
-        mask = 1 << bit
-        addr = self._get_index_reg() + self._displacement
+    def _reset_bit_indexed(self, mask):
+        """ Reset bit on a memory byte addressed via IX/IY index registers (inverted bit mask is bound in the instruction table) """
+        addr = (self._get_index_reg() + self._displacement) & 0xffff
 
-        value = self._machine.read_memory_byte(addr)
-        self._machine.write_memory_byte(addr, value & ~mask)
+        value = self._read_memory_byte(addr)
+        self._write_memory_byte(addr, value & mask)
 
         self._cycles += 23
         
-        if logger.level <= logging.DEBUG:
-            self._log_3b_bit_instruction(f"RES {bit}, ({self._get_index_reg_symb()}{self._displacement:+03x})")
+        if self._debug_logging:
+            self._log_3b_bit_instruction(f"RES {(mask ^ 0xff).bit_length() - 1}, ({self._get_index_reg_symb()}{self._displacement:+03x})")
 
 
     # Instruction tables
 
-    def _init_instruction_table(self):
+    @classmethod
+    def _init_instruction_tables(cls):
+        """
+        Initialize instruction tables. Handlers are stored as plain functions, so the tables are built once
+        when the module is loaded, and shared between all CPU instances as class attributes.
+        """
+        cls._init_instruction_table()       # Main instruction set
+        cls._init_ed_instruction_table()    # Additional instruction set
+        cls._init_cb_instruction_table()    # Bit instructions
+        cls._init_dd_instruction_table()    # IX and IY instructions
+        cls._init_dispatch_table()          # Flat table of all the above
+
+
+    @classmethod
+    def _init_instruction_table(cls):
         """ Initialize main instruction set """
 
-        self._instructions = [None] * 0x100
-
-        self._instructions[0x00] = self._nop                    # NOP
-        self._instructions[0x01] = self._load_immediate_16b     # LD BC, nn
-        self._instructions[0x02] = self._ld_mem_regpair_a       # LD (BC), A
-        self._instructions[0x03] = self._inc16                  # INC BC
-        self._instructions[0x04] = self._inc_reg8               # INC B
-        self._instructions[0x05] = self._dec_reg8               # DEC B
-        self._instructions[0x06] = self._load_reg8_immediate    # LD B, n
-        self._instructions[0x07] = self._rlca                   # RLCA
-        self._instructions[0x08] = self._exchange_af_afx        # EX AF, AF'
-        self._instructions[0x09] = self._add_hl                 # ADD HL, BC
-        self._instructions[0x0a] = self._ld_a_mem_regpair       # LD A, (BC)
-        self._instructions[0x0b] = self._dec16                  # DEC BC
-        self._instructions[0x0c] = self._inc_reg8               # INC C
-        self._instructions[0x0d] = self._dec_reg8               # DEC C
-        self._instructions[0x0e] = self._load_reg8_immediate    # LD C, n
-        self._instructions[0x0f] = self._rrca                   # RRCA
-
-        self._instructions[0x10] = self._djnz                   # DJNZ d
-        self._instructions[0x11] = self._load_immediate_16b     # LD DE, nn
-        self._instructions[0x12] = self._ld_mem_regpair_a       # LD (DE), A
-        self._instructions[0x13] = self._inc16                  # INC DE
-        self._instructions[0x14] = self._inc_reg8               # INC D
-        self._instructions[0x15] = self._dec_reg8               # DEC D
-        self._instructions[0x16] = self._load_reg8_immediate    # LD D, n
-        self._instructions[0x17] = self._rla                    # RLA
-        self._instructions[0x18] = self._jr                     # JR d
-        self._instructions[0x19] = self._add_hl                 # ADD HL, DE
-        self._instructions[0x1a] = self._ld_a_mem_regpair       # LD A, (DE)
-        self._instructions[0x1b] = self._dec16                  # DEC DE
-        self._instructions[0x1c] = self._inc_reg8               # INC E
-        self._instructions[0x1d] = self._dec_reg8               # DEC E
-        self._instructions[0x1e] = self._load_reg8_immediate    # LD E, n
-        self._instructions[0x1f] = self._rra                    # RRA
-
-        self._instructions[0x20] = self._jr_cond                # JR NZ, d
-        self._instructions[0x21] = self._load_immediate_16b     # LD HL, nn
-        self._instructions[0x22] = self._store_hl_to_memory     # LD (nn), HL
-        self._instructions[0x23] = self._inc16                  # INC HL
-        self._instructions[0x24] = self._inc_reg8               # INC H
-        self._instructions[0x25] = self._dec_reg8               # DEC H
-        self._instructions[0x26] = self._load_reg8_immediate    # LD H, n
-        self._instructions[0x27] = None                         # DAA
-        self._instructions[0x28] = self._jr_cond                # JR Z, d
-        self._instructions[0x29] = self._add_hl                 # ADD HL, HL
-        self._instructions[0x2a] = self._load_hl_from_memory    # LD HL, (nn)
-        self._instructions[0x2b] = self._dec16                  # DEC HL
-        self._instructions[0x2c] = self._inc_reg8               # INC L
-        self._instructions[0x2d] = self._dec_reg8               # DEC L
-        self._instructions[0x2e] = self._load_reg8_immediate    # LD L, n
-        self._instructions[0x2f] = self._cpl                    # CPL
-
-        self._instructions[0x30] = self._jr_cond                # JR JC, d
-        self._instructions[0x31] = self._load_immediate_16b     # LD SP, nn
-        self._instructions[0x32] = self._store_a_to_mem         # LD (nn), A
-        self._instructions[0x33] = self._inc16                  # INC SP
-        self._instructions[0x34] = self._inc_reg8               # INC (HL)
-        self._instructions[0x35] = self._dec_reg8               # DEC (HL)
-        self._instructions[0x36] = self._load_reg8_immediate    # LD (HL), n
-        self._instructions[0x37] = self._scf                    # SCF
-        self._instructions[0x38] = self._jr_cond                # JR C, d
-        self._instructions[0x39] = self._add_hl                 # ADD HL, SP
-        self._instructions[0x3a] = self._load_a_from_mem        # LD A, (nn)
-        self._instructions[0x3b] = self._dec16                  # DEC SP
-        self._instructions[0x3c] = self._inc_reg8               # INC A
-        self._instructions[0x3d] = self._dec_reg8               # DEC A
-        self._instructions[0x3e] = self._load_reg8_immediate    # LD A, n
-        self._instructions[0x3f] = self._ccf                    # CCF
-
-        self._instructions[0x40] = self._load_reg8_to_reg8      # LD B, B
-        self._instructions[0x41] = self._load_reg8_to_reg8      # LD B, C
-        self._instructions[0x42] = self._load_reg8_to_reg8      # LD B, D
-        self._instructions[0x43] = self._load_reg8_to_reg8      # LD B, E
-        self._instructions[0x44] = self._load_reg8_to_reg8      # LD B, H
-        self._instructions[0x45] = self._load_reg8_to_reg8      # LD B, L
-        self._instructions[0x46] = self._load_reg8_to_reg8      # LD B, (HL)
-        self._instructions[0x47] = self._load_reg8_to_reg8      # LD B, A
-        self._instructions[0x48] = self._load_reg8_to_reg8      # LD C, B
-        self._instructions[0x49] = self._load_reg8_to_reg8      # LD C, C
-        self._instructions[0x4a] = self._load_reg8_to_reg8      # LD C, D
-        self._instructions[0x4b] = self._load_reg8_to_reg8      # LD C, E
-        self._instructions[0x4c] = self._load_reg8_to_reg8      # LD C, H
-        self._instructions[0x4d] = self._load_reg8_to_reg8      # LD C, L
-        self._instructions[0x4e] = self._load_reg8_to_reg8      # LD C, (HL)
-        self._instructions[0x4f] = self._load_reg8_to_reg8      # LD C, A
-
-        self._instructions[0x50] = self._load_reg8_to_reg8      # LD D, B
-        self._instructions[0x51] = self._load_reg8_to_reg8      # LD D, C
-        self._instructions[0x52] = self._load_reg8_to_reg8      # LD D, D
-        self._instructions[0x53] = self._load_reg8_to_reg8      # LD D, E
-        self._instructions[0x54] = self._load_reg8_to_reg8      # LD D, H
-        self._instructions[0x55] = self._load_reg8_to_reg8      # LD D, L
-        self._instructions[0x56] = self._load_reg8_to_reg8      # LD D, (HL)
-        self._instructions[0x57] = self._load_reg8_to_reg8      # LD D, A
-        self._instructions[0x58] = self._load_reg8_to_reg8      # LD E, B
-        self._instructions[0x59] = self._load_reg8_to_reg8      # LD E, C
-        self._instructions[0x5a] = self._load_reg8_to_reg8      # LD E, D
-        self._instructions[0x5b] = self._load_reg8_to_reg8      # LD E, E
-        self._instructions[0x5c] = self._load_reg8_to_reg8      # LD E, H
-        self._instructions[0x5d] = self._load_reg8_to_reg8      # LD E, L
-        self._instructions[0x5e] = self._load_reg8_to_reg8      # LD E, (HL)
-        self._instructions[0x5f] = self._load_reg8_to_reg8      # LD E, A
-
-        self._instructions[0x60] = self._load_reg8_to_reg8      # LD H, B
-        self._instructions[0x61] = self._load_reg8_to_reg8      # LD H, C
-        self._instructions[0x62] = self._load_reg8_to_reg8      # LD H, D
-        self._instructions[0x63] = self._load_reg8_to_reg8      # LD H, E
-        self._instructions[0x64] = self._load_reg8_to_reg8      # LD H, H
-        self._instructions[0x65] = self._load_reg8_to_reg8      # LD H, L
-        self._instructions[0x66] = self._load_reg8_to_reg8      # LD H, (HL)
-        self._instructions[0x67] = self._load_reg8_to_reg8      # LD H, A
-        self._instructions[0x68] = self._load_reg8_to_reg8      # LD L, B
-        self._instructions[0x69] = self._load_reg8_to_reg8      # LD L, C
-        self._instructions[0x6a] = self._load_reg8_to_reg8      # LD L, D
-        self._instructions[0x6b] = self._load_reg8_to_reg8      # LD L, E
-        self._instructions[0x6c] = self._load_reg8_to_reg8      # LD L, H
-        self._instructions[0x6d] = self._load_reg8_to_reg8      # LD L, L
-        self._instructions[0x6e] = self._load_reg8_to_reg8      # LD L, (HL)
-        self._instructions[0x6f] = self._load_reg8_to_reg8      # LD L, A
-
-        self._instructions[0x70] = self._load_reg8_to_reg8      # LD (HL), B
-        self._instructions[0x71] = self._load_reg8_to_reg8      # LD (HL), C
-        self._instructions[0x72] = self._load_reg8_to_reg8      # LD (HL), D
-        self._instructions[0x73] = self._load_reg8_to_reg8      # LD (HL), E
-        self._instructions[0x74] = self._load_reg8_to_reg8      # LD (HL), H
-        self._instructions[0x75] = self._load_reg8_to_reg8      # LD (HL), L
-        self._instructions[0x76] = None                         # HALT
-        self._instructions[0x77] = self._load_reg8_to_reg8      # LD (HL), A
-        self._instructions[0x78] = self._load_reg8_to_reg8      # LD A, B
-        self._instructions[0x79] = self._load_reg8_to_reg8      # LD A, C
-        self._instructions[0x7a] = self._load_reg8_to_reg8      # LD A, D
-        self._instructions[0x7b] = self._load_reg8_to_reg8      # LD A, E
-        self._instructions[0x7c] = self._load_reg8_to_reg8      # LD A, H
-        self._instructions[0x7d] = self._load_reg8_to_reg8      # LD A, L
-        self._instructions[0x7e] = self._load_reg8_to_reg8      # LD A, (HL)
-        self._instructions[0x7f] = self._load_reg8_to_reg8      # LD A, A
-
-        self._instructions[0x80] = self._alu                    # ADD A, B
-        self._instructions[0x81] = self._alu                    # ADD A, C
-        self._instructions[0x82] = self._alu                    # ADD A, D
-        self._instructions[0x83] = self._alu                    # ADD A, E
-        self._instructions[0x84] = self._alu                    # ADD A, H
-        self._instructions[0x85] = self._alu                    # ADD A, L
-        self._instructions[0x86] = self._alu                    # ADD A, (HL)
-        self._instructions[0x87] = self._alu                    # ADD A, A
-        self._instructions[0x88] = self._alu                    # ADC A, B
-        self._instructions[0x89] = self._alu                    # ADC A, C
-        self._instructions[0x8a] = self._alu                    # ADC A, D
-        self._instructions[0x8b] = self._alu                    # ADC A, E
-        self._instructions[0x8c] = self._alu                    # ADC A, H
-        self._instructions[0x8d] = self._alu                    # ADC A, L
-        self._instructions[0x8e] = self._alu                    # ADC A, (HL)
-        self._instructions[0x8f] = self._alu                    # ADC A, A
-
-        self._instructions[0x90] = self._alu                    # SUB B
-        self._instructions[0x91] = self._alu                    # SUB C
-        self._instructions[0x92] = self._alu                    # SUB D
-        self._instructions[0x93] = self._alu                    # SUB E
-        self._instructions[0x94] = self._alu                    # SUB H
-        self._instructions[0x95] = self._alu                    # SUB L
-        self._instructions[0x96] = self._alu                    # SUB (HL)
-        self._instructions[0x97] = self._alu                    # SUB A
-        self._instructions[0x98] = self._alu                    # SBC A, B
-        self._instructions[0x99] = self._alu                    # SBC A, C
-        self._instructions[0x9a] = self._alu                    # SBC A, D
-        self._instructions[0x9b] = self._alu                    # SBC A, E
-        self._instructions[0x9c] = self._alu                    # SBC A, H
-        self._instructions[0x9d] = self._alu                    # SBC A, L
-        self._instructions[0x9e] = self._alu                    # SBC A, (HL)
-        self._instructions[0x9f] = self._alu                    # SBC A, A
-
-        self._instructions[0xa0] = self._alu                    # AND B
-        self._instructions[0xa1] = self._alu                    # AND C
-        self._instructions[0xa2] = self._alu                    # AND D
-        self._instructions[0xa3] = self._alu                    # AND E
-        self._instructions[0xa4] = self._alu                    # AND H
-        self._instructions[0xa5] = self._alu                    # AND L
-        self._instructions[0xa6] = self._alu                    # AND (HL)
-        self._instructions[0xa7] = self._alu                    # AND A
-        self._instructions[0xa8] = self._alu                    # XOR B
-        self._instructions[0xa9] = self._alu                    # XOR C
-        self._instructions[0xaa] = self._alu                    # XOR D
-        self._instructions[0xab] = self._alu                    # XOR E
-        self._instructions[0xac] = self._alu                    # XOR H
-        self._instructions[0xad] = self._alu                    # XOR L
-        self._instructions[0xae] = self._alu                    # XOR (HL)
-        self._instructions[0xaf] = self._alu                    # XOR A
-
-        self._instructions[0xb0] = self._alu                    # OR B
-        self._instructions[0xb1] = self._alu                    # OR C
-        self._instructions[0xb2] = self._alu                    # OR D
-        self._instructions[0xb3] = self._alu                    # OR E
-        self._instructions[0xb4] = self._alu                    # OR H
-        self._instructions[0xb5] = self._alu                    # OR L
-        self._instructions[0xb6] = self._alu                    # OR (HL)
-        self._instructions[0xb7] = self._alu                    # OR A
-        self._instructions[0xb8] = self._alu                    # CP B
-        self._instructions[0xb9] = self._alu                    # CP C
-        self._instructions[0xba] = self._alu                    # CP D
-        self._instructions[0xbb] = self._alu                    # CP E
-        self._instructions[0xbc] = self._alu                    # CP H
-        self._instructions[0xbd] = self._alu                    # CP L
-        self._instructions[0xbe] = self._alu                    # CP (HL)
-        self._instructions[0xbf] = self._alu                    # CP A
-
-        self._instructions[0xc0] = self._ret_cond               # RET NZ
-        self._instructions[0xc1] = self._pop                    # POP BC
-        self._instructions[0xc2] = self._jmp_cond               # JP NZ, nn
-        self._instructions[0xc3] = self._jp                     # JP nn
-        self._instructions[0xc4] = self._call_cond              # CALL NZ, nn
-        self._instructions[0xc5] = self._push                   # PUSH BC
-        self._instructions[0xc6] = self._alu_immediate          # ADD A, n
-        self._instructions[0xc7] = self._rst                    # RST 00
-        self._instructions[0xc8] = self._ret_cond               # RET Z
-        self._instructions[0xc9] = self._ret                    # RET
-        self._instructions[0xca] = self._jmp_cond               # JP Z, nn
-        self._instructions[0xcb] = None                         # Bit instruction set
-        self._instructions[0xcc] = self._call_cond              # CALL Z, nn
-        self._instructions[0xcd] = self._call                   # CALL nn
-        self._instructions[0xce] = self._alu_immediate          # ADC A, n
-        self._instructions[0xcf] = self._rst                    # RST 08
-
-        self._instructions[0xd0] = self._ret_cond               # RET NC
-        self._instructions[0xd1] = self._pop                    # POP DE
-        self._instructions[0xd2] = self._jmp_cond               # JP NC, nn
-        self._instructions[0xd3] = self._out                    # OUT (n), A
-        self._instructions[0xd4] = self._call_cond              # CALL NC, nn
-        self._instructions[0xd5] = self._push                   # PUSH DE
-        self._instructions[0xd6] = self._alu_immediate          # SUB n
-        self._instructions[0xd7] = self._rst                    # RST 10
-        self._instructions[0xd8] = self._ret_cond               # RET C
-        self._instructions[0xd9] = self._exchange_register_set  # EXX
-        self._instructions[0xda] = self._jmp_cond               # JP C, nn
-        self._instructions[0xdb] = self._in                     # IN A, (n)
-        self._instructions[0xdc] = self._call_cond              # CALL C, nn
-        self._instructions[0xdd] = None                         # IX instructions set
-        self._instructions[0xde] = self._alu_immediate          # SBC A, n
-        self._instructions[0xdf] = self._rst                    # RST 18
-
-        self._instructions[0xe0] = self._ret_cond               # RET PO
-        self._instructions[0xe1] = self._pop                    # POP HL
-        self._instructions[0xe2] = self._jmp_cond               # JP PO, nn
-        self._instructions[0xe3] = self._exchange_hl_stack      # EX (SP), HL
-        self._instructions[0xe4] = self._call_cond              # CALL PO, nn
-        self._instructions[0xe5] = self._push                   # PUSH HL
-        self._instructions[0xe6] = self._alu_immediate          # AND n
-        self._instructions[0xe7] = self._rst                    # RST 20
-        self._instructions[0xe8] = self._ret_cond               # RET PE
-        self._instructions[0xe9] = self._jp_hl                  # JP (HL)
-        self._instructions[0xea] = self._jmp_cond               # JP PE, nn
-        self._instructions[0xeb] = self._exchange_de_hl         # EX DE, HL
-        self._instructions[0xec] = self._call_cond              # CALL PE, nn
-        self._instructions[0xed] = None                         # Advanced instruction set
-        self._instructions[0xee] = self._alu_immediate          # XOR n
-        self._instructions[0xef] = self._rst                    # RST 28
-
-        self._instructions[0xf0] = self._ret_cond               # RET P
-        self._instructions[0xf1] = self._pop                    # POP AF
-        self._instructions[0xf2] = self._jmp_cond               # JP P, nn
-        self._instructions[0xf3] = self._di                     # DI
-        self._instructions[0xf4] = self._call_cond              # CALL P, nn
-        self._instructions[0xf5] = self._push                   # PUSH AF
-        self._instructions[0xf6] = self._alu_immediate          # OR n
-        self._instructions[0xf7] = self._rst                    # RST 30
-        self._instructions[0xf8] = self._ret_cond               # RET M
-        self._instructions[0xf9] = self._ld_sp_hl               # LD SP, HL
-        self._instructions[0xfa] = self._jmp_cond               # JP M, nn
-        self._instructions[0xfb] = self._ei                     # EI
-        self._instructions[0xfc] = self._call_cond              # CALL M, nn
-        self._instructions[0xfd] = None                         # IY instruction set
-        self._instructions[0xfe] = self._alu_immediate          # CP n
-        self._instructions[0xff] = self._rst                    # RST 38
-
-
-    def _init_ed_instruction_table(self):
+        cls._instructions = [None] * 0x100
+
+        cls._instructions[0x00] = CPU._nop                    # NOP
+        cls._instructions[0x01] = bind_operands(CPU._load_immediate_16b, 0)  # LD BC, nn
+        cls._instructions[0x02] = CPU._ld_mem_regpair_a       # LD (BC), A
+        cls._instructions[0x03] = CPU._inc_bc                 # INC BC
+        cls._instructions[0x07] = CPU._rlca                   # RLCA
+        cls._instructions[0x08] = CPU._exchange_af_afx        # EX AF, AF'
+        cls._instructions[0x09] = bind_operands(CPU._add_hl, 0)   # ADD HL, BC
+        cls._instructions[0x0a] = CPU._ld_a_mem_regpair       # LD A, (BC)
+        cls._instructions[0x0b] = CPU._dec_bc                 # DEC BC
+        cls._instructions[0x0f] = CPU._rrca                   # RRCA
+
+        cls._instructions[0x10] = CPU._djnz                   # DJNZ d
+        cls._instructions[0x11] = bind_operands(CPU._load_immediate_16b, 1)  # LD DE, nn
+        cls._instructions[0x12] = CPU._ld_mem_regpair_a       # LD (DE), A
+        cls._instructions[0x13] = CPU._inc_de                 # INC DE
+        cls._instructions[0x17] = CPU._rla                    # RLA
+        cls._instructions[0x18] = CPU._jr                     # JR d
+        cls._instructions[0x19] = bind_operands(CPU._add_hl, 1)   # ADD HL, DE
+        cls._instructions[0x1a] = CPU._ld_a_mem_regpair       # LD A, (DE)
+        cls._instructions[0x1b] = CPU._dec_de                 # DEC DE
+        cls._instructions[0x1f] = CPU._rra                    # RRA
+
+        cls._instructions[0x20] = bind_operands(CPU._jr_cond, 0)   # JR NZ, d
+        cls._instructions[0x21] = bind_operands(CPU._load_immediate_16b, 2)  # LD HL, nn
+        cls._instructions[0x22] = CPU._store_hl_to_memory     # LD (nn), HL
+        cls._instructions[0x23] = CPU._inc_hl                 # INC HL
+        cls._instructions[0x27] = None                         # DAA
+        cls._instructions[0x28] = bind_operands(CPU._jr_cond, 1)   # JR Z, d
+        cls._instructions[0x29] = bind_operands(CPU._add_hl, 2)   # ADD HL, HL
+        cls._instructions[0x2a] = CPU._load_hl_from_memory    # LD HL, (nn)
+        cls._instructions[0x2b] = CPU._dec_hl                 # DEC HL
+        cls._instructions[0x2f] = CPU._cpl                    # CPL
+
+        cls._instructions[0x30] = bind_operands(CPU._jr_cond, 2)   # JR JC, d
+        cls._instructions[0x31] = bind_operands(CPU._load_immediate_16b, 3)  # LD SP, nn
+        cls._instructions[0x32] = CPU._store_a_to_mem         # LD (nn), A
+        cls._instructions[0x33] = CPU._inc_sp                 # INC SP
+        cls._instructions[0x37] = CPU._scf                    # SCF
+        cls._instructions[0x38] = bind_operands(CPU._jr_cond, 3)   # JR C, d
+        cls._instructions[0x39] = bind_operands(CPU._add_hl, 3)   # ADD HL, SP
+        cls._instructions[0x3a] = CPU._load_a_from_mem        # LD A, (nn)
+        cls._instructions[0x3b] = CPU._dec_sp                 # DEC SP
+        cls._instructions[0x3f] = CPU._ccf                    # CCF
+
+        # INC r, DEC r, and LD r, n instructions are encoded as [00][reg:3][op:3]. Register index is bound to
+        # the handler once here, so that handlers do not need to decode the opcode at runtime.
+        for reg in range(8):
+            cls._instructions[0x04 | (reg << 3)] = bind_operands(CPU._inc_reg8, reg)                # INC r
+            cls._instructions[0x05 | (reg << 3)] = bind_operands(CPU._dec_reg8, reg)                # DEC r
+            cls._instructions[0x06 | (reg << 3)] = bind_operands(CPU._load_reg8_immediate, reg)     # LD r, n
+
+        # LD r, r' and ALU instructions are encoded as [op:2][dst/op:3][src:3]. Register indexes and ALU operation
+        # are bound to the handler once here, so that handlers do not need to decode the opcode at runtime.
+        # Moves between 2 registers get a dedicated generated handler, (HL) operand variants use a generic one
+        for dst in range(8):
+            for src in range(8):
+                if dst == 6 and src == 6:
+                    continue
+                if dst == 6 or src == 6:
+                    cls._instructions[0x40 | (dst << 3) | src] = bind_operands(CPU._load_reg8_to_reg8, dst, src)  # LD r, (HL) / LD (HL), r
+                else:
+                    cls._instructions[0x40 | (dst << 3) | src] = make_register_move_handler(dst, src)               # LD r, r'
+
+        cls._instructions[0x76] = None                         # HALT
+
+        for op in range(8):
+            for reg in range(8):
+                cls._instructions[0x80 | (op << 3) | reg] = bind_operands(CPU._alu, op, reg)   # ADD/ADC/SUB/SBC/AND/XOR/OR/CP r
+
+        cls._instructions[0xc0] = CPU._ret_cond               # RET NZ
+        cls._instructions[0xc1] = CPU._pop                    # POP BC
+        cls._instructions[0xc2] = CPU._jmp_cond               # JP NZ, nn
+        cls._instructions[0xc3] = CPU._jp                     # JP nn
+        cls._instructions[0xc4] = CPU._call_cond              # CALL NZ, nn
+        cls._instructions[0xc5] = CPU._push                   # PUSH BC
+        cls._instructions[0xc6] = CPU._alu_immediate          # ADD A, n
+        cls._instructions[0xc7] = CPU._rst                    # RST 00
+        cls._instructions[0xc8] = CPU._ret_cond               # RET Z
+        cls._instructions[0xc9] = CPU._ret                    # RET
+        cls._instructions[0xca] = CPU._jmp_cond               # JP Z, nn
+        cls._instructions[0xcb] = None                         # Bit instruction set
+        cls._instructions[0xcc] = CPU._call_cond              # CALL Z, nn
+        cls._instructions[0xcd] = CPU._call                   # CALL nn
+        cls._instructions[0xce] = CPU._alu_immediate          # ADC A, n
+        cls._instructions[0xcf] = CPU._rst                    # RST 08
+
+        cls._instructions[0xd0] = CPU._ret_cond               # RET NC
+        cls._instructions[0xd1] = CPU._pop                    # POP DE
+        cls._instructions[0xd2] = CPU._jmp_cond               # JP NC, nn
+        cls._instructions[0xd3] = CPU._out                    # OUT (n), A
+        cls._instructions[0xd4] = CPU._call_cond              # CALL NC, nn
+        cls._instructions[0xd5] = CPU._push                   # PUSH DE
+        cls._instructions[0xd6] = CPU._alu_immediate          # SUB n
+        cls._instructions[0xd7] = CPU._rst                    # RST 10
+        cls._instructions[0xd8] = CPU._ret_cond               # RET C
+        cls._instructions[0xd9] = CPU._exchange_register_set  # EXX
+        cls._instructions[0xda] = CPU._jmp_cond               # JP C, nn
+        cls._instructions[0xdb] = CPU._in                     # IN A, (n)
+        cls._instructions[0xdc] = CPU._call_cond              # CALL C, nn
+        cls._instructions[0xdd] = None                         # IX instructions set
+        cls._instructions[0xde] = CPU._alu_immediate          # SBC A, n
+        cls._instructions[0xdf] = CPU._rst                    # RST 18
+
+        cls._instructions[0xe0] = CPU._ret_cond               # RET PO
+        cls._instructions[0xe1] = CPU._pop                    # POP HL
+        cls._instructions[0xe2] = CPU._jmp_cond               # JP PO, nn
+        cls._instructions[0xe3] = CPU._exchange_hl_stack      # EX (SP), HL
+        cls._instructions[0xe4] = CPU._call_cond              # CALL PO, nn
+        cls._instructions[0xe5] = CPU._push                   # PUSH HL
+        cls._instructions[0xe6] = CPU._alu_immediate          # AND n
+        cls._instructions[0xe7] = CPU._rst                    # RST 20
+        cls._instructions[0xe8] = CPU._ret_cond               # RET PE
+        cls._instructions[0xe9] = CPU._jp_hl                  # JP (HL)
+        cls._instructions[0xea] = CPU._jmp_cond               # JP PE, nn
+        cls._instructions[0xeb] = CPU._exchange_de_hl         # EX DE, HL
+        cls._instructions[0xec] = CPU._call_cond              # CALL PE, nn
+        cls._instructions[0xed] = None                         # Advanced instruction set
+        cls._instructions[0xee] = CPU._alu_immediate          # XOR n
+        cls._instructions[0xef] = CPU._rst                    # RST 28
+
+        cls._instructions[0xf0] = CPU._ret_cond               # RET P
+        cls._instructions[0xf1] = CPU._pop                    # POP AF
+        cls._instructions[0xf2] = CPU._jmp_cond               # JP P, nn
+        cls._instructions[0xf3] = CPU._di                     # DI
+        cls._instructions[0xf4] = CPU._call_cond              # CALL P, nn
+        cls._instructions[0xf5] = CPU._push                   # PUSH AF
+        cls._instructions[0xf6] = CPU._alu_immediate          # OR n
+        cls._instructions[0xf7] = CPU._rst                    # RST 30
+        cls._instructions[0xf8] = CPU._ret_cond               # RET M
+        cls._instructions[0xf9] = CPU._ld_sp_hl               # LD SP, HL
+        cls._instructions[0xfa] = CPU._jmp_cond               # JP M, nn
+        cls._instructions[0xfb] = CPU._ei                     # EI
+        cls._instructions[0xfc] = CPU._call_cond              # CALL M, nn
+        cls._instructions[0xfd] = None                         # IY instruction set
+        cls._instructions[0xfe] = CPU._alu_immediate          # CP n
+        cls._instructions[0xff] = CPU._rst                    # RST 38
+
+        cls._instructions = tuple(cls._instructions)
+
+
+    @classmethod
+    def _init_ed_instruction_table(cls):
         """ Initialize additional instruction set with 0xED prefix """
 
-        self._instructions_0xed = [None] * 0x100
-
-        self._instructions_0xed[0x00] = None            # IN0 B, (n)
-        self._instructions_0xed[0x01] = None            # OUT0 (n), B
-        self._instructions_0xed[0x02] = None
-        self._instructions_0xed[0x03] = None
-        self._instructions_0xed[0x04] = None            # TST B
-        self._instructions_0xed[0x05] = None
-        self._instructions_0xed[0x06] = None
-        self._instructions_0xed[0x07] = None
-        self._instructions_0xed[0x08] = None            # IN0 C, (n)
-        self._instructions_0xed[0x09] = None            # OUT0 (n), C
-        self._instructions_0xed[0x0a] = None
-        self._instructions_0xed[0x0b] = None
-        self._instructions_0xed[0x0c] = None            # TST C
-        self._instructions_0xed[0x0d] = None
-        self._instructions_0xed[0x0e] = None
-        self._instructions_0xed[0x0f] = None
-
-        self._instructions_0xed[0x10] = None            # IN0 D, (n)
-        self._instructions_0xed[0x11] = None            # OUT0 (n), D
-        self._instructions_0xed[0x12] = None
-        self._instructions_0xed[0x13] = None
-        self._instructions_0xed[0x14] = None            # TST D
-        self._instructions_0xed[0x15] = None
-        self._instructions_0xed[0x16] = None
-        self._instructions_0xed[0x17] = None
-        self._instructions_0xed[0x18] = None            # IN0 E, (n)
-        self._instructions_0xed[0x19] = None            # OUT0 (n), E
-        self._instructions_0xed[0x1a] = None
-        self._instructions_0xed[0x1b] = None
-        self._instructions_0xed[0x1c] = None            # TST E
-        self._instructions_0xed[0x1d] = None
-        self._instructions_0xed[0x1e] = None
-        self._instructions_0xed[0x1f] = None
-
-        self._instructions_0xed[0x20] = None            # IN0 H, (n)
-        self._instructions_0xed[0x21] = None            # OUT0 (n), H
-        self._instructions_0xed[0x22] = None
-        self._instructions_0xed[0x23] = None
-        self._instructions_0xed[0x24] = None            # TST H
-        self._instructions_0xed[0x25] = None
-        self._instructions_0xed[0x26] = None
-        self._instructions_0xed[0x27] = None
-        self._instructions_0xed[0x28] = None            # IN0 L, (n)
-        self._instructions_0xed[0x29] = None            # OUT0 (n), L
-        self._instructions_0xed[0x2a] = None
-        self._instructions_0xed[0x2b] = None
-        self._instructions_0xed[0x2c] = None            # TST L
-        self._instructions_0xed[0x2d] = None
-        self._instructions_0xed[0x2e] = None
-        self._instructions_0xed[0x2f] = None
-
-        self._instructions_0xed[0x30] = None
-        self._instructions_0xed[0x31] = None
-        self._instructions_0xed[0x32] = None
-        self._instructions_0xed[0x33] = None
-        self._instructions_0xed[0x34] = None            # TST (HL)
-        self._instructions_0xed[0x35] = None
-        self._instructions_0xed[0x36] = None
-        self._instructions_0xed[0x37] = None
-        self._instructions_0xed[0x38] = None            # IN0 A, (n)
-        self._instructions_0xed[0x39] = None            # OUT0 (n), A
-        self._instructions_0xed[0x3a] = None
-        self._instructions_0xed[0x3b] = None
-        self._instructions_0xed[0x3c] = None            # TST A
-        self._instructions_0xed[0x3d] = None
-        self._instructions_0xed[0x3e] = None
-        self._instructions_0xed[0x3f] = None
-
-        self._instructions_0xed[0x40] = self._in_reg    # IN B, (C)
-        self._instructions_0xed[0x41] = self._out_reg   # OUT (C), B
-        self._instructions_0xed[0x42] = self._sbc_hl
-        self._instructions_0xed[0x43] = self._store_reg16_to_memory
-        self._instructions_0xed[0x44] = self._neg       # NEG
-        self._instructions_0xed[0x45] = None            # RETN
-        self._instructions_0xed[0x46] = self._im
-        self._instructions_0xed[0x47] = self._load_i_r_register_from_a
-        self._instructions_0xed[0x48] = self._in_reg    # IN C, (C)
-        self._instructions_0xed[0x49] = self._out_reg   # OUT (C), C
-        self._instructions_0xed[0x4a] = self._adc_hl
-        self._instructions_0xed[0x4b] = self._load_reg16_from_memory
-        self._instructions_0xed[0x4c] = None            # MLT BC
-        self._instructions_0xed[0x4d] = None            # RETI
-        self._instructions_0xed[0x4e] = None
-        self._instructions_0xed[0x4f] = self._load_i_r_register_from_a
-
-        self._instructions_0xed[0x50] = self._in_reg    # IN D, (C)
-        self._instructions_0xed[0x51] = self._out_reg   # OUT (C), D
-        self._instructions_0xed[0x52] = self._sbc_hl
-        self._instructions_0xed[0x53] = self._store_reg16_to_memory
-        self._instructions_0xed[0x54] = None
-        self._instructions_0xed[0x55] = None
-        self._instructions_0xed[0x56] = self._im
-        self._instructions_0xed[0x57] = self._load_a_from_i_r_registers
-        self._instructions_0xed[0x58] = self._in_reg    # IN E, (C)
-        self._instructions_0xed[0x59] = None            # OUT (C), E
-        self._instructions_0xed[0x5a] = self._adc_hl
-        self._instructions_0xed[0x5b] = self._load_reg16_from_memory
-        self._instructions_0xed[0x5c] = None            # MLT DE
-        self._instructions_0xed[0x5d] = None
-        self._instructions_0xed[0x5e] = self._im
-        self._instructions_0xed[0x5f] = self._load_a_from_i_r_registers
-
-        self._instructions_0xed[0x60] = self._in_reg    # IN H, (C)
-        self._instructions_0xed[0x61] = self._out_reg   # OUT (C), H
-        self._instructions_0xed[0x62] = self._sbc_hl
-        self._instructions_0xed[0x63] = self._store_reg16_to_memory
-        self._instructions_0xed[0x64] = None            # TST n
-        self._instructions_0xed[0x65] = None
-        self._instructions_0xed[0x66] = None
-        self._instructions_0xed[0x67] = None            # RRD
-        self._instructions_0xed[0x68] = self._in_reg    # IN L, (C)
-        self._instructions_0xed[0x69] = None            # OUT (C), L
-        self._instructions_0xed[0x6a] = self._adc_hl
-        self._instructions_0xed[0x6b] = self._load_reg16_from_memory
-        self._instructions_0xed[0x6c] = None            # MLT HL
-        self._instructions_0xed[0x6d] = None
-        self._instructions_0xed[0x6e] = None
-        self._instructions_0xed[0x6f] = None            # RLD
-
-        self._instructions_0xed[0x70] = self._in_reg    # IN (C)
-        self._instructions_0xed[0x71] = None            # OUT (C), 0
-        self._instructions_0xed[0x72] = self._sbc_hl
-        self._instructions_0xed[0x73] = self._store_reg16_to_memory
-        self._instructions_0xed[0x74] = None            # TSTIO n
-        self._instructions_0xed[0x75] = None
-        self._instructions_0xed[0x76] = None            # SLP
-        self._instructions_0xed[0x77] = None
-        self._instructions_0xed[0x78] = self._in_reg    # IN A, (C)
-        self._instructions_0xed[0x79] = self._out_reg   # OUT (C), A
-        self._instructions_0xed[0x7a] = self._adc_hl
-        self._instructions_0xed[0x7b] = self._load_reg16_from_memory
-        self._instructions_0xed[0x7c] = None            # MLT SP
-        self._instructions_0xed[0x7d] = None
-        self._instructions_0xed[0x7e] = None
-        self._instructions_0xed[0x7f] = None
-
-        self._instructions_0xed[0x80] = None
-        self._instructions_0xed[0x81] = None
-        self._instructions_0xed[0x82] = None
-        self._instructions_0xed[0x83] = None            # OTIM
-        self._instructions_0xed[0x84] = None
-        self._instructions_0xed[0x85] = None
-        self._instructions_0xed[0x86] = None
-        self._instructions_0xed[0x87] = None
-        self._instructions_0xed[0x88] = None
-        self._instructions_0xed[0x89] = None
-        self._instructions_0xed[0x8a] = None
-        self._instructions_0xed[0x8b] = None            # OTDM
-        self._instructions_0xed[0x8c] = None
-        self._instructions_0xed[0x8d] = None
-        self._instructions_0xed[0x8e] = None
-        self._instructions_0xed[0x8f] = None
-
-        self._instructions_0xed[0x90] = None
-        self._instructions_0xed[0x91] = None
-        self._instructions_0xed[0x92] = None
-        self._instructions_0xed[0x93] = None            # OTIMR
-        self._instructions_0xed[0x94] = None
-        self._instructions_0xed[0x95] = None
-        self._instructions_0xed[0x96] = None
-        self._instructions_0xed[0x97] = None
-        self._instructions_0xed[0x98] = None
-        self._instructions_0xed[0x99] = None
-        self._instructions_0xed[0x9a] = None
-        self._instructions_0xed[0x9b] = None            # OTDMR
-        self._instructions_0xed[0x9c] = None
-        self._instructions_0xed[0x9d] = None
-        self._instructions_0xed[0x9e] = None
-        self._instructions_0xed[0x9f] = None
-
-        self._instructions_0xed[0xa0] = self._ldi
-        self._instructions_0xed[0xa1] = None            # CPI
-        self._instructions_0xed[0xa2] = None            # INI
-        self._instructions_0xed[0xa3] = None            # OUTI
-        self._instructions_0xed[0xa4] = None
-        self._instructions_0xed[0xa5] = None
-        self._instructions_0xed[0xa6] = None
-        self._instructions_0xed[0xa7] = None
-        self._instructions_0xed[0xa8] = self._ldd
-        self._instructions_0xed[0xa9] = None            # CPD
-        self._instructions_0xed[0xaa] = None            # IND
-        self._instructions_0xed[0xab] = None            # OUTD
-        self._instructions_0xed[0xac] = None
-        self._instructions_0xed[0xad] = None
-        self._instructions_0xed[0xae] = None
-        self._instructions_0xed[0xaf] = None
-
-        self._instructions_0xed[0xb0] = self._ldir
-        self._instructions_0xed[0xb1] = None            # CPIR
-        self._instructions_0xed[0xb2] = None            # INIR
-        self._instructions_0xed[0xb3] = None            # OTIR
-        self._instructions_0xed[0xb4] = None
-        self._instructions_0xed[0xb5] = None
-        self._instructions_0xed[0xb6] = None
-        self._instructions_0xed[0xb7] = None
-        self._instructions_0xed[0xb8] = self._lddr
-        self._instructions_0xed[0xb9] = None            # CPDR
-        self._instructions_0xed[0xba] = None            # INDR
-        self._instructions_0xed[0xbb] = None            # OTDR
-        self._instructions_0xed[0xbc] = None
-        self._instructions_0xed[0xbd] = None
-        self._instructions_0xed[0xbe] = None
-        self._instructions_0xed[0xbf] = None
-
-        self._instructions_0xed[0xc0] = None
-        self._instructions_0xed[0xc1] = None
-        self._instructions_0xed[0xc2] = None
-        self._instructions_0xed[0xc3] = None
-        self._instructions_0xed[0xc4] = None
-        self._instructions_0xed[0xc5] = None
-        self._instructions_0xed[0xc6] = None
-        self._instructions_0xed[0xc7] = None
-        self._instructions_0xed[0xc8] = None
-        self._instructions_0xed[0xc9] = None
-        self._instructions_0xed[0xca] = None
-        self._instructions_0xed[0xcb] = None
-        self._instructions_0xed[0xcc] = None
-        self._instructions_0xed[0xcd] = None
-        self._instructions_0xed[0xce] = None
-        self._instructions_0xed[0xcf] = None
-
-        self._instructions_0xed[0xd0] = None
-        self._instructions_0xed[0xd1] = None
-        self._instructions_0xed[0xd2] = None
-        self._instructions_0xed[0xd3] = None
-        self._instructions_0xed[0xd4] = None
-        self._instructions_0xed[0xd5] = None
-        self._instructions_0xed[0xd6] = None
-        self._instructions_0xed[0xd7] = None
-        self._instructions_0xed[0xd8] = None
-        self._instructions_0xed[0xd9] = None
-        self._instructions_0xed[0xda] = None
-        self._instructions_0xed[0xdb] = None
-        self._instructions_0xed[0xdc] = None
-        self._instructions_0xed[0xdd] = None
-        self._instructions_0xed[0xde] = None
-        self._instructions_0xed[0xdf] = None
-
-        self._instructions_0xed[0xe0] = None
-        self._instructions_0xed[0xe1] = None
-        self._instructions_0xed[0xe2] = None
-        self._instructions_0xed[0xe3] = None
-        self._instructions_0xed[0xe4] = None
-        self._instructions_0xed[0xe5] = None
-        self._instructions_0xed[0xe6] = None
-        self._instructions_0xed[0xe7] = None
-        self._instructions_0xed[0xe8] = None
-        self._instructions_0xed[0xe9] = None
-        self._instructions_0xed[0xea] = None
-        self._instructions_0xed[0xeb] = None
-        self._instructions_0xed[0xec] = None
-        self._instructions_0xed[0xed] = None
-        self._instructions_0xed[0xee] = None
-        self._instructions_0xed[0xef] = None
-
-        self._instructions_0xed[0xf0] = None
-        self._instructions_0xed[0xf1] = None
-        self._instructions_0xed[0xf2] = None
-        self._instructions_0xed[0xf3] = None
-        self._instructions_0xed[0xf4] = None
-        self._instructions_0xed[0xf5] = None
-        self._instructions_0xed[0xf6] = None
-        self._instructions_0xed[0xf7] = None
-        self._instructions_0xed[0xf8] = None
-        self._instructions_0xed[0xf9] = None
-        self._instructions_0xed[0xfa] = None
-        self._instructions_0xed[0xfb] = None
-        self._instructions_0xed[0xfc] = None
-        self._instructions_0xed[0xfd] = None
-        self._instructions_0xed[0xfe] = None
-        self._instructions_0xed[0xff] = None
-
-
-    def _init_cb_instruction_table(self):
+        cls._instructions_0xed = [None] * 0x100
+
+        cls._instructions_0xed[0x00] = None            # IN0 B, (n)
+        cls._instructions_0xed[0x01] = None            # OUT0 (n), B
+        cls._instructions_0xed[0x04] = None            # TST B
+        cls._instructions_0xed[0x08] = None            # IN0 C, (n)
+        cls._instructions_0xed[0x09] = None            # OUT0 (n), C
+        cls._instructions_0xed[0x0c] = None            # TST C
+
+        cls._instructions_0xed[0x10] = None            # IN0 D, (n)
+        cls._instructions_0xed[0x11] = None            # OUT0 (n), D
+        cls._instructions_0xed[0x14] = None            # TST D
+        cls._instructions_0xed[0x18] = None            # IN0 E, (n)
+        cls._instructions_0xed[0x19] = None            # OUT0 (n), E
+        cls._instructions_0xed[0x1c] = None            # TST E
+
+        cls._instructions_0xed[0x20] = None            # IN0 H, (n)
+        cls._instructions_0xed[0x21] = None            # OUT0 (n), H
+        cls._instructions_0xed[0x24] = None            # TST H
+        cls._instructions_0xed[0x28] = None            # IN0 L, (n)
+        cls._instructions_0xed[0x29] = None            # OUT0 (n), L
+        cls._instructions_0xed[0x2c] = None            # TST L
+
+        cls._instructions_0xed[0x34] = None            # TST (HL)
+        cls._instructions_0xed[0x38] = None            # IN0 A, (n)
+        cls._instructions_0xed[0x39] = None            # OUT0 (n), A
+        cls._instructions_0xed[0x3c] = None            # TST A
+
+        cls._instructions_0xed[0x40] = CPU._in_reg    # IN B, (C)
+        cls._instructions_0xed[0x41] = CPU._out_reg   # OUT (C), B
+        cls._instructions_0xed[0x42] = CPU._sbc_hl
+        cls._instructions_0xed[0x43] = CPU._store_reg16_to_memory
+        cls._instructions_0xed[0x44] = CPU._neg       # NEG
+        cls._instructions_0xed[0x45] = None            # RETN
+        cls._instructions_0xed[0x46] = CPU._im
+        cls._instructions_0xed[0x47] = CPU._load_i_r_register_from_a
+        cls._instructions_0xed[0x48] = CPU._in_reg    # IN C, (C)
+        cls._instructions_0xed[0x49] = CPU._out_reg   # OUT (C), C
+        cls._instructions_0xed[0x4a] = CPU._adc_hl
+        cls._instructions_0xed[0x4b] = CPU._load_reg16_from_memory
+        cls._instructions_0xed[0x4c] = None            # MLT BC
+        cls._instructions_0xed[0x4d] = None            # RETI
+        cls._instructions_0xed[0x4f] = CPU._load_i_r_register_from_a
+
+        cls._instructions_0xed[0x50] = CPU._in_reg    # IN D, (C)
+        cls._instructions_0xed[0x51] = CPU._out_reg   # OUT (C), D
+        cls._instructions_0xed[0x52] = CPU._sbc_hl
+        cls._instructions_0xed[0x53] = CPU._store_reg16_to_memory
+        cls._instructions_0xed[0x56] = CPU._im
+        cls._instructions_0xed[0x57] = CPU._load_a_from_i_r_registers
+        cls._instructions_0xed[0x58] = CPU._in_reg    # IN E, (C)
+        cls._instructions_0xed[0x59] = None            # OUT (C), E
+        cls._instructions_0xed[0x5a] = CPU._adc_hl
+        cls._instructions_0xed[0x5b] = CPU._load_reg16_from_memory
+        cls._instructions_0xed[0x5c] = None            # MLT DE
+        cls._instructions_0xed[0x5e] = CPU._im
+        cls._instructions_0xed[0x5f] = CPU._load_a_from_i_r_registers
+
+        cls._instructions_0xed[0x60] = CPU._in_reg    # IN H, (C)
+        cls._instructions_0xed[0x61] = CPU._out_reg   # OUT (C), H
+        cls._instructions_0xed[0x62] = CPU._sbc_hl
+        cls._instructions_0xed[0x63] = CPU._store_reg16_to_memory
+        cls._instructions_0xed[0x64] = None            # TST n
+        cls._instructions_0xed[0x67] = None            # RRD
+        cls._instructions_0xed[0x68] = CPU._in_reg    # IN L, (C)
+        cls._instructions_0xed[0x69] = None            # OUT (C), L
+        cls._instructions_0xed[0x6a] = CPU._adc_hl
+        cls._instructions_0xed[0x6b] = CPU._load_reg16_from_memory
+        cls._instructions_0xed[0x6c] = None            # MLT HL
+        cls._instructions_0xed[0x6f] = None            # RLD
+
+        cls._instructions_0xed[0x70] = CPU._in_reg    # IN (C)
+        cls._instructions_0xed[0x71] = None            # OUT (C), 0
+        cls._instructions_0xed[0x72] = CPU._sbc_hl
+        cls._instructions_0xed[0x73] = CPU._store_reg16_to_memory
+        cls._instructions_0xed[0x74] = None            # TSTIO n
+        cls._instructions_0xed[0x76] = None            # SLP
+        cls._instructions_0xed[0x78] = CPU._in_reg    # IN A, (C)
+        cls._instructions_0xed[0x79] = CPU._out_reg   # OUT (C), A
+        cls._instructions_0xed[0x7a] = CPU._adc_hl
+        cls._instructions_0xed[0x7b] = CPU._load_reg16_from_memory
+        cls._instructions_0xed[0x7c] = None            # MLT SP
+
+        cls._instructions_0xed[0x83] = None            # OTIM
+        cls._instructions_0xed[0x8b] = None            # OTDM
+
+        cls._instructions_0xed[0x93] = None            # OTIMR
+        cls._instructions_0xed[0x9b] = None            # OTDMR
+
+        cls._instructions_0xed[0xa0] = CPU._ldi
+        cls._instructions_0xed[0xa1] = None            # CPI
+        cls._instructions_0xed[0xa2] = None            # INI
+        cls._instructions_0xed[0xa3] = None            # OUTI
+        cls._instructions_0xed[0xa8] = CPU._ldd
+        cls._instructions_0xed[0xa9] = None            # CPD
+        cls._instructions_0xed[0xaa] = None            # IND
+        cls._instructions_0xed[0xab] = None            # OUTD
+
+        cls._instructions_0xed[0xb0] = CPU._ldir
+        cls._instructions_0xed[0xb1] = None            # CPIR
+        cls._instructions_0xed[0xb2] = None            # INIR
+        cls._instructions_0xed[0xb3] = None            # OTIR
+        cls._instructions_0xed[0xb8] = CPU._lddr
+        cls._instructions_0xed[0xb9] = None            # CPDR
+        cls._instructions_0xed[0xba] = None            # INDR
+        cls._instructions_0xed[0xbb] = None            # OTDR
+
+        cls._instructions_0xed = tuple(cls._instructions_0xed)
+
+
+    @classmethod
+    def _init_cb_instruction_table(cls):
         """ Initialize bit instruction set with 0xCB prefix """
         
-        self._instructions_0xcb = [None] * 0x100
-
-        self._instructions_0xcb[0x00] = self._rlc_reg       # RLC B
-        self._instructions_0xcb[0x01] = self._rlc_reg       # RLC C
-        self._instructions_0xcb[0x02] = self._rlc_reg       # RLC D
-        self._instructions_0xcb[0x03] = self._rlc_reg       # RLC E
-        self._instructions_0xcb[0x04] = self._rlc_reg       # RLC H
-        self._instructions_0xcb[0x05] = self._rlc_reg       # RLC L
-        self._instructions_0xcb[0x06] = self._rlc_reg       # RLC (HL)
-        self._instructions_0xcb[0x07] = self._rlc_reg       # RLC A
-        self._instructions_0xcb[0x08] = self._rrc_reg       # RRC B
-        self._instructions_0xcb[0x09] = self._rrc_reg       # RRC C
-        self._instructions_0xcb[0x0a] = self._rrc_reg       # RRC D
-        self._instructions_0xcb[0x0b] = self._rrc_reg       # RRC E
-        self._instructions_0xcb[0x0c] = self._rrc_reg       # RRC H
-        self._instructions_0xcb[0x0d] = self._rrc_reg       # RRC L
-        self._instructions_0xcb[0x0e] = self._rrc_reg       # RRC (HL)
-        self._instructions_0xcb[0x0f] = self._rrc_reg       # RRC A
-
-        self._instructions_0xcb[0x10] = self._rl_reg        # RL B
-        self._instructions_0xcb[0x11] = self._rl_reg        # RL C
-        self._instructions_0xcb[0x12] = self._rl_reg        # RL D
-        self._instructions_0xcb[0x13] = self._rl_reg        # RL E
-        self._instructions_0xcb[0x14] = self._rl_reg        # RL H
-        self._instructions_0xcb[0x15] = self._rl_reg        # RL L
-        self._instructions_0xcb[0x16] = self._rl_reg        # RL (HL)
-        self._instructions_0xcb[0x17] = self._rl_reg        # RL A
-        self._instructions_0xcb[0x18] = self._rr_reg        # RR B
-        self._instructions_0xcb[0x19] = self._rr_reg        # RR C
-        self._instructions_0xcb[0x1a] = self._rr_reg        # RR D
-        self._instructions_0xcb[0x1b] = self._rr_reg        # RR E
-        self._instructions_0xcb[0x1c] = self._rr_reg        # RR H
-        self._instructions_0xcb[0x1d] = self._rr_reg        # RR L
-        self._instructions_0xcb[0x1e] = self._rr_reg        # RR (HL)
-        self._instructions_0xcb[0x1f] = self._rr_reg        # RR A
-
-        self._instructions_0xcb[0x20] = None        # SLA B
-        self._instructions_0xcb[0x21] = None        # SLA C
-        self._instructions_0xcb[0x22] = None        # SLA D
-        self._instructions_0xcb[0x23] = None        # SLA E
-        self._instructions_0xcb[0x24] = None        # SLA H
-        self._instructions_0xcb[0x25] = None        # SLA L
-        self._instructions_0xcb[0x26] = None        # SLA (HL)
-        self._instructions_0xcb[0x27] = None        # SLA A
-        self._instructions_0xcb[0x28] = None        # SRA B
-        self._instructions_0xcb[0x29] = None        # SRA C
-        self._instructions_0xcb[0x2a] = None        # SRA D
-        self._instructions_0xcb[0x2b] = None        # SRA E
-        self._instructions_0xcb[0x2c] = None        # SRA H
-        self._instructions_0xcb[0x2d] = None        # SRA L
-        self._instructions_0xcb[0x2e] = None        # SRA (HL)
-        self._instructions_0xcb[0x2f] = None        # SRA A
-
-        self._instructions_0xcb[0x30] = None        # SLL B
-        self._instructions_0xcb[0x31] = None        # SLL C
-        self._instructions_0xcb[0x32] = None        # SLL D
-        self._instructions_0xcb[0x33] = None        # SLL E
-        self._instructions_0xcb[0x34] = None        # SLL H
-        self._instructions_0xcb[0x35] = None        # SLL L
-        self._instructions_0xcb[0x36] = None        # SLL (HL)
-        self._instructions_0xcb[0x37] = None        # SLL A
-        self._instructions_0xcb[0x38] = self._srl           # SRL B
-        self._instructions_0xcb[0x39] = self._srl           # SRL C
-        self._instructions_0xcb[0x3a] = self._srl           # SRL D
-        self._instructions_0xcb[0x3b] = self._srl           # SRL E
-        self._instructions_0xcb[0x3c] = self._srl           # SRL H
-        self._instructions_0xcb[0x3d] = self._srl           # SRL L
-        self._instructions_0xcb[0x3e] = self._srl           # SRL (HL)
-        self._instructions_0xcb[0x3f] = self._srl           # SRL A
-
-        self._instructions_0xcb[0x40] = self._get_bit       # BIT 0, B
-        self._instructions_0xcb[0x41] = self._get_bit       # BIT 0, C
-        self._instructions_0xcb[0x42] = self._get_bit       # BIT 0, D
-        self._instructions_0xcb[0x43] = self._get_bit       # BIT 0, E
-        self._instructions_0xcb[0x44] = self._get_bit       # BIT 0, H
-        self._instructions_0xcb[0x45] = self._get_bit       # BIT 0, L
-        self._instructions_0xcb[0x46] = self._get_bit       # BIT 0, (HL)
-        self._instructions_0xcb[0x47] = self._get_bit       # BIT 0, A
-        self._instructions_0xcb[0x48] = self._get_bit       # BIT 1, B
-        self._instructions_0xcb[0x49] = self._get_bit       # BIT 1, C
-        self._instructions_0xcb[0x4a] = self._get_bit       # BIT 1, D
-        self._instructions_0xcb[0x4b] = self._get_bit       # BIT 1, E
-        self._instructions_0xcb[0x4c] = self._get_bit       # BIT 1, H
-        self._instructions_0xcb[0x4d] = self._get_bit       # BIT 1, L
-        self._instructions_0xcb[0x4e] = self._get_bit       # BIT 1, (HL)
-        self._instructions_0xcb[0x4f] = self._get_bit       # BIT 1, A
-
-        self._instructions_0xcb[0x50] = self._get_bit       # BIT 2, B
-        self._instructions_0xcb[0x51] = self._get_bit       # BIT 2, C
-        self._instructions_0xcb[0x52] = self._get_bit       # BIT 2, D
-        self._instructions_0xcb[0x53] = self._get_bit       # BIT 2, E
-        self._instructions_0xcb[0x54] = self._get_bit       # BIT 2, H
-        self._instructions_0xcb[0x55] = self._get_bit       # BIT 2, L
-        self._instructions_0xcb[0x56] = self._get_bit       # BIT 2, (HL)
-        self._instructions_0xcb[0x57] = self._get_bit       # BIT 2, A
-        self._instructions_0xcb[0x58] = self._get_bit       # BIT 3, B
-        self._instructions_0xcb[0x59] = self._get_bit       # BIT 3, C
-        self._instructions_0xcb[0x5a] = self._get_bit       # BIT 3, D
-        self._instructions_0xcb[0x5b] = self._get_bit       # BIT 3, E
-        self._instructions_0xcb[0x5c] = self._get_bit       # BIT 3, H
-        self._instructions_0xcb[0x5d] = self._get_bit       # BIT 3, L
-        self._instructions_0xcb[0x5e] = self._get_bit       # BIT 3, (HL)
-        self._instructions_0xcb[0x5f] = self._get_bit       # BIT 3, A
-
-        self._instructions_0xcb[0x60] = self._get_bit       # BIT 4, B
-        self._instructions_0xcb[0x61] = self._get_bit       # BIT 4, C
-        self._instructions_0xcb[0x62] = self._get_bit       # BIT 4, D
-        self._instructions_0xcb[0x63] = self._get_bit       # BIT 4, E
-        self._instructions_0xcb[0x64] = self._get_bit       # BIT 4, H
-        self._instructions_0xcb[0x65] = self._get_bit       # BIT 4, L
-        self._instructions_0xcb[0x66] = self._get_bit       # BIT 4, (HL)
-        self._instructions_0xcb[0x67] = self._get_bit       # BIT 4, A
-        self._instructions_0xcb[0x68] = self._get_bit       # BIT 5, B
-        self._instructions_0xcb[0x69] = self._get_bit       # BIT 5, C
-        self._instructions_0xcb[0x6a] = self._get_bit       # BIT 5, D
-        self._instructions_0xcb[0x6b] = self._get_bit       # BIT 5, E
-        self._instructions_0xcb[0x6c] = self._get_bit       # BIT 5, H
-        self._instructions_0xcb[0x6d] = self._get_bit       # BIT 5, L
-        self._instructions_0xcb[0x6e] = self._get_bit       # BIT 5, (HL)
-        self._instructions_0xcb[0x6f] = self._get_bit       # BIT 5, A
-
-        self._instructions_0xcb[0x70] = self._get_bit       # BIT 6, B
-        self._instructions_0xcb[0x71] = self._get_bit       # BIT 6, C
-        self._instructions_0xcb[0x72] = self._get_bit       # BIT 6, D
-        self._instructions_0xcb[0x73] = self._get_bit       # BIT 6, E
-        self._instructions_0xcb[0x74] = self._get_bit       # BIT 6, H
-        self._instructions_0xcb[0x75] = self._get_bit       # BIT 6, L
-        self._instructions_0xcb[0x76] = self._get_bit       # BIT 6, (HL)
-        self._instructions_0xcb[0x77] = self._get_bit       # BIT 6, A
-        self._instructions_0xcb[0x78] = self._get_bit       # BIT 7, B
-        self._instructions_0xcb[0x79] = self._get_bit       # BIT 7, C
-        self._instructions_0xcb[0x7a] = self._get_bit       # BIT 7, D
-        self._instructions_0xcb[0x7b] = self._get_bit       # BIT 7, E
-        self._instructions_0xcb[0x7c] = self._get_bit       # BIT 7, H
-        self._instructions_0xcb[0x7d] = self._get_bit       # BIT 7, L
-        self._instructions_0xcb[0x7e] = self._get_bit       # BIT 7, (HL)
-        self._instructions_0xcb[0x7f] = self._get_bit       # BIT 7, A
-
-        self._instructions_0xcb[0x80] = self._reset_bit     # RES 0, B
-        self._instructions_0xcb[0x81] = self._reset_bit     # RES 0, C
-        self._instructions_0xcb[0x82] = self._reset_bit     # RES 0, D
-        self._instructions_0xcb[0x83] = self._reset_bit     # RES 0, E
-        self._instructions_0xcb[0x84] = self._reset_bit     # RES 0, H
-        self._instructions_0xcb[0x85] = self._reset_bit     # RES 0, L
-        self._instructions_0xcb[0x86] = self._reset_bit     # RES 0, (HL)
-        self._instructions_0xcb[0x87] = self._reset_bit     # RES 0, A
-        self._instructions_0xcb[0x88] = self._reset_bit     # RES 1, B
-        self._instructions_0xcb[0x89] = self._reset_bit     # RES 1, C
-        self._instructions_0xcb[0x8a] = self._reset_bit     # RES 1, D
-        self._instructions_0xcb[0x8b] = self._reset_bit     # RES 1, E
-        self._instructions_0xcb[0x8c] = self._reset_bit     # RES 1, H
-        self._instructions_0xcb[0x8d] = self._reset_bit     # RES 1, L
-        self._instructions_0xcb[0x8e] = self._reset_bit     # RES 1, (HL)
-        self._instructions_0xcb[0x8f] = self._reset_bit     # RES 1, A
-
-        self._instructions_0xcb[0x90] = self._reset_bit     # RES 2, B
-        self._instructions_0xcb[0x91] = self._reset_bit     # RES 2, C
-        self._instructions_0xcb[0x92] = self._reset_bit     # RES 2, D
-        self._instructions_0xcb[0x93] = self._reset_bit     # RES 2, E
-        self._instructions_0xcb[0x94] = self._reset_bit     # RES 2, H
-        self._instructions_0xcb[0x95] = self._reset_bit     # RES 2, L
-        self._instructions_0xcb[0x96] = self._reset_bit     # RES 2, (HL)
-        self._instructions_0xcb[0x97] = self._reset_bit     # RES 2, A
-        self._instructions_0xcb[0x98] = self._reset_bit     # RES 3, B
-        self._instructions_0xcb[0x99] = self._reset_bit     # RES 3, C
-        self._instructions_0xcb[0x9a] = self._reset_bit     # RES 3, D
-        self._instructions_0xcb[0x9b] = self._reset_bit     # RES 3, E
-        self._instructions_0xcb[0x9c] = self._reset_bit     # RES 3, H
-        self._instructions_0xcb[0x9d] = self._reset_bit     # RES 3, L
-        self._instructions_0xcb[0x9e] = self._reset_bit     # RES 3, (HL)
-        self._instructions_0xcb[0x9f] = self._reset_bit     # RES 3, A
-
-        self._instructions_0xcb[0xa0] = self._reset_bit     # RES 4, B
-        self._instructions_0xcb[0xa1] = self._reset_bit     # RES 4, C
-        self._instructions_0xcb[0xa2] = self._reset_bit     # RES 4, D
-        self._instructions_0xcb[0xa3] = self._reset_bit     # RES 4, E
-        self._instructions_0xcb[0xa4] = self._reset_bit     # RES 4, H
-        self._instructions_0xcb[0xa5] = self._reset_bit     # RES 4, L
-        self._instructions_0xcb[0xa6] = self._reset_bit     # RES 4, (HL)
-        self._instructions_0xcb[0xa7] = self._reset_bit     # RES 4, A
-        self._instructions_0xcb[0xa8] = self._reset_bit     # RES 5, B
-        self._instructions_0xcb[0xa9] = self._reset_bit     # RES 5, C
-        self._instructions_0xcb[0xaa] = self._reset_bit     # RES 5, D
-        self._instructions_0xcb[0xab] = self._reset_bit     # RES 5, E
-        self._instructions_0xcb[0xac] = self._reset_bit     # RES 5, H
-        self._instructions_0xcb[0xad] = self._reset_bit     # RES 5, L
-        self._instructions_0xcb[0xae] = self._reset_bit     # RES 5, (HL)
-        self._instructions_0xcb[0xaf] = self._reset_bit     # RES 5, A
-
-        self._instructions_0xcb[0xb0] = self._reset_bit     # RES 6, B
-        self._instructions_0xcb[0xb1] = self._reset_bit     # RES 6, C
-        self._instructions_0xcb[0xb2] = self._reset_bit     # RES 6, D
-        self._instructions_0xcb[0xb3] = self._reset_bit     # RES 6, E
-        self._instructions_0xcb[0xb4] = self._reset_bit     # RES 6, H
-        self._instructions_0xcb[0xb5] = self._reset_bit     # RES 6, L
-        self._instructions_0xcb[0xb6] = self._reset_bit     # RES 6, (HL)
-        self._instructions_0xcb[0xb7] = self._reset_bit     # RES 6, A
-        self._instructions_0xcb[0xb8] = self._reset_bit     # RES 7, B
-        self._instructions_0xcb[0xb9] = self._reset_bit     # RES 7, C
-        self._instructions_0xcb[0xba] = self._reset_bit     # RES 7, D
-        self._instructions_0xcb[0xbb] = self._reset_bit     # RES 7, E
-        self._instructions_0xcb[0xbc] = self._reset_bit     # RES 7, H
-        self._instructions_0xcb[0xbd] = self._reset_bit     # RES 7, L
-        self._instructions_0xcb[0xbe] = self._reset_bit     # RES 7, (HL)
-        self._instructions_0xcb[0xbf] = self._reset_bit     # RES 7, A
-
-        self._instructions_0xcb[0xc0] = self._set_bit       # SET 0, B
-        self._instructions_0xcb[0xc1] = self._set_bit       # SET 0, C
-        self._instructions_0xcb[0xc2] = self._set_bit       # SET 0, D
-        self._instructions_0xcb[0xc3] = self._set_bit       # SET 0, E
-        self._instructions_0xcb[0xc4] = self._set_bit       # SET 0, H
-        self._instructions_0xcb[0xc5] = self._set_bit       # SET 0, L
-        self._instructions_0xcb[0xc6] = self._set_bit       # SET 0, (HL)
-        self._instructions_0xcb[0xc7] = self._set_bit       # SET 0, A
-        self._instructions_0xcb[0xc8] = self._set_bit       # SET 1, B
-        self._instructions_0xcb[0xc9] = self._set_bit       # SET 1, C
-        self._instructions_0xcb[0xca] = self._set_bit       # SET 1, D
-        self._instructions_0xcb[0xcb] = self._set_bit       # SET 1, E
-        self._instructions_0xcb[0xcc] = self._set_bit       # SET 1, H
-        self._instructions_0xcb[0xcd] = self._set_bit       # SET 1, L
-        self._instructions_0xcb[0xce] = self._set_bit       # SET 1, (HL)
-        self._instructions_0xcb[0xcf] = self._set_bit       # SET 1, A
-
-        self._instructions_0xcb[0xd0] = self._set_bit       # SET 2, B
-        self._instructions_0xcb[0xd1] = self._set_bit       # SET 2, C
-        self._instructions_0xcb[0xd2] = self._set_bit       # SET 2, D
-        self._instructions_0xcb[0xd3] = self._set_bit       # SET 2, E
-        self._instructions_0xcb[0xd4] = self._set_bit       # SET 2, H
-        self._instructions_0xcb[0xd5] = self._set_bit       # SET 2, L
-        self._instructions_0xcb[0xd6] = self._set_bit       # SET 2, (HL)
-        self._instructions_0xcb[0xd7] = self._set_bit       # SET 2, A
-        self._instructions_0xcb[0xd8] = self._set_bit       # SET 3, B
-        self._instructions_0xcb[0xd9] = self._set_bit       # SET 3, C
-        self._instructions_0xcb[0xda] = self._set_bit       # SET 3, D
-        self._instructions_0xcb[0xdb] = self._set_bit       # SET 3, E
-        self._instructions_0xcb[0xdc] = self._set_bit       # SET 3, H
-        self._instructions_0xcb[0xdd] = self._set_bit       # SET 3, L
-        self._instructions_0xcb[0xde] = self._set_bit       # SET 3, (HL)
-        self._instructions_0xcb[0xdf] = self._set_bit       # SET 3, A
-
-        self._instructions_0xcb[0xe0] = self._set_bit       # SET 4, B
-        self._instructions_0xcb[0xe1] = self._set_bit       # SET 4, C
-        self._instructions_0xcb[0xe2] = self._set_bit       # SET 4, D
-        self._instructions_0xcb[0xe3] = self._set_bit       # SET 4, E
-        self._instructions_0xcb[0xe4] = self._set_bit       # SET 4, H
-        self._instructions_0xcb[0xe5] = self._set_bit       # SET 4, L
-        self._instructions_0xcb[0xe6] = self._set_bit       # SET 4, (HL)
-        self._instructions_0xcb[0xe7] = self._set_bit       # SET 4, A
-        self._instructions_0xcb[0xe8] = self._set_bit       # SET 5, B
-        self._instructions_0xcb[0xe9] = self._set_bit       # SET 5, C
-        self._instructions_0xcb[0xea] = self._set_bit       # SET 5, D
-        self._instructions_0xcb[0xeb] = self._set_bit       # SET 5, E
-        self._instructions_0xcb[0xec] = self._set_bit       # SET 5, H
-        self._instructions_0xcb[0xed] = self._set_bit       # SET 5, L
-        self._instructions_0xcb[0xee] = self._set_bit       # SET 5, (HL)
-        self._instructions_0xcb[0xef] = self._set_bit       # SET 5, A
-
-        self._instructions_0xcb[0xf0] = self._set_bit       # SET 6, B
-        self._instructions_0xcb[0xf1] = self._set_bit       # SET 6, C
-        self._instructions_0xcb[0xf2] = self._set_bit       # SET 6, D
-        self._instructions_0xcb[0xf3] = self._set_bit       # SET 6, E
-        self._instructions_0xcb[0xf4] = self._set_bit       # SET 6, H
-        self._instructions_0xcb[0xf5] = self._set_bit       # SET 6, L
-        self._instructions_0xcb[0xf6] = self._set_bit       # SET 6, (HL)
-        self._instructions_0xcb[0xf7] = self._set_bit       # SET 6, A
-        self._instructions_0xcb[0xf8] = self._set_bit       # SET 7, B
-        self._instructions_0xcb[0xf9] = self._set_bit       # SET 7, C
-        self._instructions_0xcb[0xfa] = self._set_bit       # SET 7, D
-        self._instructions_0xcb[0xfb] = self._set_bit       # SET 7, E
-        self._instructions_0xcb[0xfc] = self._set_bit       # SET 7, H
-        self._instructions_0xcb[0xfd] = self._set_bit       # SET 7, L
-        self._instructions_0xcb[0xfe] = self._set_bit       # SET 7, (HL)
-        self._instructions_0xcb[0xff] = self._set_bit       # SET 7, A
-
-
-    def _init_dd_instruction_table(self):
-        """ Initialize IX instruction set with 0xDD prefix """
-        
-        self._instructions_0xdd = [None] * 0x100
-
-        self._instructions_0xdd[0x00] = None
-        self._instructions_0xdd[0x01] = None
-        self._instructions_0xdd[0x02] = None
-        self._instructions_0xdd[0x03] = None
-        self._instructions_0xdd[0x04] = None
-        self._instructions_0xdd[0x05] = None
-        self._instructions_0xdd[0x06] = None
-        self._instructions_0xdd[0x07] = None
-        self._instructions_0xdd[0x08] = None
-        self._instructions_0xdd[0x09] = self._add_idx_reg16
-        self._instructions_0xdd[0x0a] = None
-        self._instructions_0xdd[0x0b] = None
-        self._instructions_0xdd[0x0c] = None
-        self._instructions_0xdd[0x0d] = None
-        self._instructions_0xdd[0x0e] = None
-        self._instructions_0xdd[0x0f] = None
-
-        self._instructions_0xdd[0x10] = None
-        self._instructions_0xdd[0x11] = None
-        self._instructions_0xdd[0x12] = None
-        self._instructions_0xdd[0x13] = None
-        self._instructions_0xdd[0x14] = None
-        self._instructions_0xdd[0x15] = None
-        self._instructions_0xdd[0x16] = None
-        self._instructions_0xdd[0x17] = None
-        self._instructions_0xdd[0x18] = None
-        self._instructions_0xdd[0x19] = self._add_idx_reg16
-        self._instructions_0xdd[0x1a] = None
-        self._instructions_0xdd[0x1b] = None
-        self._instructions_0xdd[0x1c] = None
-        self._instructions_0xdd[0x1d] = None
-        self._instructions_0xdd[0x1e] = None
-        self._instructions_0xdd[0x1f] = None
-
-        self._instructions_0xdd[0x20] = None
-        self._instructions_0xdd[0x21] = self._load_idx_immediate
-        self._instructions_0xdd[0x22] = None
-        self._instructions_0xdd[0x23] = None
-        self._instructions_0xdd[0x24] = None
-        self._instructions_0xdd[0x25] = None
-        self._instructions_0xdd[0x26] = None
-        self._instructions_0xdd[0x27] = None
-        self._instructions_0xdd[0x28] = None
-        self._instructions_0xdd[0x29] = self._add_idx_reg16
-        self._instructions_0xdd[0x2a] = None
-        self._instructions_0xdd[0x2b] = None
-        self._instructions_0xdd[0x2c] = None
-        self._instructions_0xdd[0x2d] = None
-        self._instructions_0xdd[0x2e] = None
-        self._instructions_0xdd[0x2f] = None
-
-        self._instructions_0xcb[0x30] = None
-        self._instructions_0xdd[0x31] = None
-        self._instructions_0xdd[0x32] = None
-        self._instructions_0xdd[0x33] = None
-        self._instructions_0xdd[0x34] = self._inc_mem_indexed
-        self._instructions_0xdd[0x35] = self._dec_mem_indexed
-        self._instructions_0xdd[0x36] = self._store_value_to_indexed_mem
-        self._instructions_0xdd[0x37] = None
-        self._instructions_0xdd[0x38] = None
-        self._instructions_0xdd[0x39] = self._add_idx_reg16
-        self._instructions_0xdd[0x3a] = None
-        self._instructions_0xdd[0x3b] = None
-        self._instructions_0xdd[0x3c] = None
-        self._instructions_0xdd[0x3d] = None
-        self._instructions_0xdd[0x3e] = None
-        self._instructions_0xdd[0x3f] = None
-
-        self._instructions_0xdd[0x40] = None
-        self._instructions_0xdd[0x41] = None
-        self._instructions_0xdd[0x42] = None
-        self._instructions_0xdd[0x43] = None
-        self._instructions_0xdd[0x44] = None
-        self._instructions_0xdd[0x45] = None
-        self._instructions_0xdd[0x46] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x47] = None
-        self._instructions_0xdd[0x48] = None
-        self._instructions_0xdd[0x49] = None
-        self._instructions_0xdd[0x4a] = None
-        self._instructions_0xdd[0x4b] = None
-        self._instructions_0xdd[0x4c] = None
-        self._instructions_0xdd[0x4d] = None
-        self._instructions_0xdd[0x4e] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x4f] = None
-
-        self._instructions_0xdd[0x50] = None
-        self._instructions_0xdd[0x51] = None
-        self._instructions_0xdd[0x52] = None
-        self._instructions_0xdd[0x53] = None
-        self._instructions_0xdd[0x54] = None
-        self._instructions_0xdd[0x55] = None
-        self._instructions_0xdd[0x56] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x57] = None
-        self._instructions_0xdd[0x58] = None
-        self._instructions_0xdd[0x59] = None
-        self._instructions_0xdd[0x5a] = None
-        self._instructions_0xdd[0x5b] = None
-        self._instructions_0xdd[0x5c] = None
-        self._instructions_0xdd[0x5d] = None
-        self._instructions_0xdd[0x5e] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x5f] = None
-
-        self._instructions_0xdd[0x60] = None
-        self._instructions_0xdd[0x61] = None
-        self._instructions_0xdd[0x62] = None
-        self._instructions_0xdd[0x63] = None
-        self._instructions_0xdd[0x64] = None
-        self._instructions_0xdd[0x65] = None
-        self._instructions_0xdd[0x66] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x67] = None
-        self._instructions_0xdd[0x68] = None
-        self._instructions_0xdd[0x69] = None
-        self._instructions_0xdd[0x6a] = None
-        self._instructions_0xdd[0x6b] = None
-        self._instructions_0xdd[0x6c] = None
-        self._instructions_0xdd[0x6d] = None
-        self._instructions_0xdd[0x6e] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x6f] = None
-
-        self._instructions_0xdd[0x70] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x71] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x72] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x73] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x74] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x75] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x76] = None
-        self._instructions_0xdd[0x77] = self._store_reg_to_indexed_mem
-        self._instructions_0xdd[0x78] = None
-        self._instructions_0xdd[0x79] = None
-        self._instructions_0xdd[0x7a] = None
-        self._instructions_0xdd[0x7b] = None
-        self._instructions_0xdd[0x7c] = None
-        self._instructions_0xdd[0x7d] = None
-        self._instructions_0xdd[0x7e] = self._load_reg_from_indexed_mem
-        self._instructions_0xdd[0x7f] = None
-
-        self._instructions_0xdd[0x80] = None
-        self._instructions_0xdd[0x81] = None
-        self._instructions_0xdd[0x82] = None
-        self._instructions_0xdd[0x83] = None
-        self._instructions_0xdd[0x84] = None
-        self._instructions_0xdd[0x85] = None
-        self._instructions_0xdd[0x86] = self._alu_mem_indexed
-        self._instructions_0xdd[0x87] = None
-        self._instructions_0xdd[0x88] = None
-        self._instructions_0xdd[0x89] = None
-        self._instructions_0xdd[0x8a] = None
-        self._instructions_0xdd[0x8b] = None
-        self._instructions_0xdd[0x8c] = None
-        self._instructions_0xdd[0x8d] = None
-        self._instructions_0xdd[0x8e] = self._alu_mem_indexed
-        self._instructions_0xdd[0x8f] = None
-
-        self._instructions_0xdd[0x90] = None
-        self._instructions_0xdd[0x91] = None
-        self._instructions_0xdd[0x92] = None
-        self._instructions_0xdd[0x93] = None
-        self._instructions_0xdd[0x94] = None
-        self._instructions_0xdd[0x95] = None
-        self._instructions_0xdd[0x96] = self._alu_mem_indexed
-        self._instructions_0xdd[0x97] = None
-        self._instructions_0xdd[0x98] = None
-        self._instructions_0xdd[0x99] = None
-        self._instructions_0xdd[0x9a] = None
-        self._instructions_0xdd[0x9b] = None
-        self._instructions_0xdd[0x9c] = None
-        self._instructions_0xdd[0x9d] = None
-        self._instructions_0xdd[0x9e] = self._alu_mem_indexed
-        self._instructions_0xdd[0x9f] = None
-
-        self._instructions_0xdd[0xa0] = None
-        self._instructions_0xdd[0xa1] = None
-        self._instructions_0xdd[0xa2] = None
-        self._instructions_0xdd[0xa3] = None
-        self._instructions_0xdd[0xa4] = None
-        self._instructions_0xdd[0xa5] = None
-        self._instructions_0xdd[0xa6] = self._alu_mem_indexed
-        self._instructions_0xdd[0xa7] = None
-        self._instructions_0xdd[0xa8] = None
-        self._instructions_0xdd[0xa9] = None
-        self._instructions_0xdd[0xaa] = None
-        self._instructions_0xdd[0xab] = None
-        self._instructions_0xdd[0xac] = None
-        self._instructions_0xdd[0xad] = None
-        self._instructions_0xdd[0xae] = self._alu_mem_indexed
-        self._instructions_0xdd[0xaf] = None
-
-        self._instructions_0xdd[0xb0] = None
-        self._instructions_0xdd[0xb1] = None
-        self._instructions_0xdd[0xb2] = None
-        self._instructions_0xdd[0xb3] = None
-        self._instructions_0xdd[0xb4] = None
-        self._instructions_0xdd[0xb5] = None
-        self._instructions_0xdd[0xb6] = self._alu_mem_indexed
-        self._instructions_0xdd[0xb7] = None
-        self._instructions_0xdd[0xb8] = None
-        self._instructions_0xdd[0xb9] = None
-        self._instructions_0xdd[0xba] = None
-        self._instructions_0xdd[0xbb] = None
-        self._instructions_0xdd[0xbc] = None
-        self._instructions_0xdd[0xbd] = None
-        self._instructions_0xdd[0xbe] = self._alu_mem_indexed
-        self._instructions_0xdd[0xbf] = None
-
-        self._instructions_0xdd[0xc0] = None
-        self._instructions_0xdd[0xc1] = None
-        self._instructions_0xdd[0xc2] = None
-        self._instructions_0xdd[0xc3] = None
-        self._instructions_0xdd[0xc4] = None
-        self._instructions_0xdd[0xc5] = None
-        self._instructions_0xdd[0xc6] = None
-        self._instructions_0xdd[0xc7] = None
-        self._instructions_0xdd[0xc8] = None
-        self._instructions_0xdd[0xc9] = None
-        self._instructions_0xdd[0xca] = None
-        self._instructions_0xdd[0xcb] = None
-        self._instructions_0xdd[0xcc] = None
-        self._instructions_0xdd[0xcd] = None
-        self._instructions_0xdd[0xce] = None
-        self._instructions_0xdd[0xcf] = None
-
-        self._instructions_0xdd[0xd0] = None
-        self._instructions_0xdd[0xd1] = None
-        self._instructions_0xdd[0xd2] = None
-        self._instructions_0xdd[0xd3] = None
-        self._instructions_0xdd[0xd4] = None
-        self._instructions_0xdd[0xd5] = None
-        self._instructions_0xdd[0xd6] = None
-        self._instructions_0xdd[0xd7] = None
-        self._instructions_0xdd[0xd8] = None
-        self._instructions_0xdd[0xd9] = None
-        self._instructions_0xdd[0xda] = None
-        self._instructions_0xdd[0xdb] = None
-        self._instructions_0xdd[0xdc] = None
-        self._instructions_0xdd[0xdd] = None
-        self._instructions_0xdd[0xde] = None
-        self._instructions_0xdd[0xdf] = None
-
-        self._instructions_0xdd[0xe0] = None
-        self._instructions_0xdd[0xe1] = self._pop_idx
-        self._instructions_0xdd[0xe2] = None
-        self._instructions_0xdd[0xe3] = None
-        self._instructions_0xdd[0xe4] = None
-        self._instructions_0xdd[0xe5] = self._push_idx
-        self._instructions_0xdd[0xe6] = None
-        self._instructions_0xdd[0xe7] = None
-        self._instructions_0xdd[0xe8] = None
-        self._instructions_0xdd[0xe9] = self._jp_idx_reg
-        self._instructions_0xdd[0xea] = None
-        self._instructions_0xdd[0xeb] = None
-        self._instructions_0xdd[0xec] = None
-        self._instructions_0xdd[0xed] = None
-        self._instructions_0xdd[0xee] = None
-        self._instructions_0xdd[0xef] = None
-
-        self._instructions_0xdd[0xf0] = None
-        self._instructions_0xdd[0xf1] = None
-        self._instructions_0xdd[0xf2] = None
-        self._instructions_0xdd[0xf3] = None
-        self._instructions_0xdd[0xf4] = None
-        self._instructions_0xdd[0xf5] = None
-        self._instructions_0xdd[0xf6] = None
-        self._instructions_0xdd[0xf7] = None
-        self._instructions_0xdd[0xf8] = None
-        self._instructions_0xdd[0xf9] = None
-        self._instructions_0xdd[0xfa] = None
-        self._instructions_0xdd[0xfb] = None
-        self._instructions_0xdd[0xfc] = None
-        self._instructions_0xdd[0xfd] = None
-        self._instructions_0xdd[0xfe] = None
-        self._instructions_0xdd[0xff] = None
-
-
-    def _init_ddcb_instruction_table(self):
-        """ Initialize IX bit instruction set with 0xDD 0xCB prefix """
-        
-        self._instructions_0xddcb = [None] * 0x100
-
-        self._instructions_0xddcb[0x00] = None
-        self._instructions_0xddcb[0x01] = None
-        self._instructions_0xddcb[0x02] = None
-        self._instructions_0xddcb[0x03] = None
-        self._instructions_0xddcb[0x04] = None
-        self._instructions_0xddcb[0x05] = None
-        self._instructions_0xddcb[0x06] = None
-        self._instructions_0xddcb[0x07] = None
-        self._instructions_0xddcb[0x08] = None
-        self._instructions_0xddcb[0x09] = None
-        self._instructions_0xddcb[0x0a] = None
-        self._instructions_0xddcb[0x0b] = None
-        self._instructions_0xddcb[0x0c] = None
-        self._instructions_0xddcb[0x0d] = None
-        self._instructions_0xddcb[0x0e] = None
-        self._instructions_0xddcb[0x0f] = None
-
-        self._instructions_0xddcb[0x10] = None
-        self._instructions_0xddcb[0x11] = None
-        self._instructions_0xddcb[0x12] = None
-        self._instructions_0xddcb[0x13] = None
-        self._instructions_0xddcb[0x14] = None
-        self._instructions_0xddcb[0x15] = None
-        self._instructions_0xddcb[0x16] = None
-        self._instructions_0xddcb[0x17] = None
-        self._instructions_0xddcb[0x18] = None
-        self._instructions_0xddcb[0x19] = None
-        self._instructions_0xddcb[0x1a] = None
-        self._instructions_0xddcb[0x1b] = None
-        self._instructions_0xddcb[0x1c] = None
-        self._instructions_0xddcb[0x1d] = None
-        self._instructions_0xddcb[0x1e] = None
-        self._instructions_0xddcb[0x1f] = None
-
-        self._instructions_0xddcb[0x20] = None
-        self._instructions_0xddcb[0x21] = None
-        self._instructions_0xddcb[0x22] = None
-        self._instructions_0xddcb[0x23] = None
-        self._instructions_0xddcb[0x24] = None
-        self._instructions_0xddcb[0x25] = None
-        self._instructions_0xddcb[0x26] = None
-        self._instructions_0xddcb[0x27] = None
-        self._instructions_0xddcb[0x28] = None
-        self._instructions_0xddcb[0x29] = None
-        self._instructions_0xddcb[0x2a] = None
-        self._instructions_0xddcb[0x2b] = None
-        self._instructions_0xddcb[0x2c] = None
-        self._instructions_0xddcb[0x2d] = None
-        self._instructions_0xddcb[0x2e] = None
-        self._instructions_0xddcb[0x2f] = None
-
-        self._instructions_0xddcb[0x30] = None
-        self._instructions_0xddcb[0x31] = None
-        self._instructions_0xddcb[0x32] = None
-        self._instructions_0xddcb[0x33] = None
-        self._instructions_0xddcb[0x34] = None
-        self._instructions_0xddcb[0x35] = None
-        self._instructions_0xddcb[0x36] = None
-        self._instructions_0xddcb[0x37] = None
-        self._instructions_0xddcb[0x38] = None
-        self._instructions_0xddcb[0x39] = None
-        self._instructions_0xddcb[0x3a] = None
-        self._instructions_0xddcb[0x3b] = None
-        self._instructions_0xddcb[0x3c] = None
-        self._instructions_0xddcb[0x3d] = None
-        self._instructions_0xddcb[0x3e] = None
-        self._instructions_0xddcb[0x3f] = None
-
-        self._instructions_0xddcb[0x40] = None
-        self._instructions_0xddcb[0x41] = None
-        self._instructions_0xddcb[0x42] = None
-        self._instructions_0xddcb[0x43] = None
-        self._instructions_0xddcb[0x44] = None
-        self._instructions_0xddcb[0x45] = None
-        self._instructions_0xddcb[0x46] = self._get_bit_indexed
-        self._instructions_0xddcb[0x47] = None
-        self._instructions_0xddcb[0x48] = None
-        self._instructions_0xddcb[0x49] = None
-        self._instructions_0xddcb[0x4a] = None
-        self._instructions_0xddcb[0x4b] = None
-        self._instructions_0xddcb[0x4c] = None
-        self._instructions_0xddcb[0x4d] = None
-        self._instructions_0xddcb[0x4e] = self._get_bit_indexed
-        self._instructions_0xddcb[0x4f] = None
-
-        self._instructions_0xddcb[0x50] = None
-        self._instructions_0xddcb[0x51] = None
-        self._instructions_0xddcb[0x52] = None
-        self._instructions_0xddcb[0x53] = None
-        self._instructions_0xddcb[0x54] = None
-        self._instructions_0xddcb[0x55] = None
-        self._instructions_0xddcb[0x56] = self._get_bit_indexed
-        self._instructions_0xddcb[0x57] = None
-        self._instructions_0xddcb[0x58] = None
-        self._instructions_0xddcb[0x59] = None
-        self._instructions_0xddcb[0x5a] = None
-        self._instructions_0xddcb[0x5b] = None
-        self._instructions_0xddcb[0x5c] = None
-        self._instructions_0xddcb[0x5d] = None
-        self._instructions_0xddcb[0x5e] = self._get_bit_indexed
-        self._instructions_0xddcb[0x5f] = None
-
-        self._instructions_0xddcb[0x60] = None
-        self._instructions_0xddcb[0x61] = None
-        self._instructions_0xddcb[0x62] = None
-        self._instructions_0xddcb[0x63] = None
-        self._instructions_0xddcb[0x64] = None
-        self._instructions_0xddcb[0x65] = None
-        self._instructions_0xddcb[0x66] = self._get_bit_indexed
-        self._instructions_0xddcb[0x67] = None
-        self._instructions_0xddcb[0x68] = None
-        self._instructions_0xddcb[0x69] = None
-        self._instructions_0xddcb[0x6a] = None
-        self._instructions_0xddcb[0x6b] = None
-        self._instructions_0xddcb[0x6c] = None
-        self._instructions_0xddcb[0x6d] = None
-        self._instructions_0xddcb[0x6e] = self._get_bit_indexed
-        self._instructions_0xddcb[0x6f] = None
-
-        self._instructions_0xddcb[0x70] = None
-        self._instructions_0xddcb[0x71] = None
-        self._instructions_0xddcb[0x72] = None
-        self._instructions_0xddcb[0x73] = None
-        self._instructions_0xddcb[0x74] = None
-        self._instructions_0xddcb[0x75] = None
-        self._instructions_0xddcb[0x76] = self._get_bit_indexed
-        self._instructions_0xddcb[0x77] = None
-        self._instructions_0xddcb[0x78] = None
-        self._instructions_0xddcb[0x79] = None
-        self._instructions_0xddcb[0x7a] = None
-        self._instructions_0xddcb[0x7b] = None
-        self._instructions_0xddcb[0x7c] = None
-        self._instructions_0xddcb[0x7d] = None
-        self._instructions_0xddcb[0x7e] = self._get_bit_indexed
-        self._instructions_0xddcb[0x7f] = None
-
-        self._instructions_0xddcb[0x80] = None
-        self._instructions_0xddcb[0x81] = None
-        self._instructions_0xddcb[0x82] = None
-        self._instructions_0xddcb[0x83] = None
-        self._instructions_0xddcb[0x84] = None
-        self._instructions_0xddcb[0x85] = None
-        self._instructions_0xddcb[0x86] = self._reset_bit_indexed
-        self._instructions_0xddcb[0x87] = None
-        self._instructions_0xddcb[0x88] = None
-        self._instructions_0xddcb[0x89] = None
-        self._instructions_0xddcb[0x8a] = None
-        self._instructions_0xddcb[0x8b] = None
-        self._instructions_0xddcb[0x8c] = None
-        self._instructions_0xddcb[0x8d] = None
-        self._instructions_0xddcb[0x8e] = self._reset_bit_indexed
-        self._instructions_0xddcb[0x8f] = None
-
-        self._instructions_0xddcb[0x90] = None
-        self._instructions_0xddcb[0x91] = None
-        self._instructions_0xddcb[0x92] = None
-        self._instructions_0xddcb[0x93] = None
-        self._instructions_0xddcb[0x94] = None
-        self._instructions_0xddcb[0x95] = None
-        self._instructions_0xddcb[0x96] = self._reset_bit_indexed
-        self._instructions_0xddcb[0x97] = None
-        self._instructions_0xddcb[0x98] = None
-        self._instructions_0xddcb[0x99] = None
-        self._instructions_0xddcb[0x9a] = None
-        self._instructions_0xddcb[0x9b] = None
-        self._instructions_0xddcb[0x9c] = None
-        self._instructions_0xddcb[0x9d] = None
-        self._instructions_0xddcb[0x9e] = self._reset_bit_indexed
-        self._instructions_0xddcb[0x9f] = None
-
-        self._instructions_0xddcb[0xa0] = None
-        self._instructions_0xddcb[0xa1] = None
-        self._instructions_0xddcb[0xa2] = None
-        self._instructions_0xddcb[0xa3] = None
-        self._instructions_0xddcb[0xa4] = None
-        self._instructions_0xddcb[0xa5] = None
-        self._instructions_0xddcb[0xa6] = self._reset_bit_indexed
-        self._instructions_0xddcb[0xa7] = None
-        self._instructions_0xddcb[0xa8] = None
-        self._instructions_0xddcb[0xa9] = None
-        self._instructions_0xddcb[0xaa] = None
-        self._instructions_0xddcb[0xab] = None
-        self._instructions_0xddcb[0xac] = None
-        self._instructions_0xddcb[0xad] = None
-        self._instructions_0xddcb[0xae] = self._reset_bit_indexed
-        self._instructions_0xddcb[0xaf] = None
-
-        self._instructions_0xddcb[0xb0] = None
-        self._instructions_0xddcb[0xb1] = None
-        self._instructions_0xddcb[0xb2] = None
-        self._instructions_0xddcb[0xb3] = None
-        self._instructions_0xddcb[0xb4] = None
-        self._instructions_0xddcb[0xb5] = None
-        self._instructions_0xddcb[0xb6] = self._reset_bit_indexed
-        self._instructions_0xddcb[0xb7] = None
-        self._instructions_0xddcb[0xb8] = None
-        self._instructions_0xddcb[0xb9] = None
-        self._instructions_0xddcb[0xba] = None
-        self._instructions_0xddcb[0xbb] = None
-        self._instructions_0xddcb[0xbc] = None
-        self._instructions_0xddcb[0xbd] = None
-        self._instructions_0xddcb[0xbe] = self._reset_bit_indexed
-        self._instructions_0xddcb[0xbf] = None
-
-        self._instructions_0xddcb[0xc0] = None
-        self._instructions_0xddcb[0xc1] = None
-        self._instructions_0xddcb[0xc2] = None
-        self._instructions_0xddcb[0xc3] = None
-        self._instructions_0xddcb[0xc4] = None
-        self._instructions_0xddcb[0xc5] = None
-        self._instructions_0xddcb[0xc6] = self._set_bit_indexed
-        self._instructions_0xddcb[0xc7] = None
-        self._instructions_0xddcb[0xc8] = None
-        self._instructions_0xddcb[0xc9] = None
-        self._instructions_0xddcb[0xca] = None
-        self._instructions_0xddcb[0xcb] = None
-        self._instructions_0xddcb[0xcc] = None
-        self._instructions_0xddcb[0xcd] = None
-        self._instructions_0xddcb[0xce] = self._set_bit_indexed
-        self._instructions_0xddcb[0xcf] = None
-
-        self._instructions_0xddcb[0xd0] = None
-        self._instructions_0xddcb[0xd1] = None
-        self._instructions_0xddcb[0xd2] = None
-        self._instructions_0xddcb[0xd3] = None
-        self._instructions_0xddcb[0xd4] = None
-        self._instructions_0xddcb[0xd5] = None
-        self._instructions_0xddcb[0xd6] = self._set_bit_indexed
-        self._instructions_0xddcb[0xd7] = None
-        self._instructions_0xddcb[0xd8] = None
-        self._instructions_0xddcb[0xd9] = None
-        self._instructions_0xddcb[0xda] = None
-        self._instructions_0xddcb[0xdb] = None
-        self._instructions_0xddcb[0xdc] = None
-        self._instructions_0xddcb[0xdd] = None
-        self._instructions_0xddcb[0xde] = self._set_bit_indexed
-        self._instructions_0xddcb[0xdf] = None
-
-        self._instructions_0xddcb[0xe0] = None
-        self._instructions_0xddcb[0xe1] = None
-        self._instructions_0xddcb[0xe2] = None
-        self._instructions_0xddcb[0xe3] = None
-        self._instructions_0xddcb[0xe4] = None
-        self._instructions_0xddcb[0xe5] = None
-        self._instructions_0xddcb[0xe6] = self._set_bit_indexed
-        self._instructions_0xddcb[0xe7] = None
-        self._instructions_0xddcb[0xe8] = None
-        self._instructions_0xddcb[0xe9] = None
-        self._instructions_0xddcb[0xea] = None
-        self._instructions_0xddcb[0xeb] = None
-        self._instructions_0xddcb[0xec] = None
-        self._instructions_0xddcb[0xed] = None
-        self._instructions_0xddcb[0xee] = self._set_bit_indexed
-        self._instructions_0xddcb[0xef] = None
-
-        self._instructions_0xddcb[0xf0] = None
-        self._instructions_0xddcb[0xf1] = None
-        self._instructions_0xddcb[0xf2] = None
-        self._instructions_0xddcb[0xf3] = None
-        self._instructions_0xddcb[0xf4] = None
-        self._instructions_0xddcb[0xf5] = None
-        self._instructions_0xddcb[0xf6] = self._set_bit_indexed
-        self._instructions_0xddcb[0xf7] = None
-        self._instructions_0xddcb[0xf8] = None
-        self._instructions_0xddcb[0xf9] = None
-        self._instructions_0xddcb[0xfa] = None
-        self._instructions_0xddcb[0xfb] = None
-        self._instructions_0xddcb[0xfc] = None
-        self._instructions_0xddcb[0xfd] = None
-        self._instructions_0xddcb[0xfe] = self._set_bit_indexed
-        self._instructions_0xddcb[0xff] = None
-
-
-    def _init_fd_instruction_table(self):
-        """ Initialize IY instruction set with 0xFD prefix """
-        
-        self._instructions_0xfd = [None] * 0x100
-
-        self._instructions_0xfd[0x00] = None
-        self._instructions_0xfd[0x01] = None
-        self._instructions_0xfd[0x02] = None
-        self._instructions_0xfd[0x03] = None
-        self._instructions_0xfd[0x04] = None
-        self._instructions_0xfd[0x05] = None
-        self._instructions_0xfd[0x06] = None
-        self._instructions_0xfd[0x07] = None
-        self._instructions_0xfd[0x08] = None
-        self._instructions_0xfd[0x09] = self._add_idx_reg16
-        self._instructions_0xfd[0x0a] = None
-        self._instructions_0xfd[0x0b] = None
-        self._instructions_0xfd[0x0c] = None
-        self._instructions_0xfd[0x0d] = None
-        self._instructions_0xfd[0x0e] = None
-        self._instructions_0xfd[0x0f] = None
-
-        self._instructions_0xfd[0x10] = None
-        self._instructions_0xfd[0x11] = None
-        self._instructions_0xfd[0x12] = None
-        self._instructions_0xfd[0x13] = None
-        self._instructions_0xfd[0x14] = None
-        self._instructions_0xfd[0x15] = None
-        self._instructions_0xfd[0x16] = None
-        self._instructions_0xfd[0x17] = None
-        self._instructions_0xfd[0x18] = None
-        self._instructions_0xfd[0x19] = self._add_idx_reg16
-        self._instructions_0xfd[0x1a] = None
-        self._instructions_0xfd[0x1b] = None
-        self._instructions_0xfd[0x1c] = None
-        self._instructions_0xfd[0x1d] = None
-        self._instructions_0xfd[0x1e] = None
-        self._instructions_0xfd[0x1f] = None
-
-        self._instructions_0xfd[0x20] = None
-        self._instructions_0xfd[0x21] = self._load_idx_immediate
-        self._instructions_0xfd[0x22] = None
-        self._instructions_0xfd[0x23] = None
-        self._instructions_0xfd[0x24] = None
-        self._instructions_0xfd[0x25] = None
-        self._instructions_0xfd[0x26] = None
-        self._instructions_0xfd[0x27] = None
-        self._instructions_0xfd[0x28] = None
-        self._instructions_0xfd[0x29] = self._add_idx_reg16
-        self._instructions_0xfd[0x2a] = None
-        self._instructions_0xfd[0x2b] = None
-        self._instructions_0xfd[0x2c] = None
-        self._instructions_0xfd[0x2d] = None
-        self._instructions_0xfd[0x2e] = None
-        self._instructions_0xfd[0x2f] = None
-
-        self._instructions_0xfd[0x30] = None
-        self._instructions_0xfd[0x31] = None
-        self._instructions_0xfd[0x32] = None
-        self._instructions_0xfd[0x33] = None
-        self._instructions_0xfd[0x34] = self._inc_mem_indexed
-        self._instructions_0xfd[0x35] = self._dec_mem_indexed
-        self._instructions_0xfd[0x36] = self._store_value_to_indexed_mem
-        self._instructions_0xfd[0x37] = None
-        self._instructions_0xfd[0x38] = None
-        self._instructions_0xfd[0x39] = self._add_idx_reg16
-        self._instructions_0xfd[0x3a] = None
-        self._instructions_0xfd[0x3b] = None
-        self._instructions_0xfd[0x3c] = None
-        self._instructions_0xfd[0x3d] = None
-        self._instructions_0xfd[0x3e] = None
-        self._instructions_0xfd[0x3f] = None
-
-        self._instructions_0xfd[0x40] = None
-        self._instructions_0xfd[0x41] = None
-        self._instructions_0xfd[0x42] = None
-        self._instructions_0xfd[0x43] = None
-        self._instructions_0xfd[0x44] = None
-        self._instructions_0xfd[0x45] = None
-        self._instructions_0xfd[0x46] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x47] = None
-        self._instructions_0xfd[0x48] = None
-        self._instructions_0xfd[0x49] = None
-        self._instructions_0xfd[0x4a] = None
-        self._instructions_0xfd[0x4b] = None
-        self._instructions_0xfd[0x4c] = None
-        self._instructions_0xfd[0x4d] = None
-        self._instructions_0xfd[0x4e] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x4f] = None
-
-        self._instructions_0xfd[0x50] = None
-        self._instructions_0xfd[0x51] = None
-        self._instructions_0xfd[0x52] = None
-        self._instructions_0xfd[0x53] = None
-        self._instructions_0xfd[0x54] = None
-        self._instructions_0xfd[0x55] = None
-        self._instructions_0xfd[0x56] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x57] = None
-        self._instructions_0xfd[0x58] = None
-        self._instructions_0xfd[0x59] = None
-        self._instructions_0xfd[0x5a] = None
-        self._instructions_0xfd[0x5b] = None
-        self._instructions_0xfd[0x5c] = None
-        self._instructions_0xfd[0x5d] = None
-        self._instructions_0xfd[0x5e] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x5f] = None
-
-        self._instructions_0xfd[0x60] = None
-        self._instructions_0xfd[0x61] = None
-        self._instructions_0xfd[0x62] = None
-        self._instructions_0xfd[0x63] = None
-        self._instructions_0xfd[0x64] = None
-        self._instructions_0xfd[0x65] = None
-        self._instructions_0xfd[0x66] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x67] = None
-        self._instructions_0xfd[0x68] = None
-        self._instructions_0xfd[0x69] = None
-        self._instructions_0xfd[0x6a] = None
-        self._instructions_0xfd[0x6b] = None
-        self._instructions_0xfd[0x6c] = None
-        self._instructions_0xfd[0x6d] = None
-        self._instructions_0xfd[0x6e] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x6f] = None
-
-        self._instructions_0xfd[0x70] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x71] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x72] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x73] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x74] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x75] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x76] = None
-        self._instructions_0xfd[0x77] = self._store_reg_to_indexed_mem
-        self._instructions_0xfd[0x78] = None
-        self._instructions_0xfd[0x79] = None
-        self._instructions_0xfd[0x7a] = None
-        self._instructions_0xfd[0x7b] = None
-        self._instructions_0xfd[0x7c] = None
-        self._instructions_0xfd[0x7d] = None
-        self._instructions_0xfd[0x7e] = self._load_reg_from_indexed_mem
-        self._instructions_0xfd[0x7f] = None
-
-        self._instructions_0xfd[0x80] = None
-        self._instructions_0xfd[0x81] = None
-        self._instructions_0xfd[0x82] = None
-        self._instructions_0xfd[0x83] = None
-        self._instructions_0xfd[0x84] = None
-        self._instructions_0xfd[0x85] = None
-        self._instructions_0xfd[0x86] = self._alu_mem_indexed
-        self._instructions_0xfd[0x87] = None
-        self._instructions_0xfd[0x88] = None
-        self._instructions_0xfd[0x89] = None
-        self._instructions_0xfd[0x8a] = None
-        self._instructions_0xfd[0x8b] = None
-        self._instructions_0xfd[0x8c] = None
-        self._instructions_0xfd[0x8d] = None
-        self._instructions_0xfd[0x8e] = self._alu_mem_indexed
-        self._instructions_0xfd[0x8f] = None
-
-        self._instructions_0xfd[0x90] = None
-        self._instructions_0xfd[0x91] = None
-        self._instructions_0xfd[0x92] = None
-        self._instructions_0xfd[0x93] = None
-        self._instructions_0xfd[0x94] = None
-        self._instructions_0xfd[0x95] = None
-        self._instructions_0xfd[0x96] = self._alu_mem_indexed
-        self._instructions_0xfd[0x97] = None
-        self._instructions_0xfd[0x98] = None
-        self._instructions_0xfd[0x99] = None
-        self._instructions_0xfd[0x9a] = None
-        self._instructions_0xfd[0x9b] = None
-        self._instructions_0xfd[0x9c] = None
-        self._instructions_0xfd[0x9d] = None
-        self._instructions_0xfd[0x9e] = self._alu_mem_indexed
-        self._instructions_0xfd[0x9f] = None
-
-        self._instructions_0xfd[0xa0] = None
-        self._instructions_0xfd[0xa1] = None
-        self._instructions_0xfd[0xa2] = None
-        self._instructions_0xfd[0xa3] = None
-        self._instructions_0xfd[0xa4] = None
-        self._instructions_0xfd[0xa5] = None
-        self._instructions_0xfd[0xa6] = self._alu_mem_indexed
-        self._instructions_0xfd[0xa7] = None
-        self._instructions_0xfd[0xa8] = None
-        self._instructions_0xfd[0xa9] = None
-        self._instructions_0xfd[0xaa] = None
-        self._instructions_0xfd[0xab] = None
-        self._instructions_0xfd[0xac] = None
-        self._instructions_0xfd[0xad] = None
-        self._instructions_0xfd[0xae] = self._alu_mem_indexed
-        self._instructions_0xfd[0xaf] = None
-
-        self._instructions_0xfd[0xb0] = None
-        self._instructions_0xfd[0xb1] = None
-        self._instructions_0xfd[0xb2] = None
-        self._instructions_0xfd[0xb3] = None
-        self._instructions_0xfd[0xb4] = None
-        self._instructions_0xfd[0xb5] = None
-        self._instructions_0xfd[0xb6] = self._alu_mem_indexed
-        self._instructions_0xfd[0xb7] = None
-        self._instructions_0xfd[0xb8] = None
-        self._instructions_0xfd[0xb9] = None
-        self._instructions_0xfd[0xba] = None
-        self._instructions_0xfd[0xbb] = None
-        self._instructions_0xfd[0xbc] = None
-        self._instructions_0xfd[0xbd] = None
-        self._instructions_0xfd[0xbe] = self._alu_mem_indexed
-        self._instructions_0xfd[0xbf] = None
-
-        self._instructions_0xfd[0xc0] = None
-        self._instructions_0xfd[0xc1] = None
-        self._instructions_0xfd[0xc2] = None
-        self._instructions_0xfd[0xc3] = None
-        self._instructions_0xfd[0xc4] = None
-        self._instructions_0xfd[0xc5] = None
-        self._instructions_0xfd[0xc6] = None
-        self._instructions_0xfd[0xc7] = None
-        self._instructions_0xfd[0xc8] = None
-        self._instructions_0xfd[0xc9] = None
-        self._instructions_0xfd[0xca] = None
-        self._instructions_0xfd[0xcb] = None
-        self._instructions_0xfd[0xcc] = None
-        self._instructions_0xfd[0xcd] = None
-        self._instructions_0xfd[0xce] = None
-        self._instructions_0xfd[0xcf] = None
-
-        self._instructions_0xfd[0xd0] = None
-        self._instructions_0xfd[0xd1] = None
-        self._instructions_0xfd[0xd2] = None
-        self._instructions_0xfd[0xd3] = None
-        self._instructions_0xfd[0xd4] = None
-        self._instructions_0xfd[0xd5] = None
-        self._instructions_0xfd[0xd6] = None
-        self._instructions_0xfd[0xd7] = None
-        self._instructions_0xfd[0xd8] = None
-        self._instructions_0xfd[0xd9] = None
-        self._instructions_0xfd[0xda] = None
-        self._instructions_0xfd[0xdb] = None
-        self._instructions_0xfd[0xdc] = None
-        self._instructions_0xfd[0xdd] = None
-        self._instructions_0xfd[0xde] = None
-        self._instructions_0xfd[0xdf] = None
-
-        self._instructions_0xfd[0xe0] = None
-        self._instructions_0xfd[0xe1] = self._pop_idx
-        self._instructions_0xfd[0xe2] = None
-        self._instructions_0xfd[0xe3] = None
-        self._instructions_0xfd[0xe4] = None
-        self._instructions_0xfd[0xe5] = self._push_idx
-        self._instructions_0xfd[0xe6] = None
-        self._instructions_0xfd[0xe7] = None
-        self._instructions_0xfd[0xe8] = None
-        self._instructions_0xfd[0xe9] = self._jp_idx_reg
-        self._instructions_0xfd[0xea] = None
-        self._instructions_0xfd[0xeb] = None
-        self._instructions_0xfd[0xec] = None
-        self._instructions_0xfd[0xed] = None
-        self._instructions_0xfd[0xee] = None
-        self._instructions_0xfd[0xef] = None
-
-        self._instructions_0xfd[0xf0] = None
-        self._instructions_0xfd[0xf1] = None
-        self._instructions_0xfd[0xf2] = None
-        self._instructions_0xfd[0xf3] = None
-        self._instructions_0xfd[0xf4] = None
-        self._instructions_0xfd[0xf5] = None
-        self._instructions_0xfd[0xf6] = None
-        self._instructions_0xfd[0xf7] = None
-        self._instructions_0xfd[0xf8] = None
-        self._instructions_0xfd[0xf9] = None
-        self._instructions_0xfd[0xfa] = None
-        self._instructions_0xfd[0xfb] = None
-        self._instructions_0xfd[0xfc] = None
-        self._instructions_0xfd[0xfd] = None
-        self._instructions_0xfd[0xfe] = None
-        self._instructions_0xfd[0xff] = None
-
-
-    def _init_fdcb_instruction_table(self):
-        """ Initialize IY bit instruction set with 0xFD 0xCB prefix """
+        cls._instructions_0xcb = [None] * 0x100
+
+        # Rotate and shift instructions are encoded as [00][op:3][reg:3]. SLA, SRA, and SLL are not implemented.
+        rotate_ops = (
+            CPU._rlc_reg,       # RLC r
+            CPU._rrc_reg,       # RRC r
+            CPU._rl_reg,        # RL r
+            CPU._rr_reg,        # RR r
+            None,               # SLA r
+            None,               # SRA r
+            None,               # SLL r
+            CPU._srl,           # SRL r
+        )
+        for op, handler in enumerate(rotate_ops):
+            if handler is None:
+                continue
+            for reg in range(8):
+                cls._instructions_0xcb[(op << 3) | reg] = bind_operands(handler, reg)
+
+        # BIT, RES, and SET instructions are encoded as [op:2][bit:3][reg:3]. Register index and bit mask
+        # are bound to the handler once here, so that handlers do not need to decode the opcode at runtime.
+        # RES handlers get an inverted mask. (HL) operand (reg == 6) has dedicated read-modify-write handlers.
+        for bit in range(8):
+            mask = BIT_MASKS[bit]
+            reset_mask = RESET_BIT_MASKS[bit]
+            for reg in range(8):
+                if reg == 6:
+                    cls._instructions_0xcb[0x40 | (bit << 3) | reg] = bind_operands(CPU._get_bit_hl, mask)           # BIT b, (HL)
+                    cls._instructions_0xcb[0x80 | (bit << 3) | reg] = bind_operands(CPU._reset_bit_hl, reset_mask)   # RES b, (HL)
+                    cls._instructions_0xcb[0xc0 | (bit << 3) | reg] = bind_operands(CPU._set_bit_hl, mask)           # SET b, (HL)
+                else:
+                    cls._instructions_0xcb[0x40 | (bit << 3) | reg] = bind_operands(CPU._get_bit, reg, mask)           # BIT b, r
+                    cls._instructions_0xcb[0x80 | (bit << 3) | reg] = bind_operands(CPU._reset_bit, reg, reset_mask)   # RES b, r
+                    cls._instructions_0xcb[0xc0 | (bit << 3) | reg] = bind_operands(CPU._set_bit, reg, mask)           # SET b, r
+
+        cls._instructions_0xcb = tuple(cls._instructions_0xcb)
+
+
+    @classmethod
+    def _init_dd_instruction_table(cls):
+        """
+        Initialize IX instruction set with 0xDD prefix.
+
+        IY instructions with 0xFD prefix are exactly the same, except for the index register used. The
+        table is shared between both prefixes, and handlers select IX or IY depending on the prefix.
+        """
         
-        self._instructions_0xfdcb = [None] * 0x100
-
-        self._instructions_0xfdcb[0x00] = None
-        self._instructions_0xfdcb[0x01] = None
-        self._instructions_0xfdcb[0x02] = None
-        self._instructions_0xfdcb[0x03] = None
-        self._instructions_0xfdcb[0x04] = None
-        self._instructions_0xfdcb[0x05] = None
-        self._instructions_0xfdcb[0x06] = None
-        self._instructions_0xfdcb[0x07] = None
-        self._instructions_0xfdcb[0x08] = None
-        self._instructions_0xfdcb[0x09] = None
-        self._instructions_0xfdcb[0x0a] = None
-        self._instructions_0xfdcb[0x0b] = None
-        self._instructions_0xfdcb[0x0c] = None
-        self._instructions_0xfdcb[0x0d] = None
-        self._instructions_0xfdcb[0x0e] = None
-        self._instructions_0xfdcb[0x0f] = None
-
-        self._instructions_0xfdcb[0x10] = None
-        self._instructions_0xfdcb[0x11] = None
-        self._instructions_0xfdcb[0x12] = None
-        self._instructions_0xfdcb[0x13] = None
-        self._instructions_0xfdcb[0x14] = None
-        self._instructions_0xfdcb[0x15] = None
-        self._instructions_0xfdcb[0x16] = None
-        self._instructions_0xfdcb[0x17] = None
-        self._instructions_0xfdcb[0x18] = None
-        self._instructions_0xfdcb[0x19] = None
-        self._instructions_0xfdcb[0x1a] = None
-        self._instructions_0xfdcb[0x1b] = None
-        self._instructions_0xfdcb[0x1c] = None
-        self._instructions_0xfdcb[0x1d] = None
-        self._instructions_0xfdcb[0x1e] = None
-        self._instructions_0xfdcb[0x1f] = None
-
-        self._instructions_0xfdcb[0x20] = None
-        self._instructions_0xfdcb[0x21] = None
-        self._instructions_0xfdcb[0x22] = None
-        self._instructions_0xfdcb[0x23] = None
-        self._instructions_0xfdcb[0x24] = None
-        self._instructions_0xfdcb[0x25] = None
-        self._instructions_0xfdcb[0x26] = None
-        self._instructions_0xfdcb[0x27] = None
-        self._instructions_0xfdcb[0x28] = None
-        self._instructions_0xfdcb[0x29] = None
-        self._instructions_0xfdcb[0x2a] = None
-        self._instructions_0xfdcb[0x2b] = None
-        self._instructions_0xfdcb[0x2c] = None
-        self._instructions_0xfdcb[0x2d] = None
-        self._instructions_0xfdcb[0x2e] = None
-        self._instructions_0xfdcb[0x2f] = None
-
-        self._instructions_0xfdcb[0x30] = None
-        self._instructions_0xfdcb[0x31] = None
-        self._instructions_0xfdcb[0x32] = None
-        self._instructions_0xfdcb[0x33] = None
-        self._instructions_0xfdcb[0x34] = None
-        self._instructions_0xfdcb[0x35] = None
-        self._instructions_0xfdcb[0x36] = None
-        self._instructions_0xfdcb[0x37] = None
-        self._instructions_0xfdcb[0x38] = None
-        self._instructions_0xfdcb[0x39] = None
-        self._instructions_0xfdcb[0x3a] = None
-        self._instructions_0xfdcb[0x3b] = None
-        self._instructions_0xfdcb[0x3c] = None
-        self._instructions_0xfdcb[0x3d] = None
-        self._instructions_0xfdcb[0x3e] = None
-        self._instructions_0xfdcb[0x3f] = None
-
-        self._instructions_0xfdcb[0x40] = None
-        self._instructions_0xfdcb[0x41] = None
-        self._instructions_0xfdcb[0x42] = None
-        self._instructions_0xfdcb[0x43] = None
-        self._instructions_0xfdcb[0x44] = None
-        self._instructions_0xfdcb[0x45] = None
-        self._instructions_0xfdcb[0x46] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x47] = None
-        self._instructions_0xfdcb[0x48] = None
-        self._instructions_0xfdcb[0x49] = None
-        self._instructions_0xfdcb[0x4a] = None
-        self._instructions_0xfdcb[0x4b] = None
-        self._instructions_0xfdcb[0x4c] = None
-        self._instructions_0xfdcb[0x4d] = None
-        self._instructions_0xfdcb[0x4e] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x4f] = None
-
-        self._instructions_0xfdcb[0x50] = None
-        self._instructions_0xfdcb[0x51] = None
-        self._instructions_0xfdcb[0x52] = None
-        self._instructions_0xfdcb[0x53] = None
-        self._instructions_0xfdcb[0x54] = None
-        self._instructions_0xfdcb[0x55] = None
-        self._instructions_0xfdcb[0x56] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x57] = None
-        self._instructions_0xfdcb[0x58] = None
-        self._instructions_0xfdcb[0x59] = None
-        self._instructions_0xfdcb[0x5a] = None
-        self._instructions_0xfdcb[0x5b] = None
-        self._instructions_0xfdcb[0x5c] = None
-        self._instructions_0xfdcb[0x5d] = None
-        self._instructions_0xfdcb[0x5e] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x5f] = None
-
-        self._instructions_0xfdcb[0x60] = None
-        self._instructions_0xfdcb[0x61] = None
-        self._instructions_0xfdcb[0x62] = None
-        self._instructions_0xfdcb[0x63] = None
-        self._instructions_0xfdcb[0x64] = None
-        self._instructions_0xfdcb[0x65] = None
-        self._instructions_0xfdcb[0x66] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x67] = None
-        self._instructions_0xfdcb[0x68] = None
-        self._instructions_0xfdcb[0x69] = None
-        self._instructions_0xfdcb[0x6a] = None
-        self._instructions_0xfdcb[0x6b] = None
-        self._instructions_0xfdcb[0x6c] = None
-        self._instructions_0xfdcb[0x6d] = None
-        self._instructions_0xfdcb[0x6e] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x6f] = None
-
-        self._instructions_0xfdcb[0x70] = None
-        self._instructions_0xfdcb[0x71] = None
-        self._instructions_0xfdcb[0x72] = None
-        self._instructions_0xfdcb[0x73] = None
-        self._instructions_0xfdcb[0x74] = None
-        self._instructions_0xfdcb[0x75] = None
-        self._instructions_0xfdcb[0x76] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x77] = None
-        self._instructions_0xfdcb[0x78] = None
-        self._instructions_0xfdcb[0x79] = None
-        self._instructions_0xfdcb[0x7a] = None
-        self._instructions_0xfdcb[0x7b] = None
-        self._instructions_0xfdcb[0x7c] = None
-        self._instructions_0xfdcb[0x7d] = None
-        self._instructions_0xfdcb[0x7e] = self._get_bit_indexed
-        self._instructions_0xfdcb[0x7f] = None
-
-        self._instructions_0xfdcb[0x80] = None
-        self._instructions_0xfdcb[0x81] = None
-        self._instructions_0xfdcb[0x82] = None
-        self._instructions_0xfdcb[0x83] = None
-        self._instructions_0xfdcb[0x84] = None
-        self._instructions_0xfdcb[0x85] = None
-        self._instructions_0xfdcb[0x86] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0x87] = None
-        self._instructions_0xfdcb[0x88] = None
-        self._instructions_0xfdcb[0x89] = None
-        self._instructions_0xfdcb[0x8a] = None
-        self._instructions_0xfdcb[0x8b] = None
-        self._instructions_0xfdcb[0x8c] = None
-        self._instructions_0xfdcb[0x8d] = None
-        self._instructions_0xfdcb[0x8e] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0x8f] = None
-
-        self._instructions_0xfdcb[0x90] = None
-        self._instructions_0xfdcb[0x91] = None
-        self._instructions_0xfdcb[0x92] = None
-        self._instructions_0xfdcb[0x93] = None
-        self._instructions_0xfdcb[0x94] = None
-        self._instructions_0xfdcb[0x95] = None
-        self._instructions_0xfdcb[0x96] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0x97] = None
-        self._instructions_0xfdcb[0x98] = None
-        self._instructions_0xfdcb[0x99] = None
-        self._instructions_0xfdcb[0x9a] = None
-        self._instructions_0xfdcb[0x9b] = None
-        self._instructions_0xfdcb[0x9c] = None
-        self._instructions_0xfdcb[0x9d] = None
-        self._instructions_0xfdcb[0x9e] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0x9f] = None
-
-        self._instructions_0xfdcb[0xa0] = None
-        self._instructions_0xfdcb[0xa1] = None
-        self._instructions_0xfdcb[0xa2] = None
-        self._instructions_0xfdcb[0xa3] = None
-        self._instructions_0xfdcb[0xa4] = None
-        self._instructions_0xfdcb[0xa5] = None
-        self._instructions_0xfdcb[0xa6] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0xa7] = None
-        self._instructions_0xfdcb[0xa8] = None
-        self._instructions_0xfdcb[0xa9] = None
-        self._instructions_0xfdcb[0xaa] = None
-        self._instructions_0xfdcb[0xab] = None
-        self._instructions_0xfdcb[0xac] = None
-        self._instructions_0xfdcb[0xad] = None
-        self._instructions_0xfdcb[0xae] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0xaf] = None
-
-        self._instructions_0xfdcb[0xb0] = None
-        self._instructions_0xfdcb[0xb1] = None
-        self._instructions_0xfdcb[0xb2] = None
-        self._instructions_0xfdcb[0xb3] = None
-        self._instructions_0xfdcb[0xb4] = None
-        self._instructions_0xfdcb[0xb5] = None
-        self._instructions_0xfdcb[0xb6] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0xb7] = None
-        self._instructions_0xfdcb[0xb8] = None
-        self._instructions_0xfdcb[0xb9] = None
-        self._instructions_0xfdcb[0xba] = None
-        self._instructions_0xfdcb[0xbb] = None
-        self._instructions_0xfdcb[0xbc] = None
-        self._instructions_0xfdcb[0xbd] = None
-        self._instructions_0xfdcb[0xbe] = self._reset_bit_indexed
-        self._instructions_0xfdcb[0xbf] = None
-
-        self._instructions_0xfdcb[0xc0] = None
-        self._instructions_0xfdcb[0xc1] = None
-        self._instructions_0xfdcb[0xc2] = None
-        self._instructions_0xfdcb[0xc3] = None
-        self._instructions_0xfdcb[0xc4] = None
-        self._instructions_0xfdcb[0xc5] = None
-        self._instructions_0xfdcb[0xc6] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xc7] = None
-        self._instructions_0xfdcb[0xc8] = None
-        self._instructions_0xfdcb[0xc9] = None
-        self._instructions_0xfdcb[0xca] = None
-        self._instructions_0xfdcb[0xcb] = None
-        self._instructions_0xfdcb[0xcc] = None
-        self._instructions_0xfdcb[0xcd] = None
-        self._instructions_0xfdcb[0xce] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xcf] = None
-
-        self._instructions_0xfdcb[0xd0] = None
-        self._instructions_0xfdcb[0xd1] = None
-        self._instructions_0xfdcb[0xd2] = None
-        self._instructions_0xfdcb[0xd3] = None
-        self._instructions_0xfdcb[0xd4] = None
-        self._instructions_0xfdcb[0xd5] = None
-        self._instructions_0xfdcb[0xd6] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xd7] = None
-        self._instructions_0xfdcb[0xd8] = None
-        self._instructions_0xfdcb[0xd9] = None
-        self._instructions_0xfdcb[0xda] = None
-        self._instructions_0xfdcb[0xdb] = None
-        self._instructions_0xfdcb[0xdc] = None
-        self._instructions_0xfdcb[0xdd] = None
-        self._instructions_0xfdcb[0xde] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xdf] = None
-
-        self._instructions_0xfdcb[0xe0] = None
-        self._instructions_0xfdcb[0xe1] = None
-        self._instructions_0xfdcb[0xe2] = None
-        self._instructions_0xfdcb[0xe3] = None
-        self._instructions_0xfdcb[0xe4] = None
-        self._instructions_0xfdcb[0xe5] = None
-        self._instructions_0xfdcb[0xe6] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xe7] = None
-        self._instructions_0xfdcb[0xe8] = None
-        self._instructions_0xfdcb[0xe9] = None
-        self._instructions_0xfdcb[0xea] = None
-        self._instructions_0xfdcb[0xeb] = None
-        self._instructions_0xfdcb[0xec] = None
-        self._instructions_0xfdcb[0xed] = None
-        self._instructions_0xfdcb[0xee] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xef] = None
-
-        self._instructions_0xfdcb[0xf0] = None
-        self._instructions_0xfdcb[0xf1] = None
-        self._instructions_0xfdcb[0xf2] = None
-        self._instructions_0xfdcb[0xf3] = None
-        self._instructions_0xfdcb[0xf4] = None
-        self._instructions_0xfdcb[0xf5] = None
-        self._instructions_0xfdcb[0xf6] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xf7] = None
-        self._instructions_0xfdcb[0xf8] = None
-        self._instructions_0xfdcb[0xf9] = None
-        self._instructions_0xfdcb[0xfa] = None
-        self._instructions_0xfdcb[0xfb] = None
-        self._instructions_0xfdcb[0xfc] = None
-        self._instructions_0xfdcb[0xfd] = None
-        self._instructions_0xfdcb[0xfe] = self._set_bit_indexed
-        self._instructions_0xfdcb[0xff] = None
+        cls._instructions_0xdd = [None] * 0x100
+
+        cls._instructions_0xdd[0x09] = CPU._add_idx_reg16
+
+        cls._instructions_0xdd[0x19] = CPU._add_idx_reg16
+
+        cls._instructions_0xdd[0x21] = CPU._load_idx_immediate
+        cls._instructions_0xdd[0x29] = CPU._add_idx_reg16
+
+        cls._instructions_0xdd[0x34] = CPU._inc_mem_indexed
+        cls._instructions_0xdd[0x35] = CPU._dec_mem_indexed
+        cls._instructions_0xdd[0x36] = CPU._store_value_to_indexed_mem
+        cls._instructions_0xdd[0x39] = CPU._add_idx_reg16
+
+        cls._instructions_0xdd[0x46] = CPU._load_reg_from_indexed_mem
+        cls._instructions_0xdd[0x4e] = CPU._load_reg_from_indexed_mem
+
+        cls._instructions_0xdd[0x56] = CPU._load_reg_from_indexed_mem
+        cls._instructions_0xdd[0x5e] = CPU._load_reg_from_indexed_mem
+
+        cls._instructions_0xdd[0x66] = CPU._load_reg_from_indexed_mem
+        cls._instructions_0xdd[0x6e] = CPU._load_reg_from_indexed_mem
+
+        cls._instructions_0xdd[0x70] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x71] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x72] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x73] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x74] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x75] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x77] = CPU._store_reg_to_indexed_mem
+        cls._instructions_0xdd[0x7e] = CPU._load_reg_from_indexed_mem
+
+        cls._instructions_0xdd[0x86] = CPU._alu_mem_indexed
+        cls._instructions_0xdd[0x8e] = CPU._alu_mem_indexed
+
+        cls._instructions_0xdd[0x96] = CPU._alu_mem_indexed
+        cls._instructions_0xdd[0x9e] = CPU._alu_mem_indexed
+
+        cls._instructions_0xdd[0xa6] = CPU._alu_mem_indexed
+        cls._instructions_0xdd[0xae] = CPU._alu_mem_indexed
+
+        cls._instructions_0xdd[0xb6] = CPU._alu_mem_indexed
+        cls._instructions_0xdd[0xbe] = CPU._alu_mem_indexed
+
+        cls._instructions_0xdd[0xe1] = CPU._pop_idx
+        cls._instructions_0xdd[0xe5] = CPU._push_idx
+        cls._instructions_0xdd[0xe9] = CPU._jp_idx_reg
+
+        cls._instructions_0xdd = tuple(cls._instructions_0xdd)
+
+
+    @classmethod
+    def _init_dispatch_table(cls):
+        """
+        Combine all instruction tables into a single flat table of 5 * 256 entries. Each prefix has its own
+        256-entry section (see PREFIX_OFFSETS), so that any instruction is looked up as dispatch[offset + opcode].
+        IX (0xDD) and IY (0xFD) prefixes share the same handlers. 0xDD 0xCB and 0xFD 0xCB prefixed instructions
+        are decoded without a table (see _decode_indexed_bit_instruction()).
+        """
+        dispatch = (cls._instructions +          # No prefix
+                    cls._instructions_0xcb +     # 0xCB
+                    cls._instructions_0xdd +     # 0xDD
+                    cls._instructions_0xed +     # 0xED
+                    cls._instructions_0xdd)      # 0xFD
+
+        # Not implemented instructions raise an exception when executed
+        cls._dispatch = tuple(CPU._invalid_instruction if handler is None else handler for handler in dispatch)
+
 
+CPU._init_instruction_tables()
@@ -1,4 +1,5 @@
 import pygame
+from array import array
 
 from utils import *
 from ram import RAM
@@ -7,74 +8,112 @@ DISPLAY_WIDTH = 256
 DISPLAY_HEIGHT = 192
 SCALE = 2
 
+# Address is calculated as bit shuffle as follows:
+# a12 a11 a10 a9  a8   a7  a6  a5  a4  a3  a2  a1  a0
+# y7  y6  y2  y1  y0   y5  y4  y3  x4  x3  x2  x1  x0
+# see http://www.breakintoprogram.co.uk/hardware/computers/zx-spectrum/screen-memory-layout
+#
+# Here we need a reverse shuffling, to get the y coordinate from the address (Y: a12 a11 a7 a6 a5 a10 a9 a8).
+# The shuffle is constant, so it is computed once for each of the 6144 pixel bytes
+OFFSET_TO_ROW = array('B', [((offset & 0x700) >> 8) | ((offset & 0xe0) >> (5-3)) | ((offset & 0x1800) >> (11-6))
+                            for offset in range(0x1800)])
+
+# Offset of the color attribute of the 8x8 block each pixel byte belongs to
+OFFSET_TO_ATTR = array('H', [0x1800 + (OFFSET_TO_ROW[offset] // 8) * (DISPLAY_WIDTH // 8) + (offset & 0x1f)
+                             for offset in range(0x1800)])
+
+# Offset of the top pixel line of each 8x8 attribute block (Y: a12 a11 = y_block[4:3], a7 a6 a5 = y_block[2:0])
+BLOCK_TO_OFFSET = array('H', [((y_block & 0x18) << 8) | ((y_block & 0x07) << 5) | x_block
+                              for y_block in range(24) for x_block in range(32)])
+
+
+def _get_pixel_runs(value):
+    """ Return (start, length) tuples of set pixel runs in the byte, starting from the leftmost (MSB) pixel """
+    runs = []
+    start = None
+    for bit in range(9):
+        if bit < 8 and value & (0x80 >> bit):
+            if start is None:
+                start = bit
+        elif start is not None:
+            runs.append((start, bit - start))
+            start = None
+    return tuple(runs)
+
+# Each byte value is expanded to pixel runs once, rather than on every video memory write
+PIXEL_RUNS = tuple(_get_pixel_runs(value) for value in range(256))
+
+# ZX spectrum color palete is using GRB colors order, and the 4th bit is used for brightness
+_ZX_PALETTE = (
+    (0x00, 0x00, 0x00), # Black
+    (0x01, 0x00, 0xce), # Dark Blue
+    (0xcf, 0x01, 0x00), # Dark Red
+    (0xcf, 0x01, 0xce), # Dark Magenta
+    (0x00, 0xcf, 0x15), # Dark Green
+    (0x01, 0xcf, 0xcf), # Dark Cyan
+    (0xcf, 0xcf, 0x15), # Dark Yellow
+    (0xcf, 0xcf, 0xcf), # Gray  
+    (0x00, 0x00, 0x00), # 'Bright' Black
+    (0x02, 0x00, 0xfd), # Bright Blue
+    (0xff, 0x02, 0x01), # Bright Red
+    (0xff, 0x02, 0xfd), # Bright Magenta
+    (0x00, 0xff, 0x1c), # Bright Green
+    (0x02, 0xff, 0xff), # Bright Cyan
+    (0xff, 0xff, 0x1d), # Bright Yellow
+    (0xff, 0xff, 0xff), # Whote
+)
+
+
 class Display(RAM):
     def __init__(self):
         RAM.__init__(self, 0x1b00)  # Size is 256*192/8 bytes for pixels, and 256*192/(8*8) = 768 bytes for colors
-        size = (DISPLAY_WIDTH * SCALE, DISPLAY_HEIGHT * SCALE)
-        self._display = pygame.Surface(size)
-        self._display.fill((0, 0, 0))
+        # Pixels are drawn at the native ZX Spectrum resolution, one host pixel per ZX pixel. The picture is
+        # scaled to the window size only once per frame, rather than on every video memory write
+        self._pixels = pygame.Surface((DISPLAY_WIDTH, DISPLAY_HEIGHT))
+        self._pixels.fill((0, 0, 0))
+        self._display = pygame.Surface((DISPLAY_WIDTH * SCALE, DISPLAY_HEIGHT * SCALE))
 
-        # Pixmap
-        self._pixmap = [0] * (DISPLAY_WIDTH * DISPLAY_HEIGHT)
         self._invert_frames = 0
         self._invert = False
 
-        # ZX spectrum color palete is using GRB colors order, and the 4th bit is used for brightness
-        self._colors = [
-            (0x00, 0x00, 0x00), # Black
-            (0x01, 0x00, 0xce), # Dark Blue
-            (0xcf, 0x01, 0x00), # Dark Red
-            (0xcf, 0x01, 0xce), # Dark Magenta
-            (0x00, 0xcf, 0x15), # Dark Green
-            (0x01, 0xcf, 0xcf), # Dark Cyan
-            (0xcf, 0xcf, 0x15), # Dark Yellow
-            (0xcf, 0xcf, 0xcf), # Gray  
-            (0x00, 0x00, 0x00), # 'Bright' Black
-            (0x02, 0x00, 0xfd), # Bright Blue
-            (0xff, 0x02, 0x01), # Bright Red
-            (0xff, 0x02, 0xfd), # Bright Magenta
-            (0x00, 0xff, 0x1c), # Bright Green
-            (0x02, 0xff, 0xff), # Bright Cyan
-            (0xff, 0xff, 0x1d), # Bright Yellow
-            (0xff, 0xff, 0xff), # Whote
-        ]
-
-    def _set_pixel(self, x, y, color):
-        self._display.set_at((x * SCALE, y * SCALE), color)
-        self._display.set_at((x * SCALE + 1, y * SCALE), color)
-        self._display.set_at((x * SCALE, y * SCALE + 1), color)
-        self._display.set_at((x * SCALE + 1, y * SCALE + 1), color)
+        # Video memory writes are not drawn immediately. Changed pixel bytes and attribute blocks are collected
+        # here, and drawn once per frame in update(), so that repeated writes to the same place are drawn once
+        self._dirty_pixels = set()
+        self._dirty_blocks = set()
+
+        # Colors converted to the surface pixel format once, so that drawing does not convert RGB tuples
+        self._packed_colors = [self._pixels.map_rgb(color) for color in _ZX_PALETTE]
+
+        # (foreground, background) colors for each attribute byte value. The second table is used while
+        # FLASH blocks are inverted, and has the colors swapped for attributes with the FLASH bit set
+        attr_colors = []
+        for attr in range(256):
+            fg = attr & 0x7 | ((attr & 0x40) >> 3)
+            bg = (attr & 0x78) >> 3
+            attr_colors.append((self._packed_colors[fg], self._packed_colors[bg]))
+        inverted_attr_colors = [(bg_color, fg_color) if attr & 0x80 else (fg_color, bg_color)
+                                for attr, (fg_color, bg_color) in enumerate(attr_colors)]
+        self._attr_colors = (attr_colors, inverted_attr_colors)
+
+    def _draw_byte(self, x, y, value, fg_color, bg_color):
+        # Fill the whole 8-pixel line with the background color, then draw runs of set pixels with
+        # the foreground color. This takes a few fill() calls per byte, rather than a call per pixel
+        fill = self._pixels.fill
+        fill(bg_color, (x, y, 8, 1))
+        for start, length in PIXEL_RUNS[value]:
+            fill(fg_color, (x + start, y, length, 1))
 
 
     def _update_pixels(self, offset, value):
-        # Address is calculated as bit shuffle as follows:
-        # a12 a11 a10 a9  a8   a7  a6  a5  a4  a3  a2  a1  a0
-        # y7  y6  y2  y1  y0   y5  y4  y3  x4  x3  x2  x1  x0
-        # see http://www.breakintoprogram.co.uk/hardware/computers/zx-spectrum/screen-memory-layout
-        #
-        # Here we need a reverse shuffling, to get the x and y coordinates from the address
-        # X: a4 a3 a2 a1 a0
-        # Y: a12 a11 a7 a6 a5 a10 a9 a8
+        # X coordinate is in the lower address bits (a4 a3 a2 a1 a0), Y is shuffled (see OFFSET_TO_ROW)
         x_block = offset & 0x1f
-        y = ((offset & 0x700) >> 8) | ((offset & 0xe0) >> (5-3)) | ((offset & 0x1800) >> (11-6))
+        y = OFFSET_TO_ROW[offset]
 
         # Get color attributes for the block
-        color_addr = 0x1800 + (y // 8) * (DISPLAY_WIDTH // 8) + x_block
-        attr = self.read_byte(color_addr)
-        bg = (attr & 0x78) >> 3
-        bg_color = self._colors[bg]
-        fg = attr & 0x7 | ((attr & 0x40) >> 3)
-        fg_color = self._colors[fg]
-        invert = (attr & 0x80 != 0) and self._invert
+        attr = self._ram[OFFSET_TO_ATTR[offset]]
+        fg_color, bg_color = self._attr_colors[self._invert][attr]
 
-        # Update pixels in the corresponding block
-        for bit in range(8):
-            x = x_block * 8 + bit
-            mask = 1 << (7 - bit)
-            pixel = value & mask != 0
-
-            self._pixmap[y * DISPLAY_WIDTH + x] = pixel
-            self._set_pixel(x, y, fg_color if pixel ^ invert else bg_color)
+        self._draw_byte(x_block * 8, y, value, fg_color, bg_color)
 
 
     def _update_colors(self, attr_offset, value):
@@ -83,56 +122,56 @@ class Display(RAM):
         y_block = attr_offset // 32
         
         # Get color attributes for the block
-        bg = (value & 0x78) >> 3
-        bg_color = self._colors[bg]
-        fg = value & 0x7 | ((value & 0x40) >> 3)
-        fg_color = self._colors[fg]
-        invert = (value & 0x80 != 0) and self._invert
+        fg_color, bg_color = self._attr_colors[self._invert][value]
 
-        # Update pixel colors in the corresponding block
-        for x_bit in range(8):
-            x = x_block * 8 + x_bit
-            for y_bit in range(8):
-                y = y_block * 8 + y_bit
-                pixel = self._pixmap[y * DISPLAY_WIDTH + x]
-                self._set_pixel(x, y, fg_color if pixel ^ invert else bg_color)
+        # Redraw the block from the pixel bytes in video memory. Pixel lines of a block are 0x100 bytes apart
+        ram = self._ram
+        draw_byte = self._draw_byte
+        offset = BLOCK_TO_OFFSET[attr_offset]
+        x = x_block * 8
+        for y in range(y_block * 8, y_block * 8 + 8):
+            draw_byte(x, y, ram[offset], fg_color, bg_color)
+            offset += 0x100
 
 
     def invert_colors(self):
-        attr_ptr = 0x1800
-        for y_block in range(24):
-            for x_block in range(32):
-                attr = self.read_byte(attr_ptr)
-                attr_ptr += 1
-
-                if attr & 0x80 == 0: # Nothing to do for blocks with no FLASH bit set
-                    continue
-
-                bg = (attr & 0x78) >> 3
-                bg_color = self._colors[bg]
-                fg = attr & 0x7 | ((attr & 0x40) >> 3)
-                fg_color = self._colors[fg]
-                invert = (attr & 0x80 != 0) and self._invert
-
-                # Swap pixel colors in the corresponding block
-                for x_bit in range(8):
-                    x = x_block * 8 + x_bit
-                    for y_bit in range(8):
-                        y = y_block * 8 + y_bit
-                        pixel = self._pixmap[y * DISPLAY_WIDTH + x]
-                        self._set_pixel(x, y, fg_color if pixel ^ invert else bg_color)
+        ram = self._ram
+        for attr_offset in range(0x300):
+            attr = ram[0x1800 + attr_offset]
+            if attr & 0x80: # Nothing to do for blocks with no FLASH bit set
+                self._update_colors(attr_offset, attr)
 
 
     def write_byte(self, offset, value):
+        # The screen already shows the current memory contents, so writing the same value needs no redraw.
+        # Programs often rewrite unchanged screen areas (e.g. when clearing or reprinting the screen)
+        if self._ram[offset] == value:
+            return
+
         # Update the RAM value as usual
         RAM.write_byte(self, offset, value)
 
-        # Then update corresponding pixels on the screen
+        # Then mark corresponding pixels on the screen for redraw
         # Note that offset is relative to 0x4000 video memory start
         if offset < 0x1800:
-            self._update_pixels(offset, value)
+            self._dirty_pixels.add(offset)
         else:
-            self._update_colors(offset - 0x1800, value)
+            self._dirty_blocks.add(offset - 0x1800)
+
+
+    def _draw_dirty(self):
+        ram = self._ram
+        dirty_blocks = self._dirty_blocks
+        for attr_offset in dirty_blocks:
+            self._update_colors(attr_offset, ram[0x1800 + attr_offset])
+
+        # Pixel bytes in the redrawn blocks are already up to date
+        for offset in self._dirty_pixels:
+            if OFFSET_TO_ATTR[offset] - 0x1800 not in dirty_blocks:
+                self._update_pixels(offset, ram[offset])
+
+        self._dirty_pixels.clear()
+        dirty_blocks.clear()
 
 
     def update(self, screen):
@@ -143,4 +182,6 @@ class Display(RAM):
             self._invert ^= True
             self.invert_colors()
 
+        self._draw_dirty()
+        pygame.transform.scale(self._pixels, self._display.get_size(), self._display)
         screen.blit(self._display, (0, 0))
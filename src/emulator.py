@@ -30,21 +30,18 @@ class Emulator:
             self._breakpoints[addr] = []    
         self._breakpoints[addr].append(fn)
 
-    def _handle_breakpoints(self):
-        # Run the breakpoint function if condition is met
-        br_list = self._breakpoints.get(self._cpu._pc, [])
-        for br in br_list:  
-            br()
-
     def step(self):
-        self._handle_breakpoints()
-        self._cpu.step()
+        self._cpu.step(self._breakpoints)
 
     def run(self, num_cycles=0):
-        stop_at = self._cpu._cycles + num_cycles
-        logger.debug(f"Running for {num_cycles} cycles. Current cycles: {self._cpu._cycles} (Time: {self._machine.get_time():.3}), stop at: {stop_at}")
-        while num_cycles == 0 or self._cpu._cycles <= stop_at:
-            self.step()
+        if logger.isEnabledFor(logging.DEBUG):
+            stop_at = self._cpu._cycles + num_cycles
+            logger.debug(f"Running for {num_cycles} cycles. Current cycles: {self._cpu._cycles} (Time: {self._machine.get_time():.3}), stop at: {stop_at}")
+        if num_cycles == 0:
+            while True:
+                self._cpu.run(TICKS_PER_FRAME, self._breakpoints)
+        else:
+            self._cpu.run(num_cycles, self._breakpoints)
 
     def run1frame(self):
         # TODO: scheduling an interrupt each 50ms shall be a Machine's responsibility, not Emulator
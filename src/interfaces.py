@@ -99,6 +99,13 @@ class MemoryDevice:
         else:
             self._endaddr = startaddr + device.get_size() - 1
 
+        # Device functions are looked up once here, rather than on every memory access
+        self._get_buffer = getattr(device, "get_buffer", None)
+        self._read_byte = getattr(device, "read_byte", None)
+        self._read_word = getattr(device, "read_word", None)
+        self._write_byte = getattr(device, "write_byte", None)
+        self._write_word = getattr(device, "write_word", None)
+
 
     def get_addr_range(self):
         return self._startaddr, self._endaddr
@@ -109,32 +116,42 @@ class MemoryDevice:
             raise MemoryError(f"Address 0x{addr:04x} is out of memory range 0x{self._startaddr:04x}-0x{self._endaddr:04x}")
 
 
+    def get_buffer(self):
+        """
+        Return the device data buffer for direct read access, or None if the device does not expose one
+        (e.g. the device computes values on read). Buffer index 0 corresponds to the start address.
+        """
+        if self._get_buffer is None:
+            return None
+        return self._get_buffer()
+
+
     def read_byte(self, addr):
         self.validate_addr(addr)
-        if not hasattr(self._device, "read_byte"):
+        if self._read_byte is None:
             raise MemoryError(f"Reading byte at address 0x{addr:04x} is not supported")
-        return self._device.read_byte(addr - self._startaddr)
+        return self._read_byte(addr - self._startaddr)
 
 
     def read_word(self, addr):
         self.validate_addr(addr)
-        if not hasattr(self._device, "read_word"):
+        if self._read_word is None:
             raise MemoryError(f"Reading word at address 0x{addr:04x} is not supported")
-        return self._device.read_word(addr - self._startaddr)
+        return self._read_word(addr - self._startaddr)
 
 
     def write_byte(self, addr, value):
         self.validate_addr(addr)
-        if not hasattr(self._device, "write_byte"):
+        if self._write_byte is None:
             raise MemoryError(f"Writing byte ataddress 0x{addr:04x} is not supported")
-        self._device.write_byte(addr - self._startaddr, value)
+        self._write_byte(addr - self._startaddr, value)
 
 
     def write_word(self, addr, value):
         self.validate_addr(addr)
-        if not hasattr(self._device, "write_word"):
+        if self._write_word is None:
             raise MemoryError(f"Writing word at address 0x{addr:04x} is not supported")
-        self._device.write_word(addr - self._startaddr, value)
+        self._write_word(addr - self._startaddr, value)
 
 
     def update(self):
@@ -184,39 +184,44 @@ class Keyboard:
         self._key_map['>']              = (0xfb, 0xef, 0x7f, 0xfd)  # Same as Ctrl-T
 
 
-        self._pressed_key = (0xff, 0xff, 0xff, 0xff)
+        # Keyboard rows are read by the emulated CPU far more often than keys are pressed. The value of each
+        # row (indexed by the row mask) is calculated when the pressed key changes, and read_row() just looks it up
+        self._set_pressed_key((0xff, 0xff, 0xff, 0xff))
+
+
+    def _set_pressed_key(self, key):
+        self._pressed_key = key
+
+        self._rows = bytearray(b'\xff' * 0x100)
+
+        # Get the key scan code, if key in the selected row is pressed
+        self._rows[key[0]] = key[1]
+
+        # Apply CAPS and SYMBOL shift key codes
+        self._rows[key[2]] &= key[3]
 
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key in self._ctrl_key_map and (pygame.key.get_mods() & pygame.KMOD_CTRL) != 0:
-                self._pressed_key = self._ctrl_key_map[event.key]
+                self._set_pressed_key(self._ctrl_key_map[event.key])
                 return
 
             if event.key in self._special_key_map:
-                self._pressed_key = self._special_key_map[event.key]
+                self._set_pressed_key(self._special_key_map[event.key])
                 return
 
             if event.unicode in self._key_map:
-                self._pressed_key = self._key_map[event.unicode]
+                self._set_pressed_key(self._key_map[event.unicode])
             
         if event.type == pygame.KEYUP:
-            self._pressed_key = (0xff, 0xff, 0xff, 0xff)
+            self._set_pressed_key((0xff, 0xff, 0xff, 0xff))
 
 
     def emulate_key_press(self, key):
-        self._pressed_key = key
+        self._set_pressed_key(key)
 
 
     def read_row(self, row_mask):
-        # Get the key scan code, if key in the selected row is pressed
-        value = 0xff
-        if self._pressed_key[0] == row_mask:
-            value = self._pressed_key[1]
-        
-        # Apply CAPS and SYMBOL shift key codes
-        if self._pressed_key[2] == row_mask:
-            value &= self._pressed_key[3]
-
-        return value
+        return self._rows[row_mask]
     
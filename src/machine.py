@@ -11,15 +11,47 @@ class MemoryMgr:
     def __init__(self):
         self._memories = []
 
+        # Memory device for each address in the 64k address space, so that the device is found with a
+        # single lookup instead of scanning memory ranges on every access
+        self._memory_map = [None] * 0x10000
+
+        # (start, end) of the contiguous address range around each address, that is mapped to the same device
+        self._memory_ranges = [None] * 0x10000
+
     def add_memory(self, memory):
         startaddr, endaddr = memory.get_addr_range()
         self._memories.append((startaddr, endaddr, memory))
 
+        # In case of overlapping ranges, the memory added first takes precedence
+        for addr in range(startaddr, endaddr + 1):
+            if self._memory_map[addr] is None:
+                self._memory_map[addr] = memory
+
+        self._update_memory_ranges()
+
+    def _update_memory_ranges(self):
+        memory_map = self._memory_map
+        start = 0
+        for addr in range(1, 0x10001):
+            if addr == 0x10000 or memory_map[addr] is not memory_map[start]:
+                addr_range = (start, addr - 1) if memory_map[start] else None
+                for range_addr in range(start, addr):
+                    self._memory_ranges[range_addr] = addr_range
+                start = addr
+
     def get_memory_for_addr(self, addr):
-        for mem in self._memories:
-            if addr >= mem[0] and addr <= mem[1]:
-                return mem[2]
-        return None
+        if addr < 0 or addr > 0xffff:
+            return None
+        return self._memory_map[addr]
+
+    def get_memory_range_for_addr(self, addr):
+        """
+        Return (start, end) of the address range around the given address, where the memory at this address
+        is not shadowed by other memories. None is returned if no memory is mapped at the address.
+        """
+        if addr < 0 or addr > 0xffff:
+            return None
+        return self._memory_ranges[addr]
 
     def update(self):
         for mem in self._memories:
@@ -108,15 +140,42 @@ class Machine:
             return 0xffff
         return mem.read_word(addr)
 
+    def get_memory_buffer(self, addr):
+        """
+        Return (buffer, start address, end address) for the memory at the given address, so that the
+        caller may read the memory directly, bypassing the memory device. None is returned if the memory
+        does not support direct access. Writes must still go through write_memory_byte()/write_memory_word().
+        """
+        mem = self._memories.get_memory_for_addr(addr)
+        if not mem or not hasattr(mem, "get_buffer"):
+            return None
+
+        buffer = mem.get_buffer()
+        if buffer is None:
+            return None
+
+        # Part of the memory may be shadowed by other memories. Limit the buffer to the addresses actually
+        # mapped to this memory, so that the caller does not read bytes the bus would not return
+        mem_start, mem_end = mem.get_addr_range()
+        start, end = self._memories.get_memory_range_for_addr(addr)
+        if (start, end) != (mem_start, mem_end):
+            buffer = memoryview(buffer)[start - mem_start : end - mem_start + 1]
+        return buffer, start, end
+
     def write_memory_byte(self, addr, value):
         mem = self._get_memory(addr)
         if mem:
             mem.write_byte(addr, value)
+            if self._cpu:
+                self._cpu.invalidate_decoded_instructions(addr)
 
     def write_memory_word(self, addr, value):
         mem = self._get_memory(addr)
         if mem:
             mem.write_word(addr, value)
+            if self._cpu:
+                self._cpu.invalidate_decoded_instructions(addr)
+                self._cpu.invalidate_decoded_instructions((addr + 1) & 0xffff)
 
     def read_io(self, addr, extra_addr):
         io = self._get_io(addr)
@@ -5,7 +5,7 @@ import argparse
 from tkinter import filedialog
 
 from emulator import Emulator
-from machine import Machine
+from machine import Machine, FRAME_FREQ
 from interfaces import MemoryDevice, IODevice
 from ram import RAM
 from rom import ROM
@@ -91,7 +91,7 @@ class Configuration:
             self.update(surface)
 
             pygame.display.flip()
-            self._clock.tick(60)
+            self._clock.tick(FRAME_FREQ)    # Each loop iteration emulates exactly one frame
             pygame.display.set_caption(f"ZX Spectrum Emulator (FPS: {self._clock.get_fps():.3}, CPU time: {self._machine.get_time():.3})")
 
 
@@ -15,7 +15,7 @@ class RAM:
 
 
     def set_size(self, size):
-        self._ram = [0] * size
+        self._ram = bytearray(size)
 
 
     def _check_value(self, value, max):
@@ -23,6 +23,10 @@ class RAM:
             raise ValueError(f"Value {value:x} is out of range")
 
 
+    def get_buffer(self):
+        return self._ram
+
+
     def read_byte(self, offset):
         return self._ram[offset]
 
@@ -32,7 +36,7 @@ class RAM:
 
 
     def write_byte(self, offset, value):
-        self._check_value(value, 0xff)
+        # bytearray raises ValueError for values out of 0x00-0xff range, no need to check explicitly
         self._ram[offset] = value
 
 
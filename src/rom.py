@@ -10,13 +10,17 @@ class ROM:
 
     def __init__(self, filename):
         with open(filename, mode='rb') as f:
-            self._rom = [x for x in f.read()]
+            self._rom = f.read()
 
 
     def get_size(self):
         return len(self._rom)
 
 
+    def get_buffer(self):
+        return self._rom
+
+
     def read_byte(self, offset):
         return self._rom[offset]
 
@@ -3,6 +3,7 @@
 
 import pytest
 import sys
+import logging
 from unittest.mock import MagicMock
 
 sys.path.append('../src')
@@ -72,6 +73,115 @@ def test_machine_reset(cpu):
     assert cpu.pc == 0x0000
 
 
+def test_run_cycles(cpu):
+    # Memory is filled with NOPs, 4 cycles each
+    cpu.run(10)
+    assert cpu.pc == 0x0003     # Run stops as soon as more than requested number of cycles executed
+    assert cpu._cycles == 12
+
+
+def test_run_pc_wrap(cpu):
+    # Memory is filled with NOPs, 4 cycles each
+    cpu._pc = 0xfffe
+    cpu.run(10)
+    assert cpu.pc == 0x0001     # PC wraps around the end of the address space
+    assert cpu._cycles == 12
+
+    cpu._machine.write_memory_byte(0x0001, 0x18)    # JR -5 (to 0xfffe)
+    cpu._machine.write_memory_byte(0x0002, 0xfb)
+    cpu.step()
+    assert cpu.pc == 0xfffe
+
+def test_run_breakpoints(cpu):
+    breakpoint = MagicMock()
+    cpu.run(10, {0x0002: [breakpoint]})
+    breakpoint.assert_called_once()
+
+def test_run_compiled_block(cpu):
+    cpu._machine.write_memory_byte(0x0000, 0x06)    # Instruction Opcode (LD B, n)
+    cpu._machine.write_memory_byte(0x0001, 0x64)    # Loop counter (100)
+    cpu._machine.write_memory_byte(0x0002, 0x3c)    # Instruction Opcode (INC A)
+    cpu._machine.write_memory_byte(0x0003, 0x10)    # Instruction Opcode (DJNZ)
+    cpu._machine.write_memory_byte(0x0004, 0xfd)    # Jump offset (-3)
+    cpu._machine.write_memory_byte(0x0005, 0x76)    # Stop here (HALT is not implemented)
+    with pytest.raises(InvalidInstruction):
+        cpu.run(10000)
+    assert 0x0002 in cpu._blocks
+    assert cpu.a == 100
+    assert cpu.b == 0
+    assert cpu.pc == 0x0006
+
+def test_step_keeps_compiled_blocks(cpu):
+    cpu._machine.write_memory_byte(0x0000, 0x3c)    # Instruction Opcode (INC A)
+    cpu._machine.write_memory_byte(0x0001, 0x18)    # Instruction Opcode (JR)
+    cpu._machine.write_memory_byte(0x0002, 0xfd)    # Jump offset (-3)
+    breakpoints = {0x1000: [MagicMock()]}
+    cpu.run(1000, breakpoints)
+    assert 0x0000 in cpu._blocks
+
+    cpu.step(breakpoints)                           # Same breakpoints set does not drop compiled blocks
+    assert 0x0000 in cpu._blocks
+
+def test_fetch_overlapping_memories():
+    machine = Machine()
+    ram1 = MemoryDevice(RAM(), 0x0000, 0x00ff)
+    ram2 = MemoryDevice(RAM(), 0x0000, 0xffff)
+    machine.add_memory(ram1)
+    machine.add_memory(ram2)
+    cpu = CPU(machine)
+    ram1.write_byte(0x0000, 0x3c)                   # INC A
+    ram2.write_byte(0x0000, 0x04)                   # INC B (shadowed by the first memory)
+    ram2.write_byte(0x0100, 0x0c)                   # INC C
+
+    cpu._pc = 0x0100
+    cpu.step()
+    assert cpu.c == 0x01
+
+    cpu._pc = 0x0000
+    cpu.step()
+    assert cpu.a == 0x01                            # Instruction is fetched from the memory the bus selects
+    assert cpu.b == 0x00
+
+def test_modified_code_decoded_again(cpu):
+    cpu._machine.write_memory_byte(0x0000, 0x00)    # NOP
+    cpu.step()
+    cpu._machine.write_memory_byte(0x0000, 0x3e)    # Instruction Opcode (LD A, n)
+    cpu._machine.write_memory_byte(0x0001, 0x42)    # Value
+    cpu._pc = 0x0000
+    cpu.step()
+    assert cpu.a == 0x42
+    assert cpu.pc == 0x0002
+
+def test_run_self_modifying_code(cpu):
+    program = [
+        0x06, 0xc8,         # 8000  LD B, 200
+        0x0c,               # 8002  INC C (toggled with INC D below)
+        0x3a, 0x02, 0x80,   # 8003  LD A, (8002)
+        0xee, 0x18,         # 8006  XOR 18h (INC C <-> INC D)
+        0x32, 0x02, 0x80,   # 8008  LD (8002), A
+        0x10, 0xf5,         # 800b  DJNZ 8002
+        0x76,               # 800d  Stop here (HALT is not implemented)
+    ]
+    for offset, value in enumerate(program):
+        cpu._machine.write_memory_byte(0x8000 + offset, value)
+    cpu._pc = 0x8000
+
+    with pytest.raises(InvalidInstruction):
+        cpu.run(100000)     # Compiled blocks must not keep running the overwritten instruction
+    assert cpu.c == 100
+    assert cpu.d == 100
+    assert cpu.pc == 0x800e
+
+def test_instruction_logging(cpu, caplog):
+    cpu._machine.write_memory_byte(0x0000, 0x00)    # NOP
+    cpu.step()
+    assert "NOP" not in caplog.text                 # Debug logging is off by default
+
+    with caplog.at_level(logging.DEBUG, logger='cpu'):
+        cpu.step()
+    assert "NOP" in caplog.text
+
+
 # Interrupts processing
 
 def test_interrupt_disabled(cpu):
@@ -873,6 +983,26 @@ def test_ldir(cpu):
     assert cpu._cycles == 21 + 21 + 16
     assert cpu.overflow == False    # No more bytes to copy
 
+def test_ldir_batch(cpu):
+    cpu._machine.write_memory_byte(0x0000, 0xed)    # LDIR
+    cpu._machine.write_memory_byte(0x0001, 0xb0)
+    cpu.hl = 0x1000     # Source address
+    cpu.de = 0x1001     # Destination address overlaps the source (memory fill)
+    cpu.bc = 0x0100     # Number of bytes to transfer
+    cpu._machine.write_memory_byte(0x1000, 0x42)    # Fill value
+
+    cpu.run(21 * 10)            # Budget for 10 repetitions, and one more to exceed it
+    assert cpu.pc == 0x0000     # Transfer is not finished yet
+    assert cpu.bc == 0x0100 - 11
+    assert cpu._cycles == 21 * 11
+
+    cpu.run(21 * 0xff + 16 - 1 - cpu._cycles)      # Exactly enough to finish the transfer
+    assert cpu.pc == 0x0002
+    assert cpu.bc == 0x0000
+    assert cpu._cycles == 21 * 0xff + 16
+    for addr in range(0x1000, 0x1101):
+        assert cpu._machine.read_memory_byte(addr) == 0x42
+
 def test_lddr(cpu):
     cpu._machine.write_memory_byte(0x0000, 0xed)    # LDDR
     cpu._machine.write_memory_byte(0x0001, 0xb8)
@@ -3221,6 +3351,27 @@ def test_set_bit_b(cpu):
     assert cpu._cycles == 8
     assert cpu.b == 0x46
 
+def test_set_bit_e(cpu):
+    cpu._machine.write_memory_byte(0x0000, 0xcb)    # SET 1, E (opcode equals the 0xCB prefix)
+    cpu._machine.write_memory_byte(0x0001, 0xcb)
+    cpu._machine.write_memory_byte(0x0002, 0x00)    # NOP
+
+    cpu.e = 0x40
+    cpu.step()
+
+    assert cpu._cycles == 8
+    assert cpu.e == 0x42
+    assert cpu.pc == 0x0002                         # Not decoded as a double prefix with a displacement
+
+def test_ed_cb_invalid(cpu):
+    cpu._machine.write_memory_byte(0x0000, 0xed)    # ED CB is not an indexed bit instruction prefix
+    cpu._machine.write_memory_byte(0x0001, 0xcb)
+    cpu._machine.write_memory_byte(0x0002, 0x05)
+    cpu._machine.write_memory_byte(0x0003, 0xc6)
+
+    with pytest.raises(InvalidInstruction):
+        cpu.step()
+
 def test_set_bit_mem(cpu):
     cpu._machine.write_memory_byte(0x0000, 0xcb)    # BIT 4, (HL)
     cpu._machine.write_memory_byte(0x0001, 0xe6)
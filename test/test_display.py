@@ -0,0 +1,120 @@
+# To run these tests install pytest, then run this command line:
+# py.test -rfeEsxXwa --verbose --showlocals
+
+import pytest
+import os
+import sys
+
+sys.path.append('../src')
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from display import Display, DISPLAY_WIDTH, DISPLAY_HEIGHT, SCALE, _ZX_PALETTE
+
+BLUE = _ZX_PALETTE[1]
+RED = _ZX_PALETTE[2]
+GREEN = _ZX_PALETTE[4]
+YELLOW = _ZX_PALETTE[6]
+BRIGHT_CYAN = _ZX_PALETTE[13]
+
+@pytest.fixture
+def display():
+    return Display()
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((DISPLAY_WIDTH * SCALE, DISPLAY_HEIGHT * SCALE))
+
+def get_pixel(screen, x, y):
+    # Every ZX pixel is drawn as a SCALE x SCALE square
+    colors = {tuple(screen.get_at((x * SCALE + dx, y * SCALE + dy)))[:3] for dx in range(SCALE) for dy in range(SCALE)}
+    assert len(colors) == 1
+    return colors.pop()
+
+def get_line(screen, x, y):
+    return [get_pixel(screen, x + i, y) for i in range(8)]
+
+def attr(ink, paper, bright=False, flash=False):
+    return ink | (paper << 3) | (0x40 if bright else 0) | (0x80 if flash else 0)
+
+def test_pixels_drawn_on_update(display, screen):
+    display.write_byte(0x1800, attr(ink=1, paper=2))
+    display.write_byte(0x0000, 0xf0)
+    assert get_line(screen, 0, 0) == [(0, 0, 0)] * 8           # Nothing is drawn before update
+
+    display.update(screen)
+    assert get_line(screen, 0, 0) == [BLUE] * 4 + [RED] * 4
+    assert get_line(screen, 0, 1) == [RED] * 8                  # Rest of the block is the paper color
+    assert get_line(screen, 8, 0) == [(0, 0, 0)] * 8            # Next block is not affected
+
+def test_pixel_rows_layout(display, screen):
+    for attr_offset in (0x000, 0x020, 0x101):
+        display.write_byte(0x1800 + attr_offset, attr(ink=4, paper=6))
+    display.write_byte(0x0100, 0x81)    # Line 1
+    display.write_byte(0x0020, 0x3c)    # Line 8
+    display.write_byte(0x0801, 0xaa)    # Line 64, second block
+    display.update(screen)
+
+    assert get_line(screen, 0, 1) == [GREEN] + [YELLOW] * 6 + [GREEN]
+    assert get_line(screen, 0, 8) == [YELLOW] * 2 + [GREEN] * 4 + [YELLOW] * 2
+    assert get_line(screen, 8, 64) == [GREEN, YELLOW] * 4
+    assert get_line(screen, 0, 0) == [YELLOW] * 8
+
+def test_repeated_writes(display, screen):
+    display.write_byte(0x1800, attr(ink=1, paper=2))
+    display.write_byte(0x0000, 0xff)
+    display.write_byte(0x0000, 0x0f)    # Only the last value is shown
+    display.update(screen)
+    assert get_line(screen, 0, 0) == [RED] * 4 + [BLUE] * 4
+
+    display.write_byte(0x0000, 0x0f)    # Same value does not need a redraw
+    assert not display._dirty_pixels
+    display.update(screen)
+    assert get_line(screen, 0, 0) == [RED] * 4 + [BLUE] * 4
+
+def test_attribute_change(display, screen):
+    display.write_byte(0x1800, attr(ink=1, paper=2))
+    for line in range(8):
+        display.write_byte(line * 0x100, 0x80 >> line)
+    display.update(screen)
+    assert get_line(screen, 0, 3) == [RED] * 3 + [BLUE] + [RED] * 4
+
+    display.write_byte(0x1800, attr(ink=5, paper=4, bright=True))     # Whole block is redrawn with new colors
+    display.update(screen)
+    for line in range(8):
+        expected = [_ZX_PALETTE[12]] * 8
+        expected[line] = BRIGHT_CYAN
+        assert get_line(screen, 0, line) == expected
+
+def test_pixel_and_attribute_change(display, screen):
+    display.write_byte(0x1800, attr(ink=1, paper=2))
+    display.update(screen)
+
+    display.write_byte(0x0700, 0xcc)    # Both pixels and colors of the block changed within a frame
+    display.write_byte(0x1800, attr(ink=4, paper=6))
+    display.update(screen)
+    assert get_line(screen, 0, 7) == [GREEN] * 2 + [YELLOW] * 2 + [GREEN] * 2 + [YELLOW] * 2
+    assert get_line(screen, 0, 0) == [YELLOW] * 8
+
+def test_flash(display, screen):
+    display.write_byte(0x1800, attr(ink=1, paper=2, flash=True))
+    display.write_byte(0x1801, attr(ink=1, paper=2))
+    display.write_byte(0x0000, 0xf0)
+    display.write_byte(0x0001, 0xf0)
+
+    for _ in range(31):
+        display.update(screen)
+    assert get_line(screen, 0, 0) == [BLUE] * 4 + [RED] * 4
+    assert get_line(screen, 8, 0) == [BLUE] * 4 + [RED] * 4
+
+    display.update(screen)              # Colors of FLASH blocks are swapped each 32 frames
+    assert get_line(screen, 0, 0) == [RED] * 4 + [BLUE] * 4
+    assert get_line(screen, 8, 0) == [BLUE] * 4 + [RED] * 4
+
+    display.write_byte(0x0000, 0xc0)    # Inverted colors are used for pixel writes too
+    display.update(screen)
+    assert get_line(screen, 0, 0) == [RED] * 2 + [BLUE] * 6
+
+    for _ in range(31):
+        display.update(screen)
+    assert get_line(screen, 0, 0) == [BLUE] * 2 + [RED] * 6
@@ -0,0 +1,73 @@
+# To run these tests install pytest, then run this command line:
+# py.test -rfeEsxXwa --verbose --showlocals
+
+import pytest
+import sys
+
+sys.path.append('../src')
+
+import pygame
+from keyboard import Keyboard
+
+def read_row_reference(pressed_key, row_mask):
+    # Row value calculated on each read, as it was done before rows were cached
+    value = 0xff
+    if pressed_key[0] == row_mask:
+        value = pressed_key[1]
+    if pressed_key[2] == row_mask:
+        value &= pressed_key[3]
+    return value
+
+def check_all_rows(keyboard, pressed_key):
+    for row_mask in range(0x100):
+        assert keyboard.read_row(row_mask) == read_row_reference(pressed_key, row_mask), f"row mask 0x{row_mask:02x}"
+
+@pytest.fixture
+def keyboard():
+    return Keyboard()
+
+def test_no_key_pressed(keyboard):
+    check_all_rows(keyboard, (0xff, 0xff, 0xff, 0xff))
+
+def test_single_key(keyboard):
+    keyboard.emulate_key_press((0xfd, 0xfe, 0xff, 0xff))   # A
+    assert keyboard.read_row(0xfd) == 0xfe
+    assert keyboard.read_row(0xfe) == 0xff
+    assert keyboard.read_row(0xfc) == 0xff                  # Multi-row masks match the exact row mask only
+    check_all_rows(keyboard, (0xfd, 0xfe, 0xff, 0xff))
+
+def test_key_with_caps_shift(keyboard):
+    keyboard.emulate_key_press((0xfe, 0xef, 0xfe, 0xfe))   # V + CAPS SHIFT, both in the same row
+    assert keyboard.read_row(0xfe) == 0xee
+    check_all_rows(keyboard, (0xfe, 0xef, 0xfe, 0xfe))
+
+def test_key_with_symbol_shift(keyboard):
+    keyboard.emulate_key_press((0xf7, 0xfe, 0x7f, 0xfd))   # 1 + SYMBOL SHIFT, in different rows
+    assert keyboard.read_row(0xf7) == 0xfe
+    assert keyboard.read_row(0x7f) == 0xfd
+    assert keyboard.read_row(0x77) == 0xff
+    check_all_rows(keyboard, (0xf7, 0xfe, 0x7f, 0xfd))
+
+def test_press_release_sequence(keyboard):
+    keys = [
+        (0xfb, 0xfe, 0xff, 0xff),   # Q
+        (0xbf, 0xfe, 0xff, 0xff),   # ENTER
+        (0xef, 0xfe, 0xfe, 0xfe),   # DELETE
+        (0x7f, 0xfb, 0x7f, 0xfd),   # . (SYMBOL SHIFT in the same row)
+        (0xdf, 0xfd, 0x7f, 0xfd),   # ;
+    ]
+    for key in keys:
+        keyboard.emulate_key_press(key)
+        check_all_rows(keyboard, key)
+
+        keyboard.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.K_a))
+        check_all_rows(keyboard, (0xff, 0xff, 0xff, 0xff))
+
+def test_special_key_event(keyboard):
+    keyboard.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT, unicode=''))
+    check_all_rows(keyboard, (0xf7, 0xef, 0xfe, 0xfe))
+    assert keyboard.read_row(0xfe) == 0xfe                  # CAPS SHIFT
+    assert keyboard.read_row(0xf7) == 0xef                  # 5
+
+    keyboard.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+    check_all_rows(keyboard, (0xff, 0xff, 0xff, 0xff))
@@ -34,6 +34,38 @@ def test_rom_read(machine):
     assert machine.read_memory_byte(0x4042) == 0xb5
     assert machine.read_memory_word(0x4242) == 0xb9b3
 
+def test_memory_buffer(machine):
+    buffer, start, end = machine.get_memory_buffer(0x8765)
+    assert (start, end) == (0x8000, 0x8fff)
+    machine.write_memory_byte(0x8765, 0x42)
+    assert buffer[0x0765] == 0x42               # Buffer reflects memory writes
+
+    buffer, start, end = machine.get_memory_buffer(0x4042)
+    assert (start, end) == (0x4000, 0x7fff)
+    assert buffer[0x0042] == 0xb5
+
+    assert machine.get_memory_buffer(0x1234) is None
+
+def test_overlapping_memories(machine):
+    machine.add_memory(MemoryDevice(RAM(), 0x8800, 0x9fff))
+
+    _, start, _ = machine.get_memory_buffer(0x8900)
+    assert start == 0x8000                      # Memory added first takes precedence in the overlapping range
+
+    buffer, start, end = machine.get_memory_buffer(0x9900)
+    assert (start, end) == (0x9000, 0x9fff)     # Buffer covers only the part that is not shadowed
+    machine.write_memory_byte(0x9000, 0x42)
+    assert buffer[0] == 0x42
+
+def test_memory_addr_out_of_range(machine):
+    machine.add_memory(MemoryDevice(RAM(), 0xf000, 0xffff))
+
+    assert machine.read_memory_byte(-2) == 0xff             # Addresses outside 64k are not mapped to any memory
+    assert machine.read_memory_byte(0x10000) == 0xff
+    machine.write_memory_word(-2, 0x1234)
+    machine.write_memory_byte(0x10000, 0x42)
+    assert machine.read_memory_word(0xfffe) == 0x0000       # Top memory is not affected
+
 def test_memory_addr_validation(machine):
     machine.set_strict_validation(True)
     with pytest.raises(MemoryError) as e: